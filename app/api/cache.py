@@ -2,42 +2,92 @@
 FastAPI 응답 캐싱 모듈
 """
 
-from typing import Optional, Any
-from datetime import datetime, timedelta
-import hashlib
-import json
+from typing import Optional, Any, Hashable, List, NamedTuple, Tuple
+from collections import OrderedDict
+from functools import lru_cache
+import heapq
+import itertools
 import logging
+import time
+
+import orjson
+
+from src.utils.hashing import hash_bytes
 
 logger = logging.getLogger(__name__)
 
+# set() 호출 N회마다 만료 항목을 일괄 정리
+EVICT_INTERVAL = 128
+# 한 번에 확인할 최대 힙 항목 수 (간격보다 크게 잡아 힙이 계속 커지지 않도록 함)
+EVICT_BATCH_LIMIT = 256
+
+
+class _Entry(NamedTuple):
+    """캐시 항목 (dict보다 항목당 메모리 사용량이 작음)"""
+    value: Any
+    expires_at: float  # time.monotonic() 기준 만료 시각
+
+
+@lru_cache(maxsize=4096)
+def _digest_key(key_bytes: bytes) -> int:
+    """
+    직렬화된 캐시 키를 64비트 정수로 해싱 (동일 입력은 LRU 캐시에서 조회)
+    
+    Args:
+        key_bytes: 직렬화된 키 바이트열
+    
+    Returns:
+        64비트 해시 값
+    """
+    return hash_bytes(key_bytes)
+
 
 class InMemoryCache:
-    """인메모리 캐시 클래스"""
+    """인메모리 캐시 클래스 (LRU + TTL)"""
     
-    def __init__(self, default_ttl: int = 600):
+    def __init__(self, default_ttl: int = 600, maxsize: int = 10000):
         """
         캐시 초기화
         
         Args:
             default_ttl: 기본 TTL (초)
+            maxsize: 최대 항목 수 (초과 시 LRU 방식으로 제거)
         """
-        self.cache: dict = {}
+        # key -> _Entry(value, expires_at)
+        self.cache: OrderedDict = OrderedDict()
         self.default_ttl = default_ttl
-        logger.info(f"인메모리 캐시 초기화 완료 (TTL: {default_ttl}초)")
+        self.maxsize = maxsize
+        # (expires_at, 순번, key) 최소 힙 - 만료 순서대로 정리
+        # (만료 시각이 같으면 순번으로 비교하여 타입이 섞인 키끼리 비교하지 않음)
+        self._expiry_heap: List[Tuple[float, int, Hashable]] = []
+        self._counter = itertools.count()
+        self._set_count = 0
+        logger.info(f"인메모리 캐시 초기화 완료 (TTL: {default_ttl}초, 최대 {maxsize}개)")
     
-    def _generate_key(self, prefix: str, **kwargs) -> str:
+    def _generate_key(self, prefix: str, **kwargs) -> Hashable:
         """
         캐시 키 생성
         
+        인자가 모두 해시 가능하면 정렬된 튜플을 그대로 dict 키로 사용하고,
+        리스트/딕셔너리 등 해시 불가능한 값이 있을 때만 64비트 해시로 대체
+        
         Args:
             prefix: 키 접두사
             **kwargs: 키워드 인자
-            
+        
         Returns:
-            캐시 키 문자열
+            캐시 키 (튜플 또는 정수)
         """
-        key_str = f"{prefix}:{json.dumps(kwargs, sort_keys=True)}"
-        return hashlib.md5(key_str.encode()).hexdigest()
+        items = tuple(sorted(kwargs.items()))
+        
+        try:
+            hash(items)
+            return (prefix, items)
+        except TypeError:
+            key_bytes = prefix.encode() + b":" + orjson.dumps(
+                kwargs, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+            )
+            return _digest_key(key_bytes)
     
     def get(self, prefix: str, **kwargs) -> Optional[Any]:
         """
@@ -46,25 +96,25 @@ class InMemoryCache:
         Args:
             prefix: 키 접두사
             **kwargs: 키워드 인자
-            
+        
         Returns:
             캐시된 값 또는 None
         """
         key = self._generate_key(prefix, **kwargs)
         
-        if key not in self.cache:
+        entry = self.cache.get(key)
+        if entry is None:
             return None
         
-        entry = self.cache[key]
-        
         # TTL 확인
-        if datetime.now() > entry["expires_at"]:
+        if time.monotonic() > entry.expires_at:
             del self.cache[key]
             logger.debug(f"캐시 만료: {key}")
             return None
         
+        self.cache.move_to_end(key)
         logger.debug(f"캐시 히트: {key}")
-        return entry["value"]
+        return entry.value
     
     def set(self, prefix: str, value: Any, ttl: Optional[int] = None, **kwargs):
         """
@@ -78,12 +128,21 @@ class InMemoryCache:
         """
         key = self._generate_key(prefix, **kwargs)
         ttl = ttl or self.default_ttl
+        expires_at = time.monotonic() + ttl
         
-        self.cache[key] = {
-            "value": value,
-            "expires_at": datetime.now() + timedelta(seconds=ttl),
-            "created_at": datetime.now(),
-        }
+        self.cache[key] = _Entry(value, expires_at)
+        self.cache.move_to_end(key)
+        heapq.heappush(self._expiry_heap, (expires_at, next(self._counter), key))
+        
+        # 최대 크기 초과 시 가장 오래 사용되지 않은 항목 제거
+        while len(self.cache) > self.maxsize:
+            evicted_key, _ = self.cache.popitem(last=False)
+            logger.debug(f"캐시 LRU 제거: {evicted_key}")
+        
+        # 주기적인 백그라운드 작업 대신 쓰기 시점에 조금씩 만료 항목 정리
+        self._set_count += 1
+        if self._set_count % EVICT_INTERVAL == 0:
+            self.cleanup_expired(limit=EVICT_BATCH_LIMIT)
         
         logger.debug(f"캐시 저장: {key} (TTL: {ttl}초)")
     
@@ -96,28 +155,45 @@ class InMemoryCache:
             **kwargs: 키워드 인자
         """
         key = self._generate_key(prefix, **kwargs)
-        if key in self.cache:
-            del self.cache[key]
+        if self.cache.pop(key, None) is not None:
             logger.debug(f"캐시 삭제: {key}")
     
     def clear(self):
         """캐시 전체 삭제"""
         self.cache.clear()
+        self._expiry_heap.clear()
         logger.info("캐시 전체 삭제 완료")
     
-    def cleanup_expired(self):
-        """만료된 항목 정리"""
-        now = datetime.now()
-        expired_keys = [
-            key for key, entry in self.cache.items()
-            if now > entry["expires_at"]
-        ]
-        
-        for key in expired_keys:
-            del self.cache[key]
+    def cleanup_expired(self, limit: Optional[int] = None):
+        """
+        만료된 항목 정리 (힙 앞부분만 확인)
+        
+        Args:
+            limit: 한 번에 확인할 최대 힙 항목 수 (None이면 만료된 항목 전체)
+        """
+        now = time.monotonic()
+        heap = self._expiry_heap
+        removed = 0
+        checked = 0
         
-        if expired_keys:
-            logger.info(f"만료된 캐시 항목 {len(expired_keys)}개 정리 완료")
+        while heap and heap[0][0] <= now and (limit is None or checked < limit):
+            expires_at, _, key = heapq.heappop(heap)
+            checked += 1
+            entry = self.cache.get(key)
+            # 덮어쓰기/삭제/LRU 제거된 키의 오래된 힙 항목은 무시
+            if entry is not None and entry.expires_at == expires_at:
+                del self.cache[key]
+                removed += 1
+        
+        # 같은 키를 반복해서 덮어쓰면 오래된 힙 항목이 쌓이므로 살아있는 항목만으로 재구성
+        if len(heap) > 2 * max(len(self.cache), EVICT_INTERVAL):
+            self._expiry_heap = [
+                (entry.expires_at, next(self._counter), key) for key, entry in self.cache.items()
+            ]
+            heapq.heapify(self._expiry_heap)
+        
+        if removed:
+            logger.debug(f"만료된 캐시 항목 {removed}개 정리 완료")
 
 
 # 전역 캐시 인스턴스
@@ -130,7 +206,7 @@ def cache_response(ttl: int = 600):
     
     Args:
         ttl: TTL (초)
-        
+    
     Returns:
         데코레이터 함수
     """
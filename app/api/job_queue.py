@@ -4,7 +4,7 @@ NLP heavy 작업을 비동기로 처리
 """
 
 import uuid
-import asyncio
+import time
 from typing import Dict, Optional
 from datetime import datetime
 from enum import Enum
@@ -12,6 +12,9 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# create_job() 호출 N회마다 오래된 작업 정리
+CLEANUP_INTERVAL = 64
+
 
 class JobStatus(str, Enum):
     """작업 상태"""
@@ -24,9 +27,17 @@ class JobStatus(str, Enum):
 class JobQueue:
     """작업 큐 클래스"""
     
-    def __init__(self):
-        """작업 큐 초기화"""
+    def __init__(self, max_age_hours: int = 24):
+        """
+        작업 큐 초기화
+        
+        Args:
+            max_age_hours: 작업 최대 보관 시간 (시간)
+        """
+        # dict 삽입 순서 = 생성 순서 (오래된 작업이 앞쪽)
         self.jobs: Dict[str, Dict] = {}
+        self.max_age_hours = max_age_hours
+        self._create_count = 0
         logger.info("작업 큐 초기화 완료")
     
     def create_job(self, job_type: str, params: Dict) -> str:
@@ -36,7 +47,7 @@ class JobQueue:
         Args:
             job_type: 작업 타입
             params: 작업 파라미터
-            
+        
         Returns:
             작업 ID
         """
@@ -47,11 +58,17 @@ class JobQueue:
             "job_type": job_type,
             "params": params,
             "status": JobStatus.PENDING,
-            "created_at": datetime.now().isoformat(),
+            "created_at": datetime.now().isoformat(),  # 응답 표시용
+            "created_at_ts": time.monotonic(),  # 만료 계산용
             "result": None,
             "error": None,
         }
         
+        # 주기적인 백그라운드 작업 대신 생성 시점에 오래된 작업 정리
+        self._create_count += 1
+        if self._create_count % CLEANUP_INTERVAL == 0:
+            self.cleanup_old_jobs(max_age_hours=self.max_age_hours)
+        
         logger.info(f"작업 생성: {job_id} ({job_type})")
         return job_id
     
@@ -61,7 +78,7 @@ class JobQueue:
         
         Args:
             job_id: 작업 ID
-            
+        
         Returns:
             작업 정보 딕셔너리 또는 None
         """
@@ -98,20 +115,25 @@ class JobQueue:
         
         logger.info(f"작업 상태 업데이트: {job_id} -> {status}")
     
-    def cleanup_old_jobs(self, max_age_hours: int = 24):
+    def cleanup_old_jobs(self, max_age_hours: Optional[int] = None):
         """
         오래된 작업 정리
         
+        작업은 생성 순서대로 저장되므로 앞쪽부터 확인하다가
+        보관 기간 내의 작업을 만나면 중단
+        
         Args:
-            max_age_hours: 최대 보관 시간 (시간)
+            max_age_hours: 최대 보관 시간 (시간), None이면 큐 기본값 사용
         """
-        from datetime import timedelta
-        cutoff_time = datetime.now() - timedelta(hours=max_age_hours)
+        if max_age_hours is None:
+            max_age_hours = self.max_age_hours
+        cutoff_ts = time.monotonic() - max_age_hours * 3600
         
-        jobs_to_remove = [
-            job_id for job_id, job in self.jobs.items()
-            if datetime.fromisoformat(job.get("created_at", "2000-01-01")) < cutoff_time
-        ]
+        jobs_to_remove = []
+        for job_id, job in self.jobs.items():
+            if job["created_at_ts"] >= cutoff_ts:
+                break
+            jobs_to_remove.append(job_id)
         
         for job_id in jobs_to_remove:
             del self.jobs[job_id]
@@ -10,17 +10,21 @@ from pathlib import Path
 project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
 
-from fastapi import FastAPI, HTTPException, Query, Body, BackgroundTasks
+from fastapi import FastAPI, HTTPException, Query, Body, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse, Response
 from pydantic import BaseModel, Field
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, Callable, Any, Awaitable, Hashable, NamedTuple
 from datetime import datetime
+import asyncio
 import logging
-import time
+
+import orjson
 
 from src.utils.config import load_config
 from src.utils.logger import setup_logger
-from src.services.trend_service import TrendService
+from src.utils.hashing import hash_bytes
+from src.services.trend_service import TrendService, get_trend_service
 from src.services.monitoring import metrics_collector, monitor_api_response
 from app.api.cache import cache
 from app.api.job_queue import job_queue, JobStatus
@@ -33,6 +37,7 @@ app = FastAPI(
     title="News Trend Spike Monitor API",
     description="뉴스 기반 실시간 트렌드 스파이크 모니터링 API",
     version="0.1.0",
+    default_response_class=ORJSONResponse,
 )
 
 # CORS 설정
@@ -47,8 +52,18 @@ app.add_middleware(
 # 전역 서비스 인스턴스
 trend_service: Optional[TrendService] = None
 
-# Throttling을 위한 마지막 호출 시간 저장
-_last_latest_call: float = 0.0
+# 동시에 실행할 수 있는 최대 NLP 분석 작업 수
+MAX_CONCURRENT_ANALYSES = 4
+_analysis_semaphore = asyncio.Semaphore(MAX_CONCURRENT_ANALYSES)
+
+# 진행 중인 요청 (같은 키의 동시 요청은 하나의 작업 결과를 함께 기다림)
+_inflight_requests: Dict[Hashable, asyncio.Task] = {}
+
+
+class CachedBody(NamedTuple):
+    """캐시에 저장되는 직렬화된 응답"""
+    body: bytes
+    etag: str
 
 
 # Pydantic 모델 정의
@@ -120,11 +135,7 @@ async def startup_event():
         config = load_config("configs/config_api.yaml")
         
         # 서비스 초기화
-        trend_service = TrendService(config_path="configs/config_api.yaml")
-        
-        # 캐시 정리 작업 시작
-        import asyncio
-        asyncio.create_task(periodic_cache_cleanup())
+        trend_service = get_trend_service("configs/config_api.yaml")
         
         # 모델 warm-up 수행
         try:
@@ -133,58 +144,160 @@ async def startup_event():
         except Exception as e:
             logger.warning(f"모델 warm-up 실패: {e}")
         
-        # 주기적 작업 큐 정리
-        asyncio.create_task(periodic_job_cleanup())
-        
         logger.info("FastAPI 서버 시작 완료")
     
     except Exception as e:
         logger.error(f"서버 초기화 오류: {e}")
         # 기본 설정으로 폴백
-        trend_service = TrendService()
+        trend_service = get_trend_service()
 
 
-async def periodic_cache_cleanup():
-    """주기적 캐시 정리 작업"""
-    import asyncio
-    while True:
-        try:
-            await asyncio.sleep(300)  # 5분마다
-            cache.cleanup_expired()
-        except Exception as e:
-            logger.error(f"캐시 정리 오류: {e}")
-            await asyncio.sleep(60)  # 오류 시 1분 대기
+async def run_analysis_in_thread(func: Callable[..., Any], **kwargs) -> Any:
+    """
+    블로킹 분석 함수를 스레드 풀에서 실행 (이벤트 루프 블로킹 방지)
+    
+    세마포어로 동시 실행 수를 MAX_CONCURRENT_ANALYSES개로 제한
+    
+    Args:
+        func: 실행할 동기 함수
+        **kwargs: 함수 인자
+    
+    Returns:
+        함수 실행 결과
+    """
+    async with _analysis_semaphore:
+        return await asyncio.to_thread(func, **kwargs)
 
 
-async def periodic_job_cleanup():
-    """주기적 작업 큐 정리"""
-    import asyncio
-    while True:
-        try:
-            await asyncio.sleep(3600)  # 1시간마다
-            job_queue.cleanup_old_jobs(max_age_hours=24)
-        except Exception as e:
-            logger.error(f"작업 큐 정리 오류: {e}")
-            await asyncio.sleep(300)
+async def coalesce_request(key: Hashable, factory: Callable[[], Awaitable[Any]]) -> Any:
+    """
+    같은 키로 진행 중인 작업이 있으면 새로 실행하지 않고 그 결과를 공유
+    
+    동시 요청이 몰려도 백엔드 호출은 한 번만 수행됨 (cache stampede 방지)
+    
+    Args:
+        key: 요청 식별 키
+        factory: 작업 코루틴을 생성하는 함수
+    
+    Returns:
+        작업 결과
+    """
+    task = _inflight_requests.get(key)
+    
+    if task is None:
+        task = asyncio.ensure_future(factory())
+        _inflight_requests[key] = task
+        task.add_done_callback(lambda _: _inflight_requests.pop(key, None))
+    
+    # 한 클라이언트의 연결이 끊겨도 공유 작업은 취소되지 않도록 보호
+    return await asyncio.shield(task)
+
+
+def serialize_analysis(result: Dict) -> bytes:
+    """
+    분석 결과를 응답 스키마로 한 번만 검증한 뒤 JSON 바이트로 직렬화
+    
+    캐시에는 직렬화된 바이트를 저장하여 캐시 히트 시 재검증/재직렬화를 생략
+    
+    Args:
+        result: 분석 결과 딕셔너리
+    
+    Returns:
+        JSON 바이트열
+    """
+    return AnalyzeResponse(**result).model_dump_json().encode()
+
+
+def make_cached_body(body: bytes) -> CachedBody:
+    """
+    직렬화된 응답 본문과 ETag를 함께 생성
+    
+    Args:
+        body: JSON 바이트열
+    
+    Returns:
+        CachedBody 인스턴스
+    """
+    return CachedBody(body=body, etag=f'"{hash_bytes(body):016x}"')
+
+
+def json_response(cached: CachedBody, http_request: Request) -> Response:
+    """
+    직렬화된 JSON 바이트를 그대로 응답으로 반환
+    
+    클라이언트의 If-None-Match가 ETag와 일치하면 본문 없이 304 반환
+    
+    Args:
+        cached: 직렬화된 응답 본문과 ETag
+        http_request: HTTP 요청 (조건부 요청 헤더 확인용)
+    
+    Returns:
+        JSON 응답 또는 304 응답
+    """
+    headers = {"ETag": cached.etag}
+    
+    if_none_match = http_request.headers.get("if-none-match")
+    if if_none_match:
+        client_etags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        if cached.etag in client_etags or "*" in client_etags:
+            return Response(status_code=304, headers=headers)
+    
+    return Response(content=cached.body, media_type="application/json", headers=headers)
+
+
+async def compute_analysis(keyword: str, max_results: int, time_window_hours: int) -> CachedBody:
+    """
+    스레드 풀에서 트렌드 분석 후 직렬화하여 캐시에 저장
+    
+    Args:
+        keyword: 분석할 키워드
+        max_results: 최대 수집 뉴스 개수
+        time_window_hours: 시간 윈도우
+    
+    Returns:
+        직렬화된 응답 본문과 ETag
+    """
+    result = await run_analysis_in_thread(
+        trend_service.analyze_trend,
+        keyword=keyword,
+        max_results=max_results,
+        time_window_hours=time_window_hours,
+    )
+    
+    # 결과 캐싱 (직렬화된 바이트)
+    cached = make_cached_body(serialize_analysis(result))
+    cache.set(
+        "analyze",
+        cached,
+        ttl=600,
+        keyword=keyword,
+        max_results=max_results,
+        time_window_hours=time_window_hours,
+    )
+    return cached
 
 
 def analyze_trend_background(
     keyword: str,
     max_results: int,
     time_window_hours: int,
-):
-    """백그라운드에서 트렌드 분석 수행"""
-    try:
-        result = trend_service.analyze_trend(
-            keyword=keyword,
-            max_results=max_results,
-            time_window_hours=time_window_hours,
-        )
-        # 결과를 캐시에 저장
-        cache.set("analyze", result, ttl=600, keyword=keyword, max_results=max_results, time_window_hours=time_window_hours)
-        logger.info(f"백그라운드 분석 완료: {keyword}")
-    except Exception as e:
-        logger.error(f"백그라운드 분석 오류: {e}")
+) -> Dict:
+    """
+    백그라운드 작업(/analyze/async)에서 트렌드 분석 수행 (워커 스레드에서 실행)
+    
+    캐시는 이벤트 루프와 공유하며 잠금이 없으므로 여기서 저장하지 않고
+    호출 측(process_analyze_job)이 이벤트 루프에서 저장
+    
+    Returns:
+        분석 결과 딕셔너리
+    """
+    result = trend_service.analyze_trend(
+        keyword=keyword,
+        max_results=max_results,
+        time_window_hours=time_window_hours,
+    )
+    logger.info(f"백그라운드 분석 완료: {keyword}")
+    return result
 
 
 @app.get("/", tags=["Root"])
@@ -230,16 +343,15 @@ async def get_metrics():
 @app.post("/analyze", response_model=AnalyzeResponse, tags=["Analysis"])
 @monitor_api_response("/analyze")
 async def analyze_trend(
+    http_request: Request,
     request: AnalyzeRequest = Body(...),
-    background_tasks: BackgroundTasks = None,
 ):
     """
     키워드 트렌드 분석 (캐싱 적용)
     
     Args:
         request: 분석 요청 (키워드, 최대 결과 수, 시간 윈도우)
-        background_tasks: 백그라운드 작업
-        
+    
     Returns:
         분석 결과
     """
@@ -256,36 +368,15 @@ async def analyze_trend(
     
     if cached_result is not None:
         logger.info(f"캐시 히트: {request.keyword}")
-        return AnalyzeResponse(**cached_result)
+        return json_response(cached_result, http_request)
     
     try:
-        # 백그라운드에서 분석 수행 (비동기)
-        if background_tasks:
-            background_tasks.add_task(
-                analyze_trend_background,
-                request.keyword,
-                request.max_results,
-                request.time_window_hours,
-            )
-        
-        # 동기 분석 수행
-        result = trend_service.analyze_trend(
-            keyword=request.keyword,
-            max_results=request.max_results,
-            time_window_hours=request.time_window_hours,
-        )
-        
-        # 결과 캐싱
-        cache.set(
-            "analyze",
-            result,
-            ttl=600,
-            keyword=request.keyword,
-            max_results=request.max_results,
-            time_window_hours=request.time_window_hours,
+        # 동시에 들어온 같은 분석 요청은 하나로 병합
+        cached = await coalesce_request(
+            ("analyze", request.keyword, request.max_results, request.time_window_hours),
+            lambda: compute_analysis(request.keyword, request.max_results, request.time_window_hours),
         )
-        
-        return AnalyzeResponse(**result)
+        return json_response(cached, http_request)
     
     except Exception as e:
         logger.error(f"분석 오류: {e}")
@@ -295,10 +386,10 @@ async def analyze_trend(
 @app.get("/analyze", response_model=AnalyzeResponse, tags=["Analysis"])
 @monitor_api_response("/analyze")
 async def analyze_trend_get(
+    http_request: Request,
     keyword: str = Query(..., description="분석할 키워드", min_length=1, max_length=100),
     max_results: int = Query(100, ge=1, le=1000, description="최대 수집 뉴스 개수"),
     time_window_hours: int = Query(24, ge=1, le=168, description="시간 윈도우 (시간)"),
-    background_tasks: BackgroundTasks = None,
 ):
     """
     키워드 트렌드 분석 (GET 방식, 캐싱 적용)
@@ -307,8 +398,7 @@ async def analyze_trend_get(
         keyword: 분석할 키워드
         max_results: 최대 수집 뉴스 개수
         time_window_hours: 시간 윈도우
-        background_tasks: 백그라운드 작업
-        
+    
     Returns:
         분석 결과
     """
@@ -325,82 +415,73 @@ async def analyze_trend_get(
     
     if cached_result is not None:
         logger.info(f"캐시 히트: {keyword}")
-        return AnalyzeResponse(**cached_result)
+        return json_response(cached_result, http_request)
     
     try:
-        # 백그라운드에서 분석 수행
-        if background_tasks:
-            background_tasks.add_task(
-                analyze_trend_background,
-                keyword,
-                max_results,
-                time_window_hours,
-            )
-        
-        result = trend_service.analyze_trend(
-            keyword=keyword,
-            max_results=max_results,
-            time_window_hours=time_window_hours,
-        )
-        
-        # 결과 캐싱
-        cache.set(
-            "analyze",
-            result,
-            ttl=600,
-            keyword=keyword,
-            max_results=max_results,
-            time_window_hours=time_window_hours,
+        # 동시에 들어온 같은 분석 요청은 하나로 병합
+        cached = await coalesce_request(
+            ("analyze", keyword, max_results, time_window_hours),
+            lambda: compute_analysis(keyword, max_results, time_window_hours),
         )
-        
-        return AnalyzeResponse(**result)
+        return json_response(cached, http_request)
     
     except Exception as e:
         logger.error(f"분석 오류: {e}")
         raise HTTPException(status_code=500, detail=f"분석 중 오류 발생: {str(e)}")
 
 
+async def fetch_latest(hours: int) -> CachedBody:
+    """
+    최근 데이터 조회 후 직렬화하여 캐시에 저장
+    
+    Args:
+        hours: 조회할 시간 범위
+    
+    Returns:
+        직렬화된 응답 본문과 ETag
+    """
+    items = await asyncio.to_thread(trend_service.get_latest_data, hours=hours)
+    
+    # LatestResponse 모델을 거치지 않고 한 번만 직렬화
+    payload = {
+        "keyword": None,
+        "items": items,
+        "count": len(items),
+        "hours": hours,
+    }
+    cached = make_cached_body(orjson.dumps(payload, option=orjson.OPT_SERIALIZE_NUMPY))
+    
+    # 결과 캐싱 (1초 TTL, 직렬화된 바이트)
+    cache.set("latest", cached, ttl=1, hours=hours)
+    return cached
+
+
 @app.get("/latest", response_model=LatestResponse, tags=["Data"])
 async def get_latest(
+    http_request: Request,
     hours: int = Query(1, ge=1, le=24, description="조회할 시간 범위"),
 ):
     """
-    최근 N시간 데이터 조회 (Throttling 적용: 1초 간격)
+    최근 N시간 데이터 조회 (1초 캐싱, 동시 요청 병합)
     
     Args:
         hours: 조회할 시간 범위 (기본값: 1시간)
-        
+    
     Returns:
         최근 뉴스 데이터
     """
-    global _last_latest_call
-    
     if trend_service is None:
         raise HTTPException(status_code=503, detail="서비스가 초기화되지 않았습니다")
     
-    # Throttling: 1초 간격으로만 갱신
-    current_time = time.time()
-    if current_time - _last_latest_call < 1.0:
-        # 캐시된 결과 반환
-        cached_result = cache.get("latest", hours=hours)
-        if cached_result:
-            return LatestResponse(**cached_result)
-    
-    _last_latest_call = current_time
+    # 캐시 확인
+    cached_result = cache.get("latest", hours=hours)
+    if cached_result is not None:
+        return json_response(cached_result, http_request)
     
     try:
-        items = trend_service.get_latest_data(hours=hours)
-        
-        result = LatestResponse(
-            items=items,
-            count=len(items),
-            hours=hours,
-        )
-        
-        # 결과 캐싱 (1초 TTL)
-        cache.set("latest", result.dict(), ttl=1, hours=hours)
-        
-        return result
+        # 동시에 들어온 같은 조회는 하나로 병합
+        cached = await coalesce_request(("latest", hours), lambda: fetch_latest(hours))
+        return json_response(cached, http_request)
     
     except Exception as e:
         logger.error(f"최근 데이터 조회 오류: {e}")
@@ -416,7 +497,7 @@ async def get_spikes(
     
     Args:
         limit: 최대 개수 (기본값: 10)
-        
+    
     Returns:
         스파이크 목록
     """
@@ -445,7 +526,7 @@ async def analyze_trend_async(request: AnalyzeRequest = Body(...)):
     
     Args:
         request: 분석 요청
-        
+    
     Returns:
         작업 ID 및 상태
     """
@@ -463,7 +544,6 @@ async def analyze_trend_async(request: AnalyzeRequest = Body(...)):
     )
     
     # 백그라운드 작업 실행
-    import asyncio
     asyncio.create_task(process_analyze_job(job_id, request))
     
     return JobResponse(
@@ -478,7 +558,18 @@ async def process_analyze_job(job_id: str, request: AnalyzeRequest):
     job_queue.update_job_status(job_id, JobStatus.PROCESSING)
     
     try:
-        result = trend_service.analyze_trend(
+        result = await run_analysis_in_thread(
+            analyze_trend_background,
+            keyword=request.keyword,
+            max_results=request.max_results,
+            time_window_hours=request.time_window_hours,
+        )
+        
+        # /analyze와 같은 캐시 키로 저장하여 이후 동기 요청이 재사용하도록 함 (이벤트 루프에서 저장)
+        cache.set(
+            "analyze",
+            make_cached_body(serialize_analysis(result)),
+            ttl=600,
             keyword=request.keyword,
             max_results=request.max_results,
             time_window_hours=request.time_window_hours,
@@ -500,7 +591,7 @@ async def get_job_result(job_id: str):
     
     Args:
         job_id: 작업 ID
-        
+    
     Returns:
         작업 결과
     """
@@ -522,7 +613,7 @@ async def analyze_sentiment(
     
     Args:
         text: 분석할 텍스트
-        
+    
     Returns:
         감정 분석 결과
     """
@@ -545,5 +636,4 @@ async def analyze_sentiment(
 
 if __name__ == "__main__":
     import uvicorn
-    import asyncio
     uvicorn.run(app, host="0.0.0.0", port=8000)
@@ -0,0 +1,41 @@
+"""
+차트용 이동 통계 커널
+누적합 한 번으로 윈도우 평균을 계산하는 NumPy 벡터화 구현
+"""
+
+import numpy as np
+
+
+def _align(window_values: np.ndarray, n: int, window: int, center: bool) -> np.ndarray:
+    """
+    윈도우 결과를 원본 길이에 맞춰 배치 (윈도우가 채워지지 않는 위치는 NaN)
+    
+    Args:
+        window_values: 윈도우별 결과 배열
+        n: 원본 길이
+        window: 윈도우 크기
+        center: 중앙 정렬 여부 (False이면 윈도우 마지막 위치에 배치)
+    
+    Returns:
+        길이 n의 배열
+    """
+    result = np.full(n, np.nan, dtype=np.float64)
+    offset = window // 2 if center else window - 1
+    result[offset:offset + len(window_values)] = window_values
+    return result
+
+
+def rolling_mean(values: np.ndarray, window: int, center: bool = False) -> np.ndarray:
+    """
+    누적합 기반 이동 평균 (pandas rolling(window, center=center).mean()과 동일)
+    
+    Args:
+        values: 값 배열
+        window: 윈도우 크기 (1 이상, len(values) 이하)
+        center: 중앙 정렬 여부
+    
+    Returns:
+        이동 평균 배열 (윈도우가 채워지지 않는 위치는 NaN)
+    """
+    cumsum = np.concatenate(([0.0], np.cumsum(values, dtype=np.float64)))
+    return _align((cumsum[window:] - cumsum[:-window]) / window, len(values), window, center)
@@ -0,0 +1,22 @@
+"""
+Streamlit 캐시 키 유틸리티
+"""
+
+from typing import Any
+
+import orjson
+
+
+def to_cache_key(obj: Any) -> str:
+    """
+    분석 결과 일부를 st.cache_data 키로 쓸 수 있는 JSON 문자열로 변환
+    
+    dict/list는 그대로 해싱하면 느리므로 C 레벨 직렬화 결과(문자열)를 키로 사용
+    
+    Args:
+        obj: 직렬화할 객체
+    
+    Returns:
+        JSON 문자열
+    """
+    return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY, default=str).decode()
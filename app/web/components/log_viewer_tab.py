@@ -4,10 +4,70 @@ Log Viewer 탭 컴포넌트
 
 import streamlit as st
 from pathlib import Path
+from typing import List, Optional
+import os
 import logging
 
 logger = logging.getLogger(__name__)
 
+# 뒤에서부터 읽을 블록 크기
+TAIL_CHUNK_SIZE = 65536
+
+
+def read_log_tail(
+    log_path: Path,
+    max_lines: int = 100,
+    log_level: Optional[str] = None,
+    chunk_size: int = TAIL_CHUNK_SIZE,
+) -> List[str]:
+    """
+    로그 파일 끝에서부터 블록 단위로 거슬러 읽어 최근 로그 반환
+    
+    파일 전체를 메모리에 올리지 않고, 필요한 줄 수가 모일 때까지만
+    앞쪽 블록을 추가로 읽습니다.
+    
+    Args:
+        log_path: 로그 파일 경로
+        max_lines: 반환할 최대 줄 수
+        log_level: 필터링할 로그 레벨 (None이면 전체)
+        chunk_size: 한 번에 읽을 바이트 수
+    
+    Returns:
+        시간 순서대로 정렬된 로그 라인 리스트
+    """
+    # 레벨 필터는 고정 문자열이므로 정규식 대신 bytes 부분 문자열 검색 사용
+    level_marker = f" - {log_level} - ".encode("utf-8") if log_level else None
+    
+    collected = []  # 최신 줄부터 역순으로 수집
+    
+    with open(log_path, "rb") as f:
+        pos = f.seek(0, os.SEEK_END)
+        remainder = b""
+        is_last_block = True
+        
+        while pos > 0 and len(collected) < max_lines:
+            read_size = min(chunk_size, pos)
+            pos -= read_size
+            f.seek(pos)
+            block = f.read(read_size) + remainder
+            
+            # 파일 끝의 개행은 빈 줄로 취급하지 않음
+            if is_last_block and block.endswith(b"\n"):
+                block = block[:-1]
+            is_last_block = False
+            
+            lines = block.split(b"\n")
+            # 블록 첫 줄은 앞 블록과 이어질 수 있으므로 다음 반복으로 넘김
+            remainder = lines.pop(0) if pos > 0 else b""
+            
+            for raw in reversed(lines):
+                if level_marker is None or level_marker in raw:
+                    collected.append(raw)
+                    if len(collected) >= max_lines:
+                        break
+    
+    return [raw.decode("utf-8", errors="replace") for raw in reversed(collected)]
+
 
 def display_log_viewer():
     """
@@ -37,19 +97,16 @@ def display_log_viewer():
     
     if log_path.exists():
         try:
-            with open(log_path, "r", encoding="utf-8") as f:
-                logs = f.readlines()
-            
-            # 필터링
-            if log_level != "ALL":
-                logs = [log for log in logs if f" - {log_level} - " in log]
-            
-            # 최근 로그만 표시
-            logs = logs[-100:] if len(logs) > 100 else logs
+            # 최근 로그만 파일 끝에서부터 읽기
+            logs = read_log_tail(
+                log_path,
+                max_lines=100,
+                log_level=None if log_level == "ALL" else log_level,
+            )
             
             st.text_area(
                 "로그 내용",
-                value="".join(logs),
+                value="\n".join(logs),
                 height=500,
                 help="최근 100개 로그만 표시됩니다",
             )
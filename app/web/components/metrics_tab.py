@@ -3,12 +3,53 @@ Metrics 탭 컴포넌트
 """
 
 import streamlit as st
-import requests
-from typing import Optional
+import httpx
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Tuple, Dict
 import logging
 
 logger = logging.getLogger(__name__)
 
+# 재실행 간 커넥션 풀 재사용 (HTTP keep-alive)
+_http = httpx.Client(timeout=5.0)
+# /metrics와 /health 동시 조회용
+_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="metrics-fetch")
+
+
+def _get_health(api_url: str) -> Optional[Dict]:
+    """
+    /health 응답 조회
+    
+    Args:
+        api_url: API 서버 URL
+    
+    Returns:
+        헬스 체크 결과 (조회 실패 시 None)
+    """
+    try:
+        response = _http.get(f"{api_url}/health", timeout=3.0)
+        if response.status_code == 200:
+            return response.json()
+    except Exception:
+        pass
+    return None
+
+
+@st.cache_data(ttl=5, show_spinner=False)
+def _fetch_metrics(api_url: str) -> Tuple[int, str, Optional[Dict]]:
+    """
+    /metrics와 /health를 병렬로 조회 (5초 캐싱)
+    
+    Args:
+        api_url: API 서버 URL
+    
+    Returns:
+        (/metrics 상태 코드, /metrics 응답 본문, 헬스 체크 결과) 튜플
+    """
+    health_future = _executor.submit(_get_health, api_url)
+    response = _http.get(f"{api_url}/metrics")
+    return response.status_code, response.text, health_future.result()
+
 
 def display_metrics(api_url: str = "http://localhost:8000"):
     """
@@ -18,32 +59,22 @@ def display_metrics(api_url: str = "http://localhost:8000"):
         api_url: API 서버 URL
     """
     st.subheader("📈 서비스 메트릭")
+    health = None
     
     try:
         # API에서 메트릭 가져오기
-        metrics_url = f"{api_url}/metrics"
-        
         with st.spinner("메트릭을 불러오는 중..."):
-            response = requests.get(metrics_url, timeout=5)
+            status_code, metrics_text, health = _fetch_metrics(api_url)
         
-        if response.status_code == 200:
+        if status_code == 200:
             st.success("✅ 메트릭 조회 성공")
-            st.code(response.text, language="prometheus")
-            
-            # 메트릭 요약 정보도 표시
-            try:
-                summary_url = f"{api_url}/health"
-                summary_response = requests.get(summary_url, timeout=3)
-                if summary_response.status_code == 200:
-                    st.json(summary_response.json())
-            except Exception:
-                pass
+            st.code(metrics_text, language="prometheus")
         
         else:
-            st.warning(f"메트릭을 가져올 수 없습니다. (HTTP {response.status_code})")
+            st.warning(f"메트릭을 가져올 수 없습니다. (HTTP {status_code})")
             st.info("API 서버가 정상적으로 실행 중인지 확인하세요.")
     
-    except requests.exceptions.ConnectionError:
+    except httpx.ConnectError:
         st.error("❌ API 서버에 연결할 수 없습니다.")
         st.info(f"""
         **해결 방법:**
@@ -59,7 +90,7 @@ def display_metrics(api_url: str = "http://localhost:8000"):
         3. API 서버 URL이 올바른지 확인하세요 (현재: `{api_url}`)
         """)
     
-    except requests.exceptions.Timeout:
+    except httpx.TimeoutException:
         st.error("⏱️ API 서버 응답 시간 초과")
         st.info("API 서버가 실행 중이지만 응답이 느립니다. 잠시 후 다시 시도하세요.")
     
@@ -70,10 +101,9 @@ def display_metrics(api_url: str = "http://localhost:8000"):
     
     # 메트릭 요약 정보 (API 서버가 실행 중일 때만 표시)
     try:
-        health_url = f"{api_url}/health"
-        health_response = requests.get(health_url, timeout=3)
-        
-        if health_response.status_code == 200:
+        if health is not None:
+            st.json(health)
+            
             st.subheader("메트릭 요약")
             
             col1, col2, col3, col4 = st.columns(4)
@@ -4,37 +4,89 @@
 
 import streamlit as st
 import pandas as pd
-from typing import Dict
+import numpy as np
+from functools import lru_cache
+from typing import Dict, Optional, Pattern
 import re
 import logging
 
+import orjson
+
 from app.web.components.theme import get_sentiment_color
 
 logger = logging.getLogger(__name__)
 
 
-def highlight_keyword(text: str, keyword: str) -> str:
+# 키워드 하이라이팅 치환 문자열 (콜백 없이 C 레벨에서 치환)
+HIGHLIGHT_REPLACEMENT = r'<mark style="background-color: yellow; font-weight: bold;">\g<0></mark>'
+
+
+@lru_cache(maxsize=128)
+def compile_keyword_pattern(keyword: str) -> Optional[Pattern]:
+    """
+    키워드 하이라이팅용 정규식 컴파일 (대소문자 구분 없음, 재실행마다 다시 컴파일하지 않도록 캐시)
+    
+    Args:
+        keyword: 하이라이팅할 키워드
+        
+    Returns:
+        컴파일된 정규식 (키워드가 없으면 None)
+    """
+    if not keyword:
+        return None
+    return re.compile(re.escape(keyword), re.IGNORECASE)
+
+
+def highlight_keyword(text: str, pattern: Optional[Pattern]) -> str:
     """
     텍스트에서 키워드 하이라이팅
     
     Args:
         text: 원본 텍스트
-        keyword: 하이라이팅할 키워드
+        pattern: compile_keyword_pattern()으로 컴파일한 키워드 정규식
         
     Returns:
         하이라이팅된 텍스트 (HTML)
     """
-    if not keyword or not text:
+    if pattern is None or not text:
         return text
     
-    # 대소문자 구분 없이 하이라이팅
-    pattern = re.compile(re.escape(keyword), re.IGNORECASE)
-    highlighted = pattern.sub(
-        lambda m: f'<mark style="background-color: yellow; font-weight: bold;">{m.group()}</mark>',
-        text
-    )
+    return pattern.sub(HIGHLIGHT_REPLACEMENT, text)
+
+
+@st.cache_data(show_spinner=False)
+def _build_news_df(keyword: str, items_json: str) -> pd.DataFrame:
+    """
+    뉴스 목록 DataFrame 생성 (키워드 하이라이팅 포함)
+    
+    Args:
+        keyword: 하이라이팅할 키워드
+        items_json: 뉴스 아이템 리스트의 JSON 문자열 (캐시 키)
+        
+    Returns:
+        표시용 DataFrame
+    """
+    news_items = orjson.loads(items_json)
     
-    return highlighted
+    # 키워드 정규식은 한 번만 컴파일
+    pattern = compile_keyword_pattern(keyword)
+    
+    # 데이터프레임 생성 (컬럼 단위로 구성)
+    titles = [highlight_keyword(item.get("title", "제목 없음"), pattern) for item in news_items]
+    summaries = [highlight_keyword(item.get("summary", "요약 없음"), pattern) for item in news_items]
+    scores = np.array([item.get("sentiment_score", 0.5) for item in news_items], dtype=float)
+    
+    return pd.DataFrame({
+        "제목": titles,
+        "요약": [s[:100] + "..." if len(s) > 100 else s for s in summaries],
+        "감정 점수": scores,
+        "신뢰도": [item.get("confidence", 0.0) for item in news_items],
+        "출처": [item.get("source", "알 수 없음") for item in news_items],
+        "발행일": [item.get("pubDate", "알 수 없음") for item in news_items],
+        "링크": [item.get("link", "") for item in news_items],
+        # 감정 점수에 따른 컬러 인디케이터
+        "상태": [get_sentiment_color(score)[1] for score in scores],
+    })
 
 
 def display_news_list(result: Dict):
@@ -51,45 +103,18 @@ def display_news_list(result: Dict):
         st.info("뉴스 데이터가 없습니다")
         return
     
-    # 데이터프레임 생성
-    df_data = []
-    for item in news_items:
-        title = item.get("title", "제목 없음")
-        summary = item.get("summary", "요약 없음")
-        
-        # 키워드 하이라이팅
-        if keyword:
-            title = highlight_keyword(title, keyword)
-            summary = highlight_keyword(summary, keyword)
-        
-        df_data.append({
-            "제목": title,
-            "요약": summary[:100] + "..." if len(summary) > 100 else summary,
-            "감정 점수": item.get("sentiment_score", 0.5),
-            "신뢰도": item.get("confidence", 0.0),
-            "출처": item.get("source", "알 수 없음"),
-            "발행일": item.get("pubDate", "알 수 없음"),
-            "링크": item.get("link", ""),
-        })
+    # 결과가 바뀌지 않은 재실행에서는 캐시된 DataFrame 재사용
+    items_json = orjson.dumps(news_items).decode()
+    df = _build_news_df(keyword, items_json)
     
-    df = pd.DataFrame(df_data)
-    
-    # 감정 점수에 따라 색상 분기 및 컬러 인디케이터
+    # 감정 점수에 따라 색상 분기
     def color_sentiment(val):
         score = float(val)
         bg_color, _ = get_sentiment_color(score)
         return f"background-color: {bg_color}"
     
-    def add_color_indicator(row):
-        score = row["감정 점수"]
-        _, emoji = get_sentiment_color(score)
-        return emoji
-    
-    # 컬러 인디케이터 추가
-    df["상태"] = df.apply(add_color_indicator, axis=1)
-    
     # 스타일 적용
-    styled_df = df.style.applymap(color_sentiment, subset=["감정 점수"])
+    styled_df = df.style.map(color_sentiment, subset=["감정 점수"])
     
     st.dataframe(
         styled_df,
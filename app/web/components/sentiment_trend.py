@@ -5,56 +5,242 @@
 
 import streamlit as st
 import pandas as pd
+import numpy as np
 import plotly.graph_objects as go
-from typing import Dict
+from functools import lru_cache
+from typing import Dict, List, NamedTuple, Tuple, Union
 import logging
 
-from app.web.components.theme import get_theme_colors
+import orjson
+
+from app.web.components._kernels import rolling_mean
+from app.web.components.cache_utils import to_cache_key
+from app.web.components.theme import get_plotly_template
 
 logger = logging.getLogger(__name__)
 
+# 차트 캐시 설정 (결과가 바뀌지 않은 재실행에서는 Figure 재사용)
+CHART_CACHE_TTL = 300
+CHART_CACHE_MAX_ENTRIES = 32
+
+# 라인 차트 다운샘플링 (포인트가 많으면 브라우저 렌더링이 병목)
+DOWNSAMPLE_THRESHOLD = 2000
+DOWNSAMPLE_TARGET = 1000
+
+# 차트 빌더 간 공유하는 시계열 배열 캐시 크기
+SERIES_CACHE_MAX_ENTRIES = 8
+
+# 호버 템플릿
+HOVER_SENTIMENT = "<b>시간:</b> %{x}<br><b>감정 점수:</b> %{y:.3f}<extra></extra>"
+HOVER_SPIKE = "<b>스파이크</b><br>시간: %{x}<br>값: %{y:.3f}<extra></extra>"
+HOVER_ZSCORE = "<b>이상치 (Z-score)</b><br>시간: %{x}<br>값: %{y:.3f}<extra></extra>"
+HOVER_MOVING_AVG = "<b>이상치 (Moving Avg)</b><br>시간: %{x}<br>값: %{y:.3f}<extra></extra>"
+HOVER_POSITIVE_RATIO = "<b>시간:</b> %{x}<br><b>긍정 비율:</b> %{y:.2%}<extra></extra>"
+HOVER_NEGATIVE_RATIO = "<b>시간:</b> %{x}<br><b>부정 비율:</b> %{y:.2%}<extra></extra>"
+
+# 이상치 구간 강조 색상
+HIGHLIGHT_FILL_COLOR = "rgba(255, 165, 0, 0.2)"
+
 
-def display_sentiment_trend(result: Dict, smoothing: bool = False):
+class SeriesArrays(NamedTuple):
+    """차트 빌더가 공유하는 시계열 컬럼 배열 (읽기 전용)"""
+    timestamps: np.ndarray
+    epoch_ns: np.ndarray
+    sentiment: np.ndarray
+
+
+@lru_cache(maxsize=SERIES_CACHE_MAX_ENTRIES)
+def _series_arrays(series_json: str) -> SeriesArrays:
     """
-    실시간 감정 변화 차트 표시
+    시계열 JSON을 컬럼별 NumPy 배열로 한 번만 변환
+    
+    같은 결과로 그리는 차트들이 동일한 버퍼를 재사용하므로 읽기 전용으로 고정
     
     Args:
-        result: 분석 결과 딕셔너리
-        smoothing: 스무딩 적용 여부
+        series_json: 시계열 데이터 JSON 문자열
+    
+    Returns:
+        SeriesArrays (timestamp, epoch 나노초, 평균 감정 점수)
     """
-    time_series = result.get("time_series", [])
+    time_series = orjson.loads(series_json)
     
-    if not time_series:
-        st.warning("시계열 데이터가 없습니다")
-        return
+    # 행 단위 dict 리스트의 타입 추론을 건너뛰고 필요한 컬럼만 바로 구성
+    index = pd.to_datetime(
+        [point["timestamp"] for point in time_series],
+        format="ISO8601",
+        cache=True,
+    )
+    sentiment = np.fromiter(
+        (point["avg_sentiment"] for point in time_series),
+        dtype=np.float64,
+        count=len(time_series),
+    )
+    
+    arrays = SeriesArrays(index.to_numpy(), index.asi8.copy(), sentiment)
+    for array in arrays:
+        array.flags.writeable = False
+    return arrays
+
+
+def _lttb_indices(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """
+    LTTB(Largest-Triangle-Three-Buckets) 다운샘플링으로 남길 인덱스 선택
     
-    df = pd.DataFrame(time_series)
-    df["timestamp"] = pd.to_datetime(df["timestamp"])
+    첫/마지막 점은 유지하고, 나머지는 버킷마다 이전 선택점과 다음 버킷 평균으로
+    만든 삼각형 면적이 가장 큰 점을 선택하여 시각적 형태를 보존
+    
+    Args:
+        x: x 값 배열 (정렬된 숫자)
+        y: y 값 배열
+        n_out: 남길 포인트 수
+    
+    Returns:
+        선택된 인덱스 배열 (오름차순)
+    """
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+    
+    # 첫/마지막 점을 제외한 구간을 n_out - 2개 버킷으로 분할
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    indices = np.empty(n_out, dtype=np.int64)
+    indices[0] = 0
+    indices[-1] = n - 1
+    
+    prev = 0
+    for i in range(n_out - 2):
+        start, end = edges[i], max(edges[i + 1], edges[i] + 1)
+        
+        # 다음 버킷 평균 (마지막 버킷이면 마지막 점)
+        if i + 2 < len(edges):
+            next_start, next_end = edges[i + 1], max(edges[i + 2], edges[i + 1] + 1)
+        else:
+            next_start, next_end = n - 1, n
+        avg_x = x[next_start:next_end].mean()
+        avg_y = y[next_start:next_end].mean()
+        
+        areas = np.abs(
+            (x[prev] - avg_x) * (y[start:end] - y[prev])
+            - (x[prev] - x[start:end]) * (avg_y - y[prev])
+        )
+        prev = start + int(np.argmax(areas))
+        indices[i + 1] = prev
+    
+    return indices
+
+
+def _downsample_indices(epoch_ns: np.ndarray, values: np.ndarray) -> Union[slice, np.ndarray]:
+    """
+    라인 차트용 다운샘플링 인덱스 (DOWNSAMPLE_THRESHOLD 이하이면 전체 슬라이스)
+    
+    Args:
+        epoch_ns: timestamp의 epoch 나노초 배열
+        values: 형태 보존 기준 값 배열
+    
+    Returns:
+        배열 인덱싱에 사용할 slice 또는 인덱스 배열
+    """
+    if len(values) <= DOWNSAMPLE_THRESHOLD:
+        return slice(None)
+    
+    return _lttb_indices(epoch_ns.astype(np.float64), values, DOWNSAMPLE_TARGET)
+
+
+def _clip_idx(items: List[Dict], key: str, n: int) -> np.ndarray:
+    """
+    딕셔너리 리스트에서 인덱스 값을 추출하고 시계열 범위 밖의 값 제거
+    
+    Args:
+        items: 스파이크/이상치 딕셔너리 리스트
+        key: 인덱스 키 (예: "start")
+        n: 시계열 길이
+    
+    Returns:
+        n 미만의 인덱스 배열 (int64)
+    """
+    indices = np.fromiter((item[key] for item in items), dtype=np.int64, count=len(items))
+    return indices[indices < n]
+
+
+def _merge_highlight_ranges(
+    indices: np.ndarray,
+    n: int,
+    timestamps: np.ndarray,
+) -> List[Tuple[pd.Timestamp, pd.Timestamp]]:
+    """
+    이상치 인덱스별 [idx-1, idx+1] 강조 구간을 계산하고 겹치는 구간을 병합
+    
+    Args:
+        indices: 정렬된 이상치 인덱스 배열 (중복 없음, n 미만)
+        n: 시계열 길이
+        timestamps: 시계열 timestamp 배열
+    
+    Returns:
+        (시작 시각, 종료 시각) 튜플 리스트
+    """
+    starts = np.clip(indices - 1, 0, n - 1)
+    ends = np.clip(indices + 1, 0, n - 1)
+    
+    # 인덱스가 정렬되어 있으므로 ends도 단조 증가 -> 이전 구간 끝과 겹치지 않을 때만 새 구간 시작
+    is_new_range = np.ones(len(starts), dtype=bool)
+    is_new_range[1:] = starts[1:] > ends[:-1]
+    range_starts = np.flatnonzero(is_new_range)
+    range_ends = np.append(range_starts[1:], len(starts)) - 1
+    
+    return [
+        (pd.Timestamp(x0), pd.Timestamp(x1))
+        for x0, x1 in zip(timestamps[starts[range_starts]], timestamps[ends[range_ends]])
+    ]
+
+
+@st.cache_data(ttl=CHART_CACHE_TTL, max_entries=CHART_CACHE_MAX_ENTRIES, show_spinner=False)
+def _build_trend_fig(
+    series_json: str,
+    spikes_json: str,
+    anomalies_json: str,
+    keyword: str,
+    smoothing: bool,
+    template: str,
+) -> go.Figure:
+    """
+    메인 감정 트렌드 차트 생성
+    
+    Args:
+        series_json: 시계열 데이터 JSON 문자열
+        spikes_json: 스파이크 리스트 JSON 문자열
+        anomalies_json: 이상치 딕셔너리 JSON 문자열
+        keyword: 키워드 (차트 제목)
+        smoothing: 스무딩 적용 여부
+        template: Plotly 템플릿 이름
+    
+    Returns:
+        Plotly Figure
+    """
+    arrays = _series_arrays(series_json)
+    ts = arrays.timestamps
+    values = arrays.sentiment
+    n = len(values)
+    spikes = orjson.loads(spikes_json)
+    anomalies = orjson.loads(anomalies_json)
     
     # 스무딩 적용
-    if smoothing and len(df) > 3:
-        window_size = min(5, len(df) // 2)
+    smoothed = values
+    if smoothing and n > 3:
+        window_size = min(5, n // 2)
         if window_size >= 3:
-            df["avg_sentiment_smooth"] = df["avg_sentiment"].rolling(
-                window=window_size, center=True
-            ).mean()
-            df["avg_sentiment_smooth"] = df["avg_sentiment_smooth"].fillna(df["avg_sentiment"])
-        else:
-            df["avg_sentiment_smooth"] = df["avg_sentiment"]
-    else:
-        df["avg_sentiment_smooth"] = df["avg_sentiment"]
+            rolling = rolling_mean(values, window_size, center=True)
+            smoothed = np.where(np.isnan(rolling), values, rolling)
+    
+    # 라인은 다운샘플링, 마커/강조 구간은 원본 해상도 유지
+    line_idx = _downsample_indices(arrays.epoch_ns, values)
+    line_ts = ts[line_idx]
     
     # 스파이크 마커
-    spikes = result.get("spikes", [])
-    spike_indices = [spike["start"] for spike in spikes if spike["start"] < len(df)]
+    spike_idx = _clip_idx(spikes, "start", n)
     
     # 이상치 마커
-    anomalies = result.get("anomalies", {})
-    zscore_indices = [a["start"] for a in anomalies.get("zscore", []) if a["start"] < len(df)]
-    moving_avg_indices = [a["start"] for a in anomalies.get("moving_average", []) if a["start"] < len(df)]
-    
-    # 테마 색상 가져오기
-    colors = get_theme_colors()
+    zscore_idx = _clip_idx(anomalies.get("zscore", []), "start", n)
+    moving_avg_idx = _clip_idx(anomalies.get("moving_average", []), "start", n)
     
     # 메인 라인 차트 생성
     fig = go.Figure()
@@ -62,54 +248,59 @@ def display_sentiment_trend(result: Dict, smoothing: bool = False):
     # 메인 라인 (스무딩 적용 시)
     if smoothing:
         fig.add_trace(go.Scatter(
-            x=df["timestamp"],
-            y=df["avg_sentiment"],
+            x=line_ts,
+            y=values[line_idx],
             mode="lines",
             name="감정 점수 (원본)",
             line=dict(color="lightblue", width=1, dash="dot"),
             opacity=0.5,
-            hovertemplate="<b>시간:</b> %{x}<br><b>감정 점수:</b> %{y:.3f}<extra></extra>",
+            hovertemplate=HOVER_SENTIMENT,
         ))
         fig.add_trace(go.Scatter(
-            x=df["timestamp"],
-            y=df["avg_sentiment_smooth"],
+            x=line_ts,
+            y=smoothed[line_idx],
             mode="lines+markers",
             name="감정 점수 (스무딩)",
             line=dict(color="blue", width=2),
             marker=dict(size=6, color="blue"),
-            hovertemplate="<b>시간:</b> %{x}<br><b>감정 점수:</b> %{y:.3f}<extra></extra>",
+            hovertemplate=HOVER_SENTIMENT,
         ))
     else:
         fig.add_trace(go.Scatter(
-            x=df["timestamp"],
-            y=df["avg_sentiment"],
+            x=line_ts,
+            y=values[line_idx],
             mode="lines+markers",
             name="감정 점수",
             line=dict(color="blue", width=2),
             marker=dict(size=6, color="blue"),
-            hovertemplate="<b>시간:</b> %{x}<br><b>감정 점수:</b> %{y:.3f}<extra></extra>",
+            hovertemplate=HOVER_SENTIMENT,
         ))
     
-    # 이상치 구간 강조 (Highlight 영역)
-    if zscore_indices or moving_avg_indices:
-        all_anomaly_indices = sorted(set(zscore_indices + moving_avg_indices))
-        for idx in all_anomaly_indices:
-            if idx < len(df):
-                fig.add_vrect(
-                    x0=df.iloc[max(0, idx-1)]["timestamp"],
-                    x1=df.iloc[min(len(df)-1, idx+1)]["timestamp"],
-                    fillcolor="rgba(255, 165, 0, 0.2)",
-                    layer="below",
-                    line_width=0,
-                )
+    # 이상치 구간 강조 (Highlight 영역, 레이아웃에 한 번에 추가)
+    shapes = []
+    if zscore_idx.size or moving_avg_idx.size:
+        all_anomaly_indices = np.union1d(zscore_idx, moving_avg_idx)
+        shapes = [
+            dict(
+                type="rect",
+                xref="x",
+                yref="y domain",
+                x0=x0,
+                x1=x1,
+                y0=0,
+                y1=1,
+                fillcolor=HIGHLIGHT_FILL_COLOR,
+                layer="below",
+                line_width=0,
+            )
+            for x0, x1 in _merge_highlight_ranges(all_anomaly_indices, n, ts)
+        ]
     
     # 스파이크 표시
-    if spike_indices:
-        spike_df = df.iloc[spike_indices]
-        
+    if spike_idx.size:
         fig.add_trace(go.Scatter(
-            x=spike_df["timestamp"],
-            y=spike_df["avg_sentiment"],
+            x=ts[spike_idx],
+            y=values[spike_idx],
             mode="markers",
             name="스파이크",
             marker=dict(
@@ -118,15 +309,14 @@ def display_sentiment_trend(result: Dict, smoothing: bool = False):
                 symbol="diamond",
                 line=dict(width=2, color="darkred"),
             ),
-            hovertemplate="<b>스파이크</b><br>시간: %{x}<br>값: %{y:.3f}<extra></extra>",
+            hovertemplate=HOVER_SPIKE,
         ))
     
     # 이상치 표시 (Z-score)
-    if zscore_indices:
-        zscore_df = df.iloc[zscore_indices]
+    if zscore_idx.size:
         fig.add_trace(go.Scatter(
-            x=zscore_df["timestamp"],
-            y=zscore_df["avg_sentiment"],
+            x=ts[zscore_idx],
+            y=values[zscore_idx],
             mode="markers",
             name="이상치 (Z-score)",
             marker=dict(
@@ -135,15 +325,14 @@ def display_sentiment_trend(result: Dict, smoothing: bool = False):
                 symbol="x",
                 line=dict(width=2, color="darkorange"),
             ),
-            hovertemplate="<b>이상치 (Z-score)</b><br>시간: %{x}<br>값: %{y:.3f}<extra></extra>",
+            hovertemplate=HOVER_ZSCORE,
         ))
     
     # 이상치 표시 (Moving Average)
-    if moving_avg_indices:
-        moving_avg_df = df.iloc[moving_avg_indices]
+    if moving_avg_idx.size:
         fig.add_trace(go.Scatter(
-            x=moving_avg_df["timestamp"],
-            y=moving_avg_df["avg_sentiment"],
+            x=ts[moving_avg_idx],
+            y=values[moving_avg_idx],
             mode="markers",
             name="이상치 (Moving Avg)",
             marker=dict(
@@ -152,140 +341,292 @@ def display_sentiment_trend(result: Dict, smoothing: bool = False):
                 symbol="square",
                 line=dict(width=2, color="darkviolet"),
             ),
-            hovertemplate="<b>이상치 (Moving Avg)</b><br>시간: %{x}<br>값: %{y:.3f}<extra></extra>",
+            hovertemplate=HOVER_MOVING_AVG,
         ))
     
     # 레이아웃 설정
     fig.update_layout(
-        title=f"'{result.get('keyword', '')}' 키워드 감정 트렌드",
+        title=f"'{keyword}' 키워드 감정 트렌드",
         xaxis_title="시간",
         yaxis_title="감정 점수 (0=부정, 1=긍정)",
         hovermode="x unified",
         height=500,
-        plot_bgcolor=colors["plot_bgcolor"],
-        paper_bgcolor=colors["paper_bgcolor"],
-        font=dict(color=colors["text_color"]),
-        xaxis=dict(gridcolor=colors["grid_color"]),
-        yaxis=dict(gridcolor=colors["grid_color"]),
+        template=template,
+        shapes=shapes,
         legend=dict(
             orientation="h",
             yanchor="bottom",
             y=1.02,
             xanchor="right",
             x=1,
-            bgcolor=colors["bg_color"],
         ),
     )
     
+    return fig
+
+
+@st.cache_data(ttl=CHART_CACHE_TTL, max_entries=CHART_CACHE_MAX_ENTRIES, show_spinner=False)
+def _build_stacked_bar(series_json: str, template: str) -> go.Figure:
+    """
+    긍정/부정 비중 Stacked Bar 차트 생성
+    
+    Args:
+        series_json: 시계열 데이터 JSON 문자열
+        template: Plotly 템플릿 이름
+    
+    Returns:
+        Plotly Figure
+    """
+    arrays = _series_arrays(series_json)
+    positive_ratio = arrays.sentiment
+    negative_ratio = 1.0 - positive_ratio
+    
+    fig_bar = go.Figure()
+    fig_bar.add_trace(go.Bar(
+        x=arrays.timestamps,
+        y=positive_ratio,
+        name="긍정",
+        marker_color="green",
+        hovertemplate=HOVER_POSITIVE_RATIO,
+    ))
+    fig_bar.add_trace(go.Bar(
+        x=arrays.timestamps,
+        y=negative_ratio,
+        name="부정",
+        marker_color="red",
+        hovertemplate=HOVER_NEGATIVE_RATIO,
+    ))
+    
+    fig_bar.update_layout(
+        barmode="stack",
+        height=300,
+        template=template,
+        yaxis=dict(tickformat=".0%"),
+    )
+    
+    return fig_bar
+
+
+@st.cache_data(ttl=CHART_CACHE_TTL, max_entries=CHART_CACHE_MAX_ENTRIES, show_spinner=False)
+def _build_rolling_fig(series_json: str, template: str) -> go.Figure:
+    """
+    7일 Rolling Average 차트 생성
+    
+    Args:
+        series_json: 시계열 데이터 JSON 문자열
+        template: Plotly 템플릿 이름
+    
+    Returns:
+        Plotly Figure
+    """
+    arrays = _series_arrays(series_json)
+    values = arrays.sentiment
+    rolling_avg = rolling_mean(values, min(7, len(values)), center=True)
+    line_idx = _downsample_indices(arrays.epoch_ns, values)
+    line_ts = arrays.timestamps[line_idx]
+    
+    fig_rolling = go.Figure()
+    fig_rolling.add_trace(go.Scatter(
+        x=line_ts,
+        y=values[line_idx],
+        mode="lines",
+        name="원본",
+        line=dict(color="lightblue", width=1),
+        opacity=0.5,
+    ))
+    fig_rolling.add_trace(go.Scatter(
+        x=line_ts,
+        y=rolling_avg[line_idx],
+        mode="lines",
+        name="7일 Rolling Average",
+        line=dict(color="blue", width=2),
+    ))
+    
+    fig_rolling.update_layout(
+        title="7일 Rolling Average",
+        xaxis_title="시간",
+        yaxis_title="감정 점수",
+        height=300,
+        template=template,
+    )
+    
+    return fig_rolling
+
+
+@st.cache_data(ttl=CHART_CACHE_TTL, max_entries=CHART_CACHE_MAX_ENTRIES, show_spinner=False)
+def _build_heatmap(spikes_json: str, template: str) -> go.Figure:
+    """
+    스파이크 Heatmap 생성 (일별 × 시간별)
+    
+    Args:
+        spikes_json: 스파이크 리스트 JSON 문자열
+        template: Plotly 템플릿 이름
+    
+    Returns:
+        Plotly Figure
+    """
+    spikes = orjson.loads(spikes_json)
+    timestamps = pd.to_datetime([spike["timestamp"] for spike in spikes])
+    days = timestamps.day.to_numpy()
+    hours = timestamps.hour.to_numpy()
+    scores = np.fromiter((spike["score"] for spike in spikes), dtype=np.float64, count=len(spikes))
+    
+    # Heatmap 데이터 생성 (일 × 시간 격자에 한 번에 누적 후 평균)
+    sums = np.zeros((32, 24))
+    counts = np.zeros((32, 24))
+    np.add.at(sums, (days, hours), scores)
+    np.add.at(counts, (days, hours), 1)
+    means = np.divide(sums, counts, out=np.zeros_like(sums), where=counts > 0)
+    
+    # 관측된 일/시간만 표시
+    unique_days = np.unique(days)
+    unique_hours = np.unique(hours)
+    
+    fig_heatmap = go.Figure(data=go.Heatmap(
+        z=means[np.ix_(unique_days, unique_hours)],
+        x=unique_hours,
+        y=unique_days,
+        colorscale="Reds",
+        colorbar=dict(title="스파이크 점수"),
+    ))
+    
+    fig_heatmap.update_layout(
+        title="스파이크 Heatmap (일별 × 시간별)",
+        xaxis_title="시간 (시)",
+        yaxis_title="일",
+        height=400,
+        template=template,
+    )
+    
+    return fig_heatmap
+
+
+@st.fragment
+def _render_main_trend(
+    series_json: str,
+    spikes_json: str,
+    anomalies_json: str,
+    keyword: str,
+    template: str,
+):
+    """
+    메인 감정 트렌드 차트 렌더링
+    
+    스무딩 옵션을 fragment 안에 두어 토글 시 이 차트만 다시 그림
+    
+    Args:
+        series_json: 시계열 데이터 JSON 문자열
+        spikes_json: 스파이크 리스트 JSON 문자열
+        anomalies_json: 이상치 딕셔너리 JSON 문자열
+        keyword: 키워드 (차트 제목)
+        template: Plotly 템플릿 이름
+    """
+    smoothing = st.checkbox(
+        "스무딩 적용",
+        key="smoothing",
+        help="이동 평균을 사용하여 차트를 부드럽게 표시",
+    )
+    
+    fig = _build_trend_fig(
+        series_json,
+        spikes_json,
+        anomalies_json,
+        keyword,
+        smoothing,
+        template,
+    )
     st.plotly_chart(fig, use_container_width=True)
+
+
+@st.fragment
+def _render_stacked_bar(series_json: str, template: str):
+    """
+    긍정/부정 비중 차트 렌더링
     
-    # Stacked Bar Chart 추가
+    Args:
+        series_json: 시계열 데이터 JSON 문자열
+        template: Plotly 템플릿 이름
+    """
     st.subheader("📊 긍정/부정 비중")
-    if len(df) > 0:
-        df["positive_ratio"] = df["avg_sentiment"]
-        df["negative_ratio"] = 1 - df["avg_sentiment"]
-        
-        fig_bar = go.Figure()
-        fig_bar.add_trace(go.Bar(
-            x=df["timestamp"],
-            y=df["positive_ratio"],
-            name="긍정",
-            marker_color="green",
-            hovertemplate="<b>시간:</b> %{x}<br><b>긍정 비율:</b> %{y:.2%}<extra></extra>",
-        ))
-        fig_bar.add_trace(go.Bar(
-            x=df["timestamp"],
-            y=df["negative_ratio"],
-            name="부정",
-            marker_color="red",
-            hovertemplate="<b>시간:</b> %{x}<br><b>부정 비율:</b> %{y:.2%}<extra></extra>",
-        ))
-        
-        fig_bar.update_layout(
-            barmode="stack",
-            height=300,
-            plot_bgcolor=colors["plot_bgcolor"],
-            paper_bgcolor=colors["paper_bgcolor"],
-            font=dict(color=colors["text_color"]),
-            xaxis=dict(gridcolor=colors["grid_color"]),
-            yaxis=dict(gridcolor=colors["grid_color"], tickformat=".0%"),
-            legend=dict(bgcolor=colors["bg_color"]),
-        )
-        
-        st.plotly_chart(fig_bar, use_container_width=True)
+    st.plotly_chart(_build_stacked_bar(series_json, template), use_container_width=True)
+
+
+@st.fragment
+def _render_rolling(series_json: str, template: str):
+    """
+    7일 Rolling Average 차트 렌더링
+    
+    Args:
+        series_json: 시계열 데이터 JSON 문자열
+        template: Plotly 템플릿 이름
+    """
+    st.subheader("📊 7일 Rolling Average")
+    st.plotly_chart(_build_rolling_fig(series_json, template), use_container_width=True)
+
+
+@st.fragment
+def _render_heatmap(spikes_json: str, template: str):
+    """
+    스파이크 Heatmap 렌더링
+    
+    Args:
+        spikes_json: 스파이크 리스트 JSON 문자열
+        template: Plotly 템플릿 이름
+    """
+    st.subheader("🔥 스파이크 Heatmap")
+    st.plotly_chart(_build_heatmap(spikes_json, template), use_container_width=True)
+
+
+def display_sentiment_trend(result: Dict):
+    """
+    실시간 감정 변화 차트 표시
+    
+    각 차트는 fragment로 분리되어 있어 차트 옵션 변경 시 해당 차트만 다시 렌더링
+    
+    Args:
+        result: 분석 결과 딕셔너리
+    """
+    time_series = result.get("time_series", [])
+    
+    if not time_series:
+        st.warning("시계열 데이터가 없습니다")
+        return
+    
+    spikes = result.get("spikes", [])
+    
+    # Figure 캐시 키 (dict는 해싱이 느리므로 JSON 문자열 사용)
+    series_json = to_cache_key(time_series)
+    spikes_json = to_cache_key(spikes)
+    anomalies_json = to_cache_key(result.get("anomalies", {}))
+    
+    # 테마별 Plotly 템플릿 (레이아웃 색상은 템플릿에서 일괄 적용)
+    template = get_plotly_template()
+    
+    _render_main_trend(
+        series_json,
+        spikes_json,
+        anomalies_json,
+        result.get("keyword", ""),
+        template,
+    )
+    
+    # Stacked Bar Chart 추가
+    _render_stacked_bar(series_json, template)
     
     # 7일 Rolling Average 추가
-    if len(df) > 1:
-        st.subheader("📊 7일 Rolling Average")
-        df["rolling_avg"] = df["avg_sentiment"].rolling(
-            window=min(7, len(df)), center=True
-        ).mean()
-        
-        fig_rolling = go.Figure()
-        fig_rolling.add_trace(go.Scatter(
-            x=df["timestamp"],
-            y=df["avg_sentiment"],
-            mode="lines",
-            name="원본",
-            line=dict(color="lightblue", width=1),
-            opacity=0.5,
-        ))
-        fig_rolling.add_trace(go.Scatter(
-            x=df["timestamp"],
-            y=df["rolling_avg"],
-            mode="lines",
-            name="7일 Rolling Average",
-            line=dict(color="blue", width=2),
-        ))
-        
-        fig_rolling.update_layout(
-            title="7일 Rolling Average",
-            xaxis_title="시간",
-            yaxis_title="감정 점수",
-            height=300,
-            plot_bgcolor=colors["plot_bgcolor"],
-            paper_bgcolor=colors["paper_bgcolor"],
-            font=dict(color=colors["text_color"]),
-        )
-        
-        st.plotly_chart(fig_rolling, use_container_width=True)
+    if len(time_series) > 1:
+        _render_rolling(series_json, template)
     
     # 스파이크 Heatmap 추가
     if spikes:
-        st.subheader("🔥 스파이크 Heatmap")
-        
-        spike_df = pd.DataFrame(spikes)
-        spike_df["timestamp"] = pd.to_datetime(spike_df["timestamp"])
-        spike_df["hour"] = spike_df["timestamp"].dt.hour
-        spike_df["day"] = spike_df["timestamp"].dt.day
-        
-        # Heatmap 데이터 생성
-        heatmap_data = spike_df.groupby(["day", "hour"])["score"].mean().unstack(fill_value=0)
-        
-        fig_heatmap = go.Figure(data=go.Heatmap(
-            z=heatmap_data.values,
-            x=heatmap_data.columns,
-            y=heatmap_data.index,
-            colorscale="Reds",
-            colorbar=dict(title="스파이크 점수"),
-        ))
-        
-        fig_heatmap.update_layout(
-            title="스파이크 Heatmap (일별 × 시간별)",
-            xaxis_title="시간 (시)",
-            yaxis_title="일",
-            height=400,
-        )
-        
-        st.plotly_chart(fig_heatmap, use_container_width=True)
+        _render_heatmap(spikes_json, template)
     
     # 통계 정보
-    if len(df) > 0:
-        col1, col2, col3 = st.columns(3)
-        with col1:
-            st.metric("최소 감정 점수", f"{df['avg_sentiment'].min():.3f}")
-        with col2:
-            st.metric("최대 감정 점수", f"{df['avg_sentiment'].max():.3f}")
-        with col3:
-            st.metric("표준편차", f"{df['avg_sentiment'].std():.3f}")
-
+    sentiments = pd.Series(_series_arrays(series_json).sentiment)
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric("최소 감정 점수", f"{sentiments.min():.3f}")
+    with col2:
+        st.metric("최대 감정 점수", f"{sentiments.max():.3f}")
+    with col3:
+        st.metric("표준편차", f"{sentiments.std():.3f}")
@@ -4,64 +4,63 @@
 
 import streamlit as st
 import pandas as pd
+import numpy as np
 import plotly.graph_objects as go
 from typing import Dict
 import logging
 
-from app.web.components.theme import get_theme_colors, get_spike_color
+import orjson
+
+from app.web.components.cache_utils import to_cache_key
+from app.web.components.theme import get_plotly_template, get_spike_colors_vec
 
 logger = logging.getLogger(__name__)
 
+# 호버 템플릿 (값은 customdata로 전달)
+HOVER_SPIKE_SCORE = "<b>시간:</b> %{x}<br><b>스파이크 점수:</b> %{y:.3f}<br><b>값:</b> %{customdata:.3f}<extra></extra>"
 
-def display_spikes(result: Dict):
+
+@st.cache_data(ttl=300, max_entries=32, show_spinner=False)
+def _build_spike_chart(spikes_json: str, template: str):
     """
-    스파이크 구간 차트 표시
+    스파이크 Bar 차트와 상세 정보 테이블 생성
     
     Args:
-        result: 분석 결과 딕셔너리
-    """
-    spikes = result.get("spikes", [])
+        spikes_json: 스파이크 리스트 JSON 문자열
+        template: Plotly 템플릿 이름
     
-    if not spikes:
-        st.info("감지된 스파이크가 없습니다")
-        return
+    Returns:
+        (Plotly Figure, 상세 정보 DataFrame) 튜플
+    """
+    spikes = orjson.loads(spikes_json)
+    n = len(spikes)
     
-    # 스파이크 데이터프레임 생성 및 정렬
-    spike_df = pd.DataFrame(spikes)
-    spike_df = spike_df.sort_values("score", ascending=False).reset_index(drop=True)
+    # 점수 내림차순 정렬 순서 (DataFrame/인덱스 생성 없이 컬럼 배열만 정렬)
+    scores = np.fromiter((spike["score"] for spike in spikes), dtype=np.float64, count=n)
+    order = np.argsort(-scores, kind="stable")
+    scores = scores[order]
+    values = np.fromiter((spike.get("value", np.nan) for spike in spikes), dtype=np.float64, count=n)[order]
+    timestamps = np.array([spike.get("timestamp") for spike in spikes], dtype=object)[order]
     
-    # 상위 5개 강조 (버그 수정)
-    top_5 = set(spike_df.index[:5])
+    # 상위 5개 강조 (정렬 후 앞쪽 5개)
+    is_top_5 = np.arange(n) < 5
     
-    # 테마 색상 가져오기
-    colors = get_theme_colors()
+    # 스파이크 값에 따라 색상 분기 및 상위 5개 강조
+    bar_colors, marker_lines, marker_line_widths = get_spike_colors_vec(scores, is_top_5)
     
     # Bar 차트 생성
     fig = go.Figure()
     
-    # 스파이크 값에 따라 색상 분기 및 상위 5개 강조
-    bar_colors = []
-    marker_lines = []
-    marker_line_widths = []
-    
-    for idx in spike_df.index:
-        score = spike_df.loc[idx, "score"]
-        is_top_5 = idx in top_5
-        color, line_color, line_width = get_spike_color(score, is_top_5)
-        bar_colors.append(color)
-        marker_lines.append(line_color)
-        marker_line_widths.append(line_width)
-    
     fig.add_trace(go.Bar(
-        x=spike_df["timestamp"],
-        y=spike_df["score"],
+        x=timestamps,
+        y=scores,
         name="스파이크 점수",
         marker=dict(
             color=bar_colors,
             line=dict(color=marker_lines, width=marker_line_widths),
         ),
-        hovertemplate="<b>시간:</b> %{x}<br><b>스파이크 점수:</b> %{y:.3f}<br><b>값:</b> %{customdata:.3f}<extra></extra>",
-        customdata=spike_df["value"],
+        hovertemplate=HOVER_SPIKE_SCORE,
+        customdata=values,
     ))
     
     fig.update_layout(
@@ -69,20 +68,39 @@ def display_spikes(result: Dict):
         xaxis_title="시간",
         yaxis_title="스파이크 점수 (Z-score)",
         height=400,
-        plot_bgcolor=colors["plot_bgcolor"],
-        paper_bgcolor=colors["paper_bgcolor"],
-        font=dict(color=colors["text_color"]),
-        xaxis=dict(gridcolor=colors["grid_color"]),
-        yaxis=dict(gridcolor=colors["grid_color"]),
+        template=template,
     )
     
+    # 스파이크 상세 정보 테이블
+    display_df = pd.DataFrame({
+        "시간": timestamps,
+        "감정 점수": values.round(3),
+        "스파이크 점수": scores.round(3),
+    })
+    
+    return fig, display_df
+
+
+def display_spikes(result: Dict):
+    """
+    스파이크 구간 차트 표시
+    
+    Args:
+        result: 분석 결과 딕셔너리
+    """
+    spikes = result.get("spikes", [])
+    
+    if not spikes:
+        st.info("감지된 스파이크가 없습니다")
+        return
+    
+    # 테마별 Plotly 템플릿 (레이아웃 색상은 템플릿에서 일괄 적용)
+    template = get_plotly_template()
+    
+    fig, display_df = _build_spike_chart(to_cache_key(spikes), template)
+    
     st.plotly_chart(fig, use_container_width=True)
     
     # 스파이크 상세 정보 테이블
     st.subheader("스파이크 상세 정보")
-    display_df = spike_df[["timestamp", "value", "score"]].copy()
-    display_df.columns = ["시간", "감정 점수", "스파이크 점수"]
-    display_df["스파이크 점수"] = display_df["스파이크 점수"].round(3)
-    display_df["감정 점수"] = display_df["감정 점수"].round(3)
-    st.dataframe(display_df, use_container_width=True)
-
+    st.dataframe(display_df, use_container_width=True, hide_index=True)
@@ -4,17 +4,160 @@ Storage 탭 컴포넌트
 
 import streamlit as st
 import pandas as pd
-import plotly.express as px
 from pathlib import Path
-from datetime import datetime
-from typing import Optional
+from typing import TYPE_CHECKING, Optional, Dict, List, Tuple
+import os
 import logging
 
-from src.utils.storage import DataStorage
+if TYPE_CHECKING:
+    from src.utils.storage import DataStorage
 
 logger = logging.getLogger(__name__)
 
 
+@st.cache_resource
+def _get_storage() -> "DataStorage":
+    """
+    DataStorage 인스턴스 생성 (세션 간 재사용)
+    
+    대시보드 첫 로딩 시간을 줄이기 위해 처음 사용할 때 import
+    
+    Returns:
+        DataStorage 인스턴스
+    """
+    from src.utils.storage import DataStorage
+    
+    return DataStorage()
+
+
+def _dir_size(path: str) -> int:
+    """
+    디렉토리 아래 모든 파일 크기 합계 (키워드 파티션 데이터셋용, 하위 디렉토리까지 재귀)
+    
+    Args:
+        path: 디렉토리 경로
+    
+    Returns:
+        바이트 단위 크기
+    """
+    total = 0
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                if entry.is_file():
+                    total += entry.stat().st_size
+                elif entry.is_dir():
+                    total += _dir_size(entry.path)
+    except FileNotFoundError:
+        pass
+    return total
+
+
+@st.cache_data(ttl=10, show_spinner=False)
+def _collect_file_sizes(paths: Tuple[str, ...]) -> List[Dict]:
+    """
+    저장소 파일 크기 조회
+    
+    파일마다 exists()/stat()을 호출하지 않고 디렉토리별로 scandir 한 번으로 조회
+    (경로가 데이터셋 디렉토리이면 파티션 파일 크기를 모두 합산)
+    
+    Args:
+        paths: 파일 또는 데이터셋 디렉토리 경로 튜플
+    
+    Returns:
+        파일 정보 딕셔너리 리스트
+    """
+    sizes: Dict[str, int] = {}
+    for parent in {os.path.dirname(path) for path in paths}:
+        try:
+            with os.scandir(parent or ".") as entries:
+                for entry in entries:
+                    if entry.is_file():
+                        sizes[os.path.join(parent, entry.name)] = entry.stat().st_size
+                    elif entry.is_dir():
+                        sizes[os.path.join(parent, entry.name)] = _dir_size(entry.path)
+        except FileNotFoundError:
+            continue
+    
+    files_info = []
+    for path in paths:
+        size_mb = sizes.get(path, 0) / (1024 * 1024)
+        files_info.append({
+            "파일": os.path.basename(path),
+            "경로": path,
+            "크기 (MB)": f"{size_mb:.2f}",
+        })
+    
+    return files_info
+
+
+# 증가량 추이에 표시할 기간 (일)
+GROWTH_DAYS = 7
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _growth_series(sources: Tuple[Tuple[str, str], ...], days: int = GROWTH_DAYS) -> pd.DataFrame:
+    """
+    저장된 Parquet 이력에서 일별 데이터 개수 집계
+    
+    DataStorage 로드 메서드로 읽어 (timestamp, keyword) 중복 제거와 이전 단일 파일을 반영한 뒤
+    일 단위로 집계하고, 마지막 데이터 기준 최근 days일만 남김
+    
+    Args:
+        sources: (데이터 타입 이름, DataStorage 로드 메서드 이름) 튜플
+        days: 집계할 기간 (일)
+    
+    Returns:
+        날짜 인덱스, 데이터 타입별 개수 컬럼의 DataFrame (데이터가 없으면 빈 DataFrame)
+    """
+    storage = _get_storage()
+    
+    counts = {}
+    for label, loader in sources:
+        df = getattr(storage, loader)()
+        if df.empty or "timestamp" not in df.columns:
+            continue
+        timestamps = df["timestamp"]
+        
+        dates = pd.to_datetime(timestamps, format="ISO8601", errors="coerce").dt.floor("D")
+        counts[label] = dates.value_counts()
+    
+    if not counts:
+        return pd.DataFrame()
+    
+    growth = pd.DataFrame(counts).sort_index().tail(days)
+    return growth.fillna(0).astype(int).rename_axis("날짜")
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _build_growth_fig(sources: Tuple[Tuple[str, str], ...], days: int = GROWTH_DAYS):
+    """
+    데이터 증가량 추이 차트 생성
+    
+    Args:
+        sources: (데이터 타입 이름, DataStorage 로드 메서드 이름) 튜플
+        days: 표시할 기간 (일)
+    
+    Returns:
+        Plotly Figure (데이터가 없으면 None)
+    """
+    growth_data = _growth_series(sources, days)
+    if growth_data.empty:
+        return None
+    
+    # plotly.express는 import 비용이 크므로 차트를 처음 그릴 때 로드
+    import plotly.express as px
+    
+    fig = px.line(
+        growth_data,
+        y=list(growth_data.columns),
+        title=f"데이터 증가량 추이 ({days}일)",
+        labels={"value": "개수", "variable": "데이터 타입"},
+    )
+    
+    return fig
+
+
 def display_storage():
     """
     Storage 탭 표시
@@ -22,31 +165,15 @@ def display_storage():
     st.subheader("💾 데이터 저장소 상태")
     
     try:
-        storage = DataStorage()
+        storage = _get_storage()
         
         # 파일 크기 확인
-        import os
-        
-        files_info = []
-        for file_path in [
-            storage.raw_path,
-            storage.clean_path,
-            storage.sentiment_path,
-            storage.spikes_path,
-        ]:
-            if file_path.exists():
-                size_mb = file_path.stat().st_size / (1024 * 1024)
-                files_info.append({
-                    "파일": file_path.name,
-                    "경로": str(file_path),
-                    "크기 (MB)": f"{size_mb:.2f}",
-                })
-            else:
-                files_info.append({
-                    "파일": file_path.name,
-                    "경로": str(file_path),
-                    "크기 (MB)": "0.00",
-                })
+        files_info = _collect_file_sizes((
+            str(storage.raw_path),
+            str(storage.clean_path),
+            str(storage.sentiment_path),
+            str(storage.spikes_path),
+        ))
         
         df = pd.DataFrame(files_info)
         st.dataframe(df, use_container_width=True)
@@ -54,23 +181,14 @@ def display_storage():
         # 데이터 증가량 그래프
         st.subheader("데이터 증가량 추이")
         
-        # 샘플 데이터 (실제로는 시간별 데이터 사용)
-        dates = pd.date_range(end=datetime.now(), periods=7, freq="D")
-        growth_data = pd.DataFrame({
-            "날짜": dates,
-            "뉴스 개수": [100, 150, 200, 180, 220, 250, 280],
-            "감정 분석 개수": [80, 120, 150, 140, 180, 200, 230],
-        })
-        
-        fig = px.line(
-            growth_data,
-            x="날짜",
-            y=["뉴스 개수", "감정 분석 개수"],
-            title="데이터 증가량 추이 (7일)",
-            labels={"value": "개수", "variable": "데이터 타입"},
-        )
-        
-        st.plotly_chart(fig, use_container_width=True)
+        growth_fig = _build_growth_fig((
+            ("감정 분석 개수", "load_sentiment_data"),
+            ("스파이크 개수", "load_spikes_data"),
+        ))
+        if growth_fig is None:
+            st.info("저장된 이력 데이터가 없습니다")
+        else:
+            st.plotly_chart(growth_fig, use_container_width=True)
     
     except Exception as e:
         logger.error(f"저장소 정보 조회 오류: {e}")
@@ -3,22 +3,24 @@
 """
 
 import streamlit as st
-from typing import Dict, Tuple
+import numpy as np
+import plotly.graph_objects as go
+import plotly.io as pio
+from functools import lru_cache
+from typing import Dict, List, Tuple
 
 
-def get_theme_colors() -> Dict[str, str]:
+@lru_cache(maxsize=2)
+def _colors_for(is_dark: bool) -> Dict[str, str]:
     """
-    현재 테마에 맞는 색상 반환
+    테마별 색상 딕셔너리 생성 (테마당 한 번만 생성하여 공유)
+    
+    Args:
+        is_dark: 다크 모드 여부
     
     Returns:
-        색상 딕셔너리 (bg_color, text_color, grid_color 등)
+        색상 딕셔너리 (공유 객체이므로 수정하지 않음)
     """
-    try:
-        theme = st.get_option("theme.base")
-        is_dark = theme == "dark"
-    except:
-        is_dark = False
-    
     if is_dark:
         return {
             "bg_color": "rgba(0,0,0,0)",
@@ -37,13 +39,75 @@ def get_theme_colors() -> Dict[str, str]:
         }
 
 
+def _is_dark_theme() -> bool:
+    """
+    현재 Streamlit 테마가 다크 모드인지 확인
+    
+    Returns:
+        다크 모드 여부
+    """
+    try:
+        return st.get_option("theme.base") == "dark"
+    except Exception:
+        return False
+
+
+def get_theme_colors() -> Dict[str, str]:
+    """
+    현재 테마에 맞는 색상 반환
+    
+    Returns:
+        색상 딕셔너리 (bg_color, text_color, grid_color 등)
+    """
+    return _colors_for(_is_dark_theme())
+
+
+@lru_cache(maxsize=2)
+def _register_plotly_template(is_dark: bool) -> str:
+    """
+    테마 색상을 Plotly 템플릿으로 등록 (테마당 한 번만 등록)
+    
+    기본 "plotly" 템플릿 위에 배경/글자/격자/범례 색상만 덮어씀
+    
+    Args:
+        is_dark: 다크 모드 여부
+    
+    Returns:
+        등록된 템플릿 이름
+    """
+    colors = _colors_for(is_dark)
+    template = go.layout.Template(pio.templates["plotly"])
+    template.layout.update(
+        plot_bgcolor=colors["plot_bgcolor"],
+        paper_bgcolor=colors["paper_bgcolor"],
+        font=dict(color=colors["text_color"]),
+        xaxis=dict(gridcolor=colors["grid_color"]),
+        yaxis=dict(gridcolor=colors["grid_color"]),
+        legend=dict(bgcolor=colors["bg_color"]),
+    )
+    
+    name = "app_dark" if is_dark else "app_light"
+    pio.templates[name] = template
+    return name
+
+
+def get_plotly_template() -> str:
+    """
+    현재 테마에 맞는 Plotly 템플릿 이름 반환
+    
+    Returns:
+        fig.update_layout(template=...)에 전달할 템플릿 이름
+    """
+    return _register_plotly_template(_is_dark_theme())
+
+
 def get_sentiment_color(sentiment_score: float) -> Tuple[str, str]:
     """
     감정 점수에 따른 색상 반환
     
     Args:
         sentiment_score: 감정 점수 (0.0 ~ 1.0)
-        
+    
     Returns:
         (배경색, 이모지) 튜플
     """
@@ -62,7 +126,7 @@ def get_spike_color(score: float, is_top_5: bool = False) -> Tuple[str, str, int
     Args:
         score: 스파이크 점수
         is_top_5: 상위 5개 여부
-        
+    
     Returns:
         (색상, 테두리 색상, 테두리 두께) 튜플
     """
@@ -81,3 +145,24 @@ def get_spike_color(score: float, is_top_5: bool = False) -> Tuple[str, str, int
         else:
             return ("yellow", "white", 1)
 
+
+def get_spike_colors_vec(scores: np.ndarray, is_top_5: np.ndarray) -> Tuple[List[str], List[str], List[int]]:
+    """
+    스파이크 점수 배열에 대한 색상을 한 번에 계산 (get_spike_color의 벡터화 버전)
+    
+    Args:
+        scores: 스파이크 점수 배열
+        is_top_5: 상위 5개 여부 불리언 배열
+    
+    Returns:
+        (색상 리스트, 테두리 색상 리스트, 테두리 두께 리스트) 튜플
+    """
+    conditions = [scores > 3.0, scores > 2.5]
+    top_colors = np.select(conditions, ["darkred", "darkorange"], default="gold")
+    other_colors = np.select(conditions, ["red", "orange"], default="yellow")
+    
+    colors = np.where(is_top_5, top_colors, other_colors)
+    line_colors = np.where(is_top_5, "black", "white")
+    line_widths = np.where(is_top_5, 3, 1)
+    
+    return colors.tolist(), line_colors.tolist(), line_widths.tolist()
@@ -15,7 +15,6 @@ class SidebarState:
     should_analyze: bool
     should_refresh: bool
     auto_refresh: bool
-    smoothing: bool
     api_url: str
 
 
@@ -78,17 +77,6 @@ def render_sidebar() -> SidebarState:
     if auto_refresh:
         st.info("30초마다 자동으로 새로고침됩니다")
     
-    st.divider()
-    
-    # 차트 옵션
-    st.subheader("📊 차트 옵션")
-    smoothing = st.checkbox(
-        "스무딩 적용",
-        value=st.session_state.get("smoothing", False),
-        help="이동 평균을 사용하여 차트를 부드럽게 표시",
-    )
-    st.session_state.smoothing = smoothing
-    
     return SidebarState(
         keyword=keyword,
         max_results=max_results,
@@ -96,7 +84,6 @@ def render_sidebar() -> SidebarState:
         should_analyze=analyze_button,
         should_refresh=refresh_button,
         auto_refresh=auto_refresh,
-        smoothing=smoothing,
         api_url=api_url_input,
     )
 
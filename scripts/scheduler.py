@@ -6,15 +6,27 @@ RSS/Google News를 주기적으로 수집하여 데이터 업데이트
 
 import argparse
 import asyncio
-import json
+import os
 import signal
 import sys
 import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import List, Dict, Optional
 import multiprocessing as mp
 
+import httpx
+import orjson
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+    pq = None
+
 # 프로젝트 루트를 Python 경로에 추가
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
@@ -25,9 +37,32 @@ import logging
 from src.data.rss_collector import RSSCollector
 from src.data.google_news_collector import GoogleNewsCollector
 from src.data.text_cleaner import TextCleaner
+from src.utils.hashing import hash_bytes
 
 logger = setup_logger("scheduler", level=logging.INFO)
 
+# 비동기 수집 HTTP 클라이언트 설정
+HTTP_TIMEOUT = 10.0
+HTTP_MAX_CONNECTIONS = 50
+
+# 수집 주기 간 중복 제거를 위해 기억할 최대 링크 해시 수
+SEEN_LINKS_MAX = 100_000
+
+# Parquet 저장 스키마 (수집기 출력 + 전처리 컬럼)
+NEWS_SCHEMA = pa.schema([
+    ("title", pa.string()),
+    ("link", pa.string()),
+    ("pubDate", pa.string()),
+    ("summary", pa.string()),
+    ("media", pa.string()),
+    ("category", pa.string()),
+    ("source", pa.string()),
+    ("keyword", pa.string()),
+    ("collected_at", pa.string()),
+    ("title_cleaned", pa.string()),
+    ("summary_cleaned", pa.string()),
+]) if pa is not None else None
+
 
 class NewsScheduler:
     """뉴스 수집 스케줄러 클래스"""
@@ -39,6 +74,8 @@ class NewsScheduler:
         output_file: str = "data/processed/news.jsonl",
         config_path: Optional[str] = None,
         use_async: bool = True,
+        output_format: str = "parquet",
+        config: Optional[Dict] = None,
     ):
         """
         스케줄러 초기화
@@ -46,9 +83,11 @@ class NewsScheduler:
         Args:
             keywords: 수집할 키워드 리스트
             interval_seconds: 수집 간격 (초)
-            output_file: 출력 파일 경로 (JSONL 형식)
+            output_file: 출력 파일 경로 (JSONL 형식, Parquet은 같은 디렉토리에 실행별 파일로 저장)
             config_path: 설정 파일 경로
             use_async: 비동기 모드 사용 여부
+            output_format: 저장 형식 ("parquet" 또는 "jsonl")
+            config: 이미 로드한 설정 딕셔너리 (주어지면 config_path를 다시 읽지 않음)
         """
         self.keywords = keywords
         self.interval_seconds = interval_seconds
@@ -57,16 +96,33 @@ class NewsScheduler:
         self.use_async = use_async
         self.running = True
         
-        # 설정 로드
-        if config_path:
+        # Parquet 저장 설정 (pyarrow가 없으면 JSONL로 대체)
+        if output_format == "parquet" and pq is None:
+            logger.warning("pyarrow가 설치되지 않아 JSONL 형식으로 저장합니다")
+            output_format = "jsonl"
+        self.output_format = output_format
+        # Parquet 파일은 append가 불가능하므로 실행마다 별도 파일에 row group 단위로 기록
+        self.parquet_file = self.output_file.with_name(
+            f"{self.output_file.stem}-{datetime.now():%Y%m%d%H%M%S}-{os.getpid()}.parquet"
+        )
+        self._parquet_writer = None
+        
+        # 설정 로드 (한 번만 파싱하여 수집기에 전달)
+        if config is None and config_path:
             try:
                 config = load_config(config_path)
+            except Exception as e:
+                logger.warning(f"설정 파일 로드 실패, 기본값 사용: {e}")
+        
+        if config is not None:
+            try:
                 collector_config = config.get("collector", {})
                 rss_urls = collector_config.get("rss_urls", [])
                 google_news_config = collector_config.get("google_news", {})
                 api_key = google_news_config.get("api_key")
             except Exception as e:
-                logger.warning(f"설정 파일 로드 실패, 기본값 사용: {e}")
+                logger.warning(f"설정 파일 형식 오류, 기본값 사용: {e}")
+                config = None
                 rss_urls = []
                 api_key = None
         else:
@@ -74,31 +130,39 @@ class NewsScheduler:
             api_key = None
         
         # 수집기 초기화
-        self.rss_collector = RSSCollector(rss_urls=rss_urls, config_path=config_path)
-        self.google_collector = GoogleNewsCollector(api_key=api_key, config_path=config_path)
-        self.text_cleaner = TextCleaner()
+        self.rss_collector = RSSCollector(rss_urls=rss_urls, config=config)
+        self.google_collector = GoogleNewsCollector(api_key=api_key, config=config)
+        # 배치 작업이므로 큰 배치 정제는 CPU 코어 수만큼 프로세스 풀로 병렬 처리
+        self.text_cleaner = TextCleaner(n_jobs=None)
+        
+        # 이전 주기에 저장한 (키워드, 링크)의 64비트 해시 (deque 순서로 오래된 항목부터 제거)
+        self._seen_hashes: set = set()
+        self._seen_order: deque = deque()
         
         logger.info(f"스케줄러 초기화 완료: {len(keywords)}개 키워드, {interval_seconds}초 간격")
     
-    def collect_news(self, keyword: str) -> List[Dict]:
+    def collect_news(self, keyword: str, rss_news: Optional[List[Dict]] = None) -> List[Dict]:
         """
         단일 키워드 뉴스 수집
         
         Args:
             keyword: 수집할 키워드
+            rss_news: 미리 수집한 이 키워드의 RSS 결과 (None이면 RSS 피드를 직접 수집)
             
         Returns:
             수집된 뉴스 리스트
         """
         all_news = []
         
-        try:
-            # RSS 수집
-            rss_news = self.rss_collector.collect(keyword=keyword, max_results=50)
-            all_news.extend(rss_news)
-            logger.info(f"RSS에서 {len(rss_news)}개 뉴스 수집: {keyword}")
-        except Exception as e:
-            logger.error(f"RSS 수집 오류 ({keyword}): {e}")
+        if rss_news is None:
+            try:
+                # RSS 수집
+                rss_news = self.rss_collector.collect(keyword=keyword, max_results=50)
+            except Exception as e:
+                logger.error(f"RSS 수집 오류 ({keyword}): {e}")
+                rss_news = []
+        all_news.extend(rss_news)
+        logger.info(f"RSS에서 {len(rss_news)}개 뉴스 수집: {keyword}")
         
         try:
             # Google News 수집
@@ -108,51 +172,150 @@ class NewsScheduler:
         except Exception as e:
             logger.error(f"Google News 수집 오류 ({keyword}): {e}")
         
-        # 중복 제거 및 전처리
-        seen_links = set()
+        return self._postprocess(all_news)
+    
+    def _postprocess(self, all_news: List[Dict]) -> List[Dict]:
+        """
+        수집 결과 중복 제거 및 텍스트 정제
+        
+        이전 수집 주기에 같은 키워드로 저장한 링크도 제외 (최근 SEEN_LINKS_MAX개 해시 기준,
+        여러 키워드에 걸린 기사는 행마다 keyword가 다르므로 키워드별로 한 번씩 저장)
+        
+        Args:
+            all_news: 수집기별 결과를 합친 뉴스 리스트
+            
+        Returns:
+            전처리된 뉴스 리스트
+        """
+        seen_hashes = self._seen_hashes
+        seen_order = self._seen_order
         unique_news = []
         
         for item in all_news:
             link = item.get("link", "")
-            if link and link not in seen_links:
-                seen_links.add(link)
-                # 텍스트 정제
-                item["title_cleaned"] = self.text_cleaner.clean_text(item.get("title", ""))
-                item["summary_cleaned"] = self.text_cleaner.clean_text(item.get("summary", ""))
+            if not link:
+                continue
+            # 긴 URL 문자열 대신 (키워드, 링크)의 고정 크기 정수 해시를 키로 사용
+            h = hash_bytes(f"{item.get('keyword', '')}\0{link}".encode())
+            if h not in seen_hashes:
+                seen_hashes.add(h)
+                seen_order.append(h)
+                if len(seen_order) > SEEN_LINKS_MAX:
+                    seen_hashes.discard(seen_order.popleft())
                 item["collected_at"] = datetime.now().isoformat()
                 unique_news.append(item)
         
+        # 텍스트 정제 (전체 제목/요약을 한 배치로 넘겨 큰 수집 결과는 병렬 처리)
+        texts = []
+        for item in unique_news:
+            texts.append(item.get("title", ""))
+            texts.append(item.get("summary", ""))
+        cleaned = self.text_cleaner.clean_batch(texts)
+        for i, item in enumerate(unique_news):
+            item["title_cleaned"] = cleaned[2 * i]
+            item["summary_cleaned"] = cleaned[2 * i + 1]
+        
         return unique_news
     
-    async def collect_news_async(self, keyword: str) -> List[Dict]:
+    async def collect_news_async(self, client: httpx.AsyncClient, keyword: str) -> List[Dict]:
         """
-        비동기 뉴스 수집
+        비동기 뉴스 수집 (RSS와 Google News를 동시에 요청)
         
         Args:
+            client: 공유 비동기 HTTP 클라이언트
             keyword: 수집할 키워드
             
         Returns:
             수집된 뉴스 리스트
         """
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.collect_news, keyword)
+        rss_news, google_news = await asyncio.gather(
+            self.rss_collector.collect_async(client, keyword=keyword, max_results=50),
+            self.google_collector.collect_async(client, keyword=keyword, max_results=50),
+            return_exceptions=True,
+        )
+        return self._merge_results(keyword, rss_news, google_news)
+    
+    def _merge_results(self, keyword: str, rss_news, google_news) -> List[Dict]:
+        """
+        수집기별 비동기 결과 병합 (예외 결과는 로그만 남기고 제외)
+        
+        Args:
+            keyword: 수집한 키워드
+            rss_news: RSS 결과 리스트 또는 예외
+            google_news: Google News 결과 리스트 또는 예외
+            
+        Returns:
+            전처리된 뉴스 리스트
+        """
+        all_news = []
+        if isinstance(rss_news, Exception):
+            logger.error(f"RSS 수집 오류 ({keyword}): {rss_news}")
+        else:
+            all_news.extend(rss_news)
+            logger.info(f"RSS에서 {len(rss_news)}개 뉴스 수집: {keyword}")
+        
+        if isinstance(google_news, Exception):
+            logger.error(f"Google News 수집 오류 ({keyword}): {google_news}")
+        else:
+            all_news.extend(google_news)
+            logger.info(f"Google News에서 {len(google_news)}개 뉴스 수집: {keyword}")
+        
+        return self._postprocess(all_news)
     
     def save_news(self, news_items: List[Dict]):
         """
-        뉴스를 JSONL 파일에 저장
+        뉴스를 Parquet(row group 추가) 또는 JSONL 파일에 저장
         
         Args:
             news_items: 저장할 뉴스 리스트
         """
         try:
-            with open(self.output_file, "a", encoding="utf-8") as f:
-                for item in news_items:
-                    json.dump(item, f, ensure_ascii=False)
-                    f.write("\n")
-            logger.info(f"{len(news_items)}개 뉴스 저장 완료: {self.output_file}")
+            if self.output_format == "parquet":
+                if self._parquet_writer is None:
+                    self._parquet_writer = pq.ParquetWriter(
+                        self.parquet_file,
+                        NEWS_SCHEMA,
+                        compression="snappy",
+                    )
+                table = pa.Table.from_pylist(news_items, schema=NEWS_SCHEMA)
+                self._parquet_writer.write_table(table)
+                output = self.parquet_file
+            else:
+                # 배치 단위로 한 번에 인코딩하여 append
+                payload = b"\n".join(orjson.dumps(item) for item in news_items) + b"\n"
+                with open(self.output_file, "ab") as f:
+                    f.write(payload)
+                output = self.output_file
+            logger.info(f"{len(news_items)}개 뉴스 저장 완료: {output}")
         except Exception as e:
             logger.error(f"뉴스 저장 오류: {e}")
     
+    def close(self):
+        """Parquet writer 종료 (파일 footer 기록), HTTP 연결 및 텍스트 정제 워커 정리"""
+        if self._parquet_writer is not None:
+            self._parquet_writer.close()
+            self._parquet_writer = None
+            logger.info(f"Parquet 파일 저장 완료: {self.parquet_file}")
+        self.rss_collector.close()
+        self.text_cleaner.close()
+    
+    def _time_until(self, deadline: float) -> float:
+        """
+        다음 수집 마감 시각까지 남은 대기 시간 계산
+        
+        Args:
+            deadline: time.monotonic() 기준 마감 시각
+            
+        Returns:
+            대기 시간 (초, 이미 지났으면 0)
+        """
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            logger.warning(f"수집이 수집 간격({self.interval_seconds}초)보다 오래 걸려 바로 다음 수집을 시작합니다")
+            return 0.0
+        logger.info(f"다음 수집까지 {remaining:.1f}초 대기...")
+        return remaining
+    
     @log_execution_time(logger)
     def run_sync(self):
         """동기 모드 실행"""
@@ -160,8 +323,18 @@ class NewsScheduler:
         
         while self.running:
             try:
+                # 수집 시작 시점 기준 마감 시각 (작업 시간만큼 주기가 밀리지 않도록 함)
+                deadline = time.monotonic() + self.interval_seconds
+                
+                # RSS 피드는 주기당 한 번만 받아 모든 키워드와 대조
+                try:
+                    rss_by_keyword = self.rss_collector.collect_multi(self.keywords, max_results=50)
+                except Exception as e:
+                    logger.error(f"RSS 수집 오류: {e}")
+                    rss_by_keyword = {keyword: [] for keyword in self.keywords}
+                
                 for keyword in self.keywords:
-                    news_items = self.collect_news(keyword)
+                    news_items = self.collect_news(keyword, rss_news=rss_by_keyword.get(keyword, []))
                     if news_items:
                         self.save_news(news_items)
                     
@@ -169,8 +342,7 @@ class NewsScheduler:
                     time.sleep(1)
                 
                 # 다음 수집까지 대기
-                logger.info(f"다음 수집까지 {self.interval_seconds}초 대기...")
-                time.sleep(self.interval_seconds)
+                time.sleep(self._time_until(deadline))
             
             except KeyboardInterrupt:
                 logger.info("스케줄러 종료 요청")
@@ -184,51 +356,122 @@ class NewsScheduler:
         """비동기 모드 실행"""
         logger.info("비동기 모드로 스케줄러 시작")
         
-        while self.running:
-            try:
-                tasks = [self.collect_news_async(keyword) for keyword in self.keywords]
-                results = await asyncio.gather(*tasks, return_exceptions=True)
-                
-                for keyword, result in zip(self.keywords, results):
-                    if isinstance(result, Exception):
-                        logger.error(f"수집 오류 ({keyword}): {result}")
-                    elif result:
-                        self.save_news(result)
+        # 실행 동안 커넥션 풀을 공유하는 HTTP 클라이언트
+        async with httpx.AsyncClient(
+            timeout=HTTP_TIMEOUT,
+            limits=httpx.Limits(max_connections=HTTP_MAX_CONNECTIONS),
+        ) as client:
+            while self.running:
+                try:
+                    # 수집 시작 시점 기준 마감 시각
+                    deadline = time.monotonic() + self.interval_seconds
+                    
+                    # RSS 피드는 주기당 한 번만 받아 모든 키워드와 대조, Google News는 키워드별 요청
+                    rss_by_keyword, *google_results = await asyncio.gather(
+                        self.rss_collector.collect_multi_async(client, self.keywords, max_results=50),
+                        *(
+                            self.google_collector.collect_async(client, keyword=keyword, max_results=50)
+                            for keyword in self.keywords
+                        ),
+                        return_exceptions=True,
+                    )
+                    
+                    for keyword, google_news in zip(self.keywords, google_results):
+                        rss_news = (
+                            rss_by_keyword if isinstance(rss_by_keyword, Exception)
+                            else rss_by_keyword.get(keyword, [])
+                        )
+                        result = self._merge_results(keyword, rss_news, google_news)
+                        if result:
+                            self.save_news(result)
+                    
+                    # 다음 수집까지 대기
+                    await asyncio.sleep(self._time_until(deadline))
                 
-                # 다음 수집까지 대기
-                logger.info(f"다음 수집까지 {self.interval_seconds}초 대기...")
-                await asyncio.sleep(self.interval_seconds)
-            
-            except KeyboardInterrupt:
-                logger.info("스케줄러 종료 요청")
-                self.running = False
-                break
-            except Exception as e:
-                logger.error(f"스케줄러 실행 오류: {e}")
-                await asyncio.sleep(5)
+                except KeyboardInterrupt:
+                    logger.info("스케줄러 종료 요청")
+                    self.running = False
+                    break
+                except Exception as e:
+                    logger.error(f"스케줄러 실행 오류: {e}")
+                    await asyncio.sleep(5)
     
     def run(self):
         """스케줄러 실행"""
-        if self.use_async:
-            asyncio.run(self.run_async())
-        else:
-            self.run_sync()
+        try:
+            if self.use_async:
+                asyncio.run(self.run_async())
+            else:
+                self.run_sync()
+        finally:
+            self.close()
     
     def stop(self):
         """스케줄러 중지"""
         self.running = False
+        self.close()
         logger.info("스케줄러 중지됨")
 
 
+# 프로세스 풀 워커별 스케줄러 (_init_worker에서 프로세스당 한 번 생성)
+_worker_scheduler: Optional[NewsScheduler] = None
+
+
+def _init_worker(
+    interval_seconds: int,
+    output_file: str,
+    config: Optional[Dict],
+    output_format: str,
+):
+    """
+    프로세스 풀 워커 초기화 (스케줄러 생성 및 종료 신호 처리 등록)
+    
+    Args:
+        interval_seconds: 수집 간격
+        output_file: 출력 파일 경로
+        config: 부모 프로세스에서 로드한 설정 딕셔너리
+        output_format: 저장 형식 ("parquet" 또는 "jsonl")
+    """
+    global _worker_scheduler
+    _worker_scheduler = NewsScheduler(
+        keywords=[],
+        interval_seconds=interval_seconds,
+        output_file=output_file,
+        use_async=True,
+        output_format=output_format,
+        config=config,
+    )
+    # 이미 키워드 묶음별 프로세스로 나뉘어 있으므로 텍스트 정제는 워커 안에서 순차 처리
+    _worker_scheduler.text_cleaner.n_jobs = 1
+    
+    # SIGTERM 수신 시 SystemExit로 run()의 finally를 거쳐 파일을 닫고 종료
+    def signal_handler(sig, frame):
+        sys.exit(0)
+    
+    signal.signal(signal.SIGTERM, signal_handler)
+
+
+def _run_worker(keywords: List[str]):
+    """
+    워커 프로세스의 스케줄러로 키워드 묶음 수집 실행
+    
+    Args:
+        keywords: 이 워커가 담당할 키워드 리스트
+    """
+    _worker_scheduler.keywords = keywords
+    _worker_scheduler.run()
+
+
 def run_multiprocess(
     keywords: List[str],
     interval_seconds: int,
     output_file: str,
     config_path: Optional[str],
     num_processes: int = 2,
+    output_format: str = "parquet",
 ):
     """
-    멀티프로세싱 모드 실행
+    멀티프로세싱 모드 실행 (키워드를 num_processes개 묶음으로 나눠 프로세스 풀에서 실행)
     
     Args:
         keywords: 수집할 키워드 리스트
@@ -236,40 +479,48 @@ def run_multiprocess(
         output_file: 출력 파일 경로
         config_path: 설정 파일 경로
         num_processes: 프로세스 개수
+        output_format: 저장 형식 ("parquet" 또는 "jsonl")
     """
-    def worker(keyword: str):
-        """워커 함수"""
-        scheduler = NewsScheduler(
-            keywords=[keyword],
-            interval_seconds=interval_seconds,
-            output_file=output_file,
-            config_path=config_path,
-            use_async=False,
-        )
-        scheduler.run()
+    num_workers = max(1, min(num_processes, len(keywords)))
+    logger.info(f"멀티프로세싱 모드 시작: {num_workers}개 프로세스")
     
-    logger.info(f"멀티프로세싱 모드 시작: {num_processes}개 프로세스")
+    # 키워드를 프로세스에 고르게 분배
+    chunks = [keywords[i::num_workers] for i in range(num_workers)]
     
-    # 키워드를 프로세스에 분배
-    processes = []
-    for i, keyword in enumerate(keywords):
-        p = mp.Process(target=worker, args=(keyword,))
-        p.start()
-        processes.append(p)
+    # 설정 파일은 부모 프로세스에서 한 번만 파싱하여 워커에 전달
+    config = None
+    if config_path:
+        try:
+            config = load_config(config_path)
+        except Exception as e:
+            logger.warning(f"설정 파일 로드 실패, 기본값 사용: {e}")
+    
+    executor = ProcessPoolExecutor(
+        max_workers=num_workers,
+        initializer=_init_worker,
+        initargs=(interval_seconds, output_file, config, output_format),
+    )
+    futures = [executor.submit(_run_worker, chunk) for chunk in chunks]
     
     # 종료 신호 처리
     def signal_handler(sig, frame):
         logger.info("종료 신호 수신")
-        for p in processes:
+        executor.shutdown(wait=False, cancel_futures=True)
+        for p in mp.active_children():
             p.terminate()
         sys.exit(0)
     
     signal.signal(signal.SIGINT, signal_handler)
     signal.signal(signal.SIGTERM, signal_handler)
     
-    # 프로세스 대기
-    for p in processes:
-        p.join()
+    # 워커 대기
+    for chunk, future in zip(chunks, futures):
+        try:
+            future.result()
+        except Exception as e:
+            logger.error(f"워커 실행 오류 ({', '.join(chunk)}): {e}")
+    
+    executor.shutdown()
 
 
 def main():
@@ -312,6 +563,13 @@ def main():
         choices=["sync", "async", "multiprocess"],
         help="실행 모드: sync, async, multiprocess",
     )
+    parser.add_argument(
+        "--format",
+        type=str,
+        default="parquet",
+        choices=["parquet", "jsonl"],
+        help="저장 형식: parquet (pyarrow 필요, 없으면 jsonl), jsonl",
+    )
     parser.add_argument(
         "--processes",
         type=int,
@@ -328,6 +586,7 @@ def main():
             output_file=args.output,
             config_path=args.config,
             num_processes=args.processes,
+            output_format=args.format,
         )
     else:
         scheduler = NewsScheduler(
@@ -336,6 +595,7 @@ def main():
             output_file=args.output,
             config_path=args.config,
             use_async=(args.mode == "async"),
+            output_format=args.format,
         )
         
         # 종료 신호 처리
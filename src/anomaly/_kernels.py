@@ -0,0 +1,166 @@
+"""
+이상치 감지 수치 커널
+Numba가 설치되어 있으면 단일 루프로 JIT 컴파일하고, 없으면 NumPy 벡터 연산을 사용
+"""
+
+import numpy as np
+from typing import Optional, Tuple
+
+try:
+    from numba import njit
+except ImportError:  # 선택적 의존성 (없으면 NumPy 구현 사용)
+    njit = None
+
+
+def column_values(data, column: Optional[str] = None) -> Optional[np.ndarray]:
+    """
+    감지기 입력(데이터프레임 또는 값 배열)을 C 연속 float64 배열로 변환
+    
+    Args:
+        data: 시계열 데이터프레임 또는 1차원 값 배열
+        column: 데이터프레임일 때 분석할 컬럼명 (배열이면 무시)
+    
+    Returns:
+        값 배열 (데이터프레임에 컬럼이 없으면 None)
+    """
+    if isinstance(data, np.ndarray):
+        return np.ascontiguousarray(data, dtype=np.float64)
+    if column not in data.columns:
+        return None
+    return np.ascontiguousarray(data[column].to_numpy(dtype=np.float64, na_value=np.nan))
+
+
+def _mean_std_loop(values: np.ndarray) -> Tuple[float, float]:
+    """
+    Welford 방식 단일 패스 평균/모집단 표준편차 계산 (Numba 컴파일 대상)
+    
+    합계/제곱합 방식(E[x²] - E[x]²)과 달리 값의 크기가 커도 상쇄 오차가 생기지 않음
+    
+    Args:
+        values: 값 배열 (결측값 없음)
+    
+    Returns:
+        (평균, 표준편차) 튜플 (빈 배열이면 (0.0, 0.0))
+    """
+    n = values.size
+    if n == 0:
+        return 0.0, 0.0
+    
+    mean = 0.0
+    m2 = 0.0
+    for i in range(n):
+        delta = values[i] - mean
+        mean += delta / (i + 1)
+        m2 += delta * (values[i] - mean)
+    
+    return mean, np.sqrt(m2 / n)
+
+
+def _is_constant_loop(values: np.ndarray) -> bool:
+    """
+    모든 값이 같은지 확인 (처음으로 다른 값을 만나면 바로 종료, Numba 컴파일 대상)
+    
+    Args:
+        values: 값 배열 (결측값 없음)
+    
+    Returns:
+        빈 배열이거나 모든 값이 같으면 True
+    """
+    for i in range(1, values.size):
+        if values[i] != values[0]:
+            return False
+    return True
+
+
+def _zscore_mask_loop(values: np.ndarray, threshold: float) -> np.ndarray:
+    """
+    |z| > threshold 마스크 계산 (Welford 방식으로 평균/분산을 한 번에 구한 뒤 비교, Numba 컴파일 대상)
+    
+    Args:
+        values: 값 배열 (결측값 없음)
+        threshold: Z-score 임계값
+    
+    Returns:
+        이상치 여부 bool 배열 (표준편차가 0이면 모두 False)
+    """
+    out = np.zeros(values.size, np.bool_)
+    mean, std = mean_std_welford(values)
+    if std == 0:
+        return out
+    
+    for i in range(values.size):
+        out[i] = abs((values[i] - mean) / std) > threshold
+    return out
+
+
+def _deviation_mask_loop(
+    values: np.ndarray,
+    baseline: np.ndarray,
+    scale: np.ndarray,
+    threshold: float,
+) -> np.ndarray:
+    """
+    |values - baseline| / scale > threshold 마스크 계산 (Numba 컴파일 대상)
+    
+    Args:
+        values: 값 배열
+        baseline: 기준값 배열 (NaN인 위치는 False)
+        scale: 위치별 정규화 스케일 배열 (0 이하 또는 NaN인 위치는 False)
+        threshold: 임계값
+    
+    Returns:
+        이상치 여부 bool 배열
+    """
+    out = np.zeros(values.size, np.bool_)
+    for i in range(values.size):
+        if scale[i] > 0:
+            out[i] = abs(values[i] - baseline[i]) / scale[i] > threshold
+    return out
+
+
+def _mean_std_numpy(values: np.ndarray) -> Tuple[float, float]:
+    """_mean_std_loop의 NumPy 구현 (np.std는 평균을 뺀 편차로 계산하므로 상쇄 오차 없음)"""
+    if values.size == 0:
+        return 0.0, 0.0
+    return float(np.mean(values)), float(np.std(values))
+
+
+def _is_constant_numpy(values: np.ndarray) -> bool:
+    """_is_constant_loop의 NumPy 구현 (양 끝 값이 다르면 전체 비교 없이 바로 False)"""
+    if values.size == 0:
+        return True
+    if values[-1] != values[0]:
+        return False
+    return bool((values == values[0]).all())
+
+
+def _zscore_mask_numpy(values: np.ndarray, threshold: float) -> np.ndarray:
+    """_zscore_mask_loop의 NumPy 구현 (Numba가 없을 때 사용)"""
+    std = np.std(values) if values.size else 0.0
+    if std == 0:
+        return np.zeros(values.size, dtype=bool)
+    return np.abs((values - np.mean(values)) / std) > threshold
+
+
+def _deviation_mask_numpy(
+    values: np.ndarray,
+    baseline: np.ndarray,
+    scale: np.ndarray,
+    threshold: float,
+) -> np.ndarray:
+    """_deviation_mask_loop의 NumPy 구현 (Numba가 없을 때 사용)"""
+    safe_scale = np.where(scale > 0, scale, np.nan)
+    return np.abs(values - baseline) / safe_scale > threshold
+
+
+# Numba가 있으면 루프 커널을 JIT 컴파일 (cache=True로 컴파일 결과를 디스크에 보관)
+if njit is not None:
+    is_constant = njit(cache=True)(_is_constant_loop)
+    mean_std_welford = njit(cache=True)(_mean_std_loop)
+    zscore_mask = njit(cache=True)(_zscore_mask_loop)
+    deviation_mask = njit(cache=True)(_deviation_mask_loop)
+else:
+    is_constant = _is_constant_numpy
+    mean_std_welford = _mean_std_numpy
+    zscore_mask = _zscore_mask_numpy
+    deviation_mask = _deviation_mask_numpy
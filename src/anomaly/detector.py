@@ -4,9 +4,11 @@ Z-score, ESD test, Moving Average Deviation 등 다양한 방법 구현
 """
 
 import numpy as np
-from typing import List, Dict, Tuple
+from typing import List, Dict, Tuple, Union
 import logging
 
+from src.anomaly._kernels import is_constant
+
 logger = logging.getLogger(__name__)
 
 
@@ -23,28 +25,36 @@ class AnomalyDetector:
         self.method = method
         logger.info(f"이상치 감지기 초기화 완료: {method}")
     
-    def detect(self, values: List[float], threshold: float = 2.0) -> List[bool]:
+    def detect(
+        self,
+        values: List[float],
+        threshold: float = 2.0,
+        as_list: bool = True,
+    ) -> Union[List[bool], np.ndarray]:
         """
         이상치 감지
         
         Args:
             values: 시계열 값 리스트
             threshold: 임계값
+            as_list: True면 파이썬 리스트, False면 NumPy bool 배열 반환
             
         Returns:
-            이상치 여부 리스트 (True=이상치)
+            이상치 여부 리스트 또는 bool 배열 (True=이상치)
         """
         if self.method == "zscore":
-            return self._detect_zscore(values, threshold)
+            anomalies = self._detect_zscore(values, threshold)
         elif self.method == "esd":
-            return self._detect_esd(values, threshold)
+            anomalies = self._detect_esd(values, threshold)
         elif self.method == "moving_avg":
-            return self._detect_moving_avg(values, threshold)
+            anomalies = self._detect_moving_avg(values, threshold)
         else:
             logger.warning(f"알 수 없는 방법: {self.method}, zscore 사용")
-            return self._detect_zscore(values, threshold)
+            anomalies = self._detect_zscore(values, threshold)
+        
+        return anomalies.tolist() if as_list else anomalies
     
-    def _detect_zscore(self, values: List[float], threshold: float) -> List[bool]:
+    def _detect_zscore(self, values: List[float], threshold: float) -> np.ndarray:
         """
         Z-score 기반 이상치 감지
         
@@ -53,25 +63,30 @@ class AnomalyDetector:
             threshold: Z-score 임계값
             
         Returns:
-            이상치 여부 리스트
+            이상치 여부 bool 배열
         """
         if len(values) < 2:
-            return [False] * len(values)
+            return np.zeros(len(values), dtype=bool)
+        
+        arr = np.asarray(values, dtype=float)
+        
+        # 값이 모두 같으면 표준편차 계산 없이 종료
+        if is_constant(arr):
+            return np.zeros(len(values), dtype=bool)
         
-        arr = np.array(values)
         mean = np.mean(arr)
         std = np.std(arr)
         
         if std == 0:
-            return [False] * len(values)
+            return np.zeros(len(values), dtype=bool)
         
         z_scores = np.abs((arr - mean) / std)
         anomalies = z_scores > threshold
         
         logger.debug(f"Z-score 감지: {np.sum(anomalies)}개 이상치 발견")
-        return anomalies.tolist()
+        return anomalies
     
-    def _detect_esd(self, values: List[float], threshold: float) -> List[bool]:
+    def _detect_esd(self, values: List[float], threshold: float) -> np.ndarray:
         """
         ESD (Extreme Studentized Deviate) 테스트 기반 이상치 감지
         
@@ -80,30 +95,31 @@ class AnomalyDetector:
             threshold: 임계값
             
         Returns:
-            이상치 여부 리스트
+            이상치 여부 bool 배열
         """
         if len(values) < 3:
-            return [False] * len(values)
+            return np.zeros(len(values), dtype=bool)
+        
+        arr = np.asarray(values, dtype=float)
         
-        arr = np.array(values)
-        anomalies = [False] * len(values)
+        # 값이 모두 같으면 표준편차 계산 없이 종료
+        if is_constant(arr):
+            return np.zeros(len(values), dtype=bool)
         
         # 간단한 ESD 구현
         mean = np.mean(arr)
         std = np.std(arr)
         
         if std == 0:
-            return anomalies
+            return np.zeros(len(values), dtype=bool)
         
-        for i, val in enumerate(arr):
-            z_score = abs((val - mean) / std)
-            if z_score > threshold:
-                anomalies[i] = True
+        # 원소별 루프 대신 한 번의 벡터 연산으로 편차 계산
+        anomalies = np.abs((arr - mean) / std) > threshold
         
         logger.debug(f"ESD 감지: {np.sum(anomalies)}개 이상치 발견")
         return anomalies
     
-    def _detect_moving_avg(self, values: List[float], threshold: float, window: int = 5) -> List[bool]:
+    def _detect_moving_avg(self, values: List[float], threshold: float, window: int = 5) -> np.ndarray:
         """
         Moving Average Deviation 기반 이상치 감지
         
@@ -113,15 +129,19 @@ class AnomalyDetector:
             window: 이동 평균 윈도우 크기
             
         Returns:
-            이상치 여부 리스트
+            이상치 여부 bool 배열
         """
+        anomalies = np.zeros(len(values), dtype=bool)
         if len(values) < window + 1:
-            return [False] * len(values)
+            return anomalies
         
-        arr = np.array(values)
-        anomalies = [False] * len(values)
+        arr = np.asarray(values, dtype=float)
         
-        # 이동 평균 계산
+        # 값이 모두 같으면 이동 평균/표준편차 계산 없이 종료
+        if is_constant(arr):
+            return anomalies
+        
+        # 이동 평균 계산 (moving_avg[k]는 arr[k:k + window]의 평균)
         moving_avg = np.convolve(arr, np.ones(window) / window, mode="valid")
         
         # 표준 편차 계산
@@ -130,13 +150,8 @@ class AnomalyDetector:
         if std == 0:
             return anomalies
         
-        # 이동 평균과의 편차 확인
-        for i in range(window - 1, len(arr)):
-            ma_value = moving_avg[i - window + 1]
-            deviation = abs(arr[i] - ma_value) / std
-            
-            if deviation > threshold:
-                anomalies[i] = True
+        # 이동 평균과의 편차 확인 (윈도우가 채워진 위치부터 한 번에 비교)
+        anomalies[window - 1:] = np.abs(arr[window - 1:] - moving_avg) / std > threshold
         
         logger.debug(f"Moving Average 감지: {np.sum(anomalies)}개 이상치 발견")
         return anomalies
@@ -152,6 +167,5 @@ class AnomalyDetector:
         Returns:
             이상치 인덱스 리스트
         """
-        anomalies = self.detect(values, threshold)
-        return [i for i, is_anomaly in enumerate(anomalies) if is_anomaly]
+        return np.flatnonzero(self.detect(values, threshold, as_list=False)).tolist()
 
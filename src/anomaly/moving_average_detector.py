@@ -4,9 +4,16 @@ Moving Average 기반 이상치 감지 모듈
 
 import pandas as pd
 import numpy as np
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple, Union
 import logging
 
+try:
+    import bottleneck as bn
+except ImportError:  # 선택적 의존성 (없으면 pandas rolling 사용)
+    bn = None
+
+from src.anomaly._kernels import column_values, deviation_mask, is_constant
+
 logger = logging.getLogger(__name__)
 
 
@@ -31,60 +38,56 @@ class MovingAverageDetector:
     
     def detect(
         self,
-        df: pd.DataFrame,
-        column: str,
+        data: Union[pd.DataFrame, np.ndarray],
+        column: Optional[str] = None,
         return_details: bool = False,
     ) -> List[Dict]:
         """
         Moving Average 기반 이상치 감지
         
         Args:
-            df: 시계열 데이터프레임
-            column: 분석할 컬럼명
+            data: 시계열 데이터프레임 또는 1차원 값 배열
+            column: 분석할 컬럼명 (data가 배열이면 생략)
             return_details: 상세 정보 반환 여부
-            
+        
         Returns:
             스파이크 구간 리스트
             [{'start': idx, 'end': idx, 'score': deviation, 'value': value}, ...]
         """
-        if column not in df.columns:
+        values = column_values(data, column)
+        if values is None:
             logger.error(f"컬럼 '{column}'이 데이터프레임에 없습니다")
             return []
         
-        if len(df) < self.window_size + 1:
+        if len(values) < self.window_size + 1:
             logger.warning(f"데이터가 너무 적어 이상치 감지 불가 (최소 {self.window_size + 1}개 필요)")
             return []
         
-        values = df[column].values
-        
         # 결측값 처리
         valid_mask = ~np.isnan(values)
         if valid_mask.sum() < self.window_size + 1:
             logger.warning("유효한 데이터가 너무 적습니다")
             return []
         
-        # 이동 평균 계산
-        moving_avg = self._calculate_moving_average(values, valid_mask)
-        
-        if moving_avg is None:
+        # 값이 모두 같으면 윈도우 표준편차가 전부 0이므로 이동 통계 계산 없이 종료
+        if is_constant(values[valid_mask]):
             return []
         
-        # 편차 계산
-        deviations = np.abs(values - moving_avg)
-        
-        # 표준편차 계산
-        std = np.std(values[valid_mask])
+        # 직전 윈도우의 이동 평균/표준편차 계산
+        window_stats = self._calculate_window_stats(values, valid_mask)
         
-        if std == 0:
-            logger.warning("표준편차가 0이어서 이상치 감지 불가")
+        if window_stats is None:
             return []
+        moving_avg, moving_std = window_stats
         
-        # 정규화된 편차 (Z-score)
-        normalized_deviations = deviations / std
+        # 편차 계산
+        deviations = np.abs(values - moving_avg)
         
-        # 이상치 인덱스 찾기
-        anomaly_mask = (normalized_deviations > self.threshold) & valid_mask
+        # 로컬 Z-score (윈도우 표준편차가 0인 위치는 판정하지 않음)
+        anomaly_mask = deviation_mask(values, moving_avg, moving_std, self.threshold) & valid_mask
         anomaly_indices = np.where(anomaly_mask)[0]
+        normalized_deviations = np.zeros_like(deviations)
+        normalized_deviations[anomaly_indices] = deviations[anomaly_indices] / moving_std[anomaly_indices]
         
         # 결과 생성
         results = []
@@ -99,6 +102,7 @@ class MovingAverageDetector:
             if return_details:
                 result.update({
                     "moving_avg": float(moving_avg[idx]),
+                    "moving_std": float(moving_std[idx]),
                     "deviation": float(deviations[idx]),
                     "threshold": float(self.threshold),
                     "window_size": int(self.window_size),
@@ -109,44 +113,98 @@ class MovingAverageDetector:
         logger.info(f"Moving Average 감지: {len(results)}개 이상치 발견")
         return results
     
-    def _calculate_moving_average(
+    def _calculate_window_stats(
         self,
         values: np.ndarray,
         valid_mask: np.ndarray,
-    ) -> Optional[np.ndarray]:
+    ) -> Optional[Tuple[np.ndarray, np.ndarray]]:
         """
-        이동 평균 계산
+        각 위치 직전 window_size개 유효값의 이동 평균/표준편차 계산
+        
+        현재 값은 윈도우에 포함하지 않으므로 스파이크가 자신의 기준값을 끌어올리지 않음
         
         Args:
             values: 값 배열
             valid_mask: 유효한 값 마스크
-            
+        
         Returns:
-            이동 평균 배열
+            (이동 평균 배열, 이동 표준편차 배열) 튜플
+            (직전 윈도우가 채워지지 않은 위치와 결측값 위치는 NaN)
         """
         try:
             moving_avg = np.full_like(values, np.nan, dtype=float)
+            moving_std = np.full_like(values, np.nan, dtype=float)
             
-            # 유효한 값들에 대해서만 이동 평균 계산
+            # 유효한 값들에 대해서만 계산 (C/Cython 이동 윈도우 커널, 윈도우당 O(1))
             valid_indices = np.where(valid_mask)[0]
+            valid_values = values[valid_mask].astype(float)
+            window = self.window_size
             
-            for i in range(self.window_size, len(valid_indices)):
-                window_start = valid_indices[i - self.window_size]
-                window_end = valid_indices[i]
+            if len(valid_values) > window:
+                if bn is not None:
+                    window_means = bn.move_mean(valid_values, window, min_count=window)
+                    window_stds = bn.move_std(valid_values, window, min_count=window, ddof=0)
+                else:
+                    rolling = pd.Series(valid_values).rolling(window)
+                    window_means = rolling.mean().to_numpy()
+                    window_stds = rolling.std(ddof=0).to_numpy()
                 
-                # 윈도우 내 유효한 값들만 사용
-                window_values = values[window_start:window_end + 1]
-                window_valid = valid_mask[window_start:window_end + 1]
-                
-                if window_valid.sum() > 0:
-                    moving_avg[valid_indices[i]] = np.mean(window_values[window_valid])
+                # 윈도우 [i - window, i) 통계를 위치 i에 배치
+                moving_avg[valid_indices[window:]] = window_means[window - 1:-1]
+                moving_std[valid_indices[window:]] = window_stds[window - 1:-1]
             
-            return moving_avg
+            return moving_avg, moving_std
         
         except Exception as e:
-            logger.error(f"이동 평균 계산 오류: {e}")
+            logger.error(f"이동 통계 계산 오류: {e}")
             return None
     
+    def detect_batch(self, matrix: np.ndarray) -> np.ndarray:
+        """
+        여러 키워드 시계열을 2차원 이동 윈도우 연산으로 한 번에 이상치 감지
+        
+        열마다 detect_anomalies를 호출한 것과 같은 결과를 계산하며, 결측값이 없는 열은
+        이동 통계를 한꺼번에 구하고 결측값이 있는 열만 열 단위로 계산
+        
+        Args:
+            matrix: (시간 T, 키워드 K) 값 행렬
+                (예: df.pivot(index="timestamp", columns="keyword", values="count").to_numpy())
+            
+        Returns:
+            (T, K) 이상치 여부 bool 배열
+        """
+        arr = np.asarray(matrix, dtype=float)
+        valid_mask = ~np.isnan(arr)
+        window = self.window_size
+        
+        moving_avg = np.full_like(arr, np.nan)
+        moving_std = np.full_like(arr, np.nan)
+        
+        # 결측값 없는 열: 윈도우 [i - window, i) 통계를 모든 열에 대해 한 번에 계산
+        dense_cols = np.flatnonzero(valid_mask.all(axis=0))
+        if len(dense_cols) and arr.shape[0] > window:
+            dense = arr[:, dense_cols]
+            if bn is not None:
+                window_means = bn.move_mean(dense, window, min_count=window, axis=0)
+                window_stds = bn.move_std(dense, window, min_count=window, ddof=0, axis=0)
+            else:
+                rolling = pd.DataFrame(dense).rolling(window)
+                window_means = rolling.mean().to_numpy()
+                window_stds = rolling.std(ddof=0).to_numpy()
+            
+            moving_avg[window:, dense_cols] = window_means[window - 1:-1]
+            moving_std[window:, dense_cols] = window_stds[window - 1:-1]
+        
+        # 결측값 있는 열: 유효값만 모아 열 단위로 계산
+        for col in np.flatnonzero(~valid_mask.all(axis=0)):
+            window_stats = self._calculate_window_stats(arr[:, col], valid_mask[:, col])
+            if window_stats is not None:
+                moving_avg[:, col], moving_std[:, col] = window_stats
+        
+        # 윈도우 표준편차가 0이거나 NaN인 위치는 판정하지 않음
+        safe_std = np.where(moving_std > 0, moving_std, np.nan)
+        return valid_mask & (np.abs(arr - moving_avg) / safe_std > self.threshold)
+    
     def detect_anomalies(
         self,
         values: List[float],
@@ -158,7 +216,7 @@ class MovingAverageDetector:
         Args:
             values: 값 리스트
             return_indices: 인덱스 반환 여부
-            
+        
         Returns:
             이상치 인덱스 리스트
         """
@@ -171,19 +229,17 @@ class MovingAverageDetector:
         if valid_mask.sum() < self.window_size + 1:
             return []
         
-        moving_avg = self._calculate_moving_average(arr, valid_mask)
-        
-        if moving_avg is None:
+        if is_constant(arr[valid_mask]):
             return []
         
-        deviations = np.abs(arr - moving_avg)
-        std = np.std(arr[valid_mask])
+        window_stats = self._calculate_window_stats(arr, valid_mask)
         
-        if std == 0:
+        if window_stats is None:
             return []
+        moving_avg, moving_std = window_stats
         
-        normalized_deviations = deviations / std
-        anomaly_mask = (normalized_deviations > self.threshold) & valid_mask
+        # 편차 계산, 로컬 정규화, 임계값 비교를 커널 한 번으로 처리
+        anomaly_mask = deviation_mask(arr, moving_avg, moving_std, self.threshold) & valid_mask
         
         if return_indices:
             return np.where(anomaly_mask)[0].tolist()
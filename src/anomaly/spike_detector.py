@@ -5,9 +5,11 @@ S-H-ESD (Seasonal Hybrid ESD) 알고리즘 구현
 
 import pandas as pd
 import numpy as np
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Union
 import logging
 
+from src.anomaly._kernels import column_values
+
 logger = logging.getLogger(__name__)
 
 
@@ -32,32 +34,31 @@ class SpikeDetector:
     
     def detect(
         self,
-        df: pd.DataFrame,
-        column: str,
+        data: Union[pd.DataFrame, np.ndarray],
+        column: Optional[str] = None,
         return_details: bool = False,
     ) -> List[Dict]:
         """
         Twitter Algorithm 기반 스파이크 감지
         
         Args:
-            df: 시계열 데이터프레임
-            column: 분석할 컬럼명
+            data: 시계열 데이터프레임 또는 1차원 값 배열
+            column: 분석할 컬럼명 (data가 배열이면 생략)
             return_details: 상세 정보 반환 여부
             
         Returns:
             스파이크 구간 리스트
             [{'start': idx, 'end': idx, 'score': z_score, 'value': value}, ...]
         """
-        if column not in df.columns:
+        values = column_values(data, column)
+        if values is None:
             logger.error(f"컬럼 '{column}'이 데이터프레임에 없습니다")
             return []
         
-        if len(df) < 3:
+        if len(values) < 3:
             logger.warning("데이터가 너무 적어 스파이크 감지 불가 (최소 3개 필요)")
             return []
         
-        values = df[column].values
-        
         # 결측값 제거
         valid_mask = ~np.isnan(values)
         if valid_mask.sum() < 3:
@@ -4,9 +4,11 @@ Z-score 기반 이상치 감지 모듈
 
 import pandas as pd
 import numpy as np
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple, Union
 import logging
 
+from src.anomaly._kernels import column_values, is_constant, mean_std_welford, zscore_mask
+
 logger = logging.getLogger(__name__)
 
 
@@ -21,36 +23,122 @@ class ZScoreDetector:
             threshold: Z-score 임계값 (기본값: 2.0 = 2 표준편차)
         """
         self.threshold = threshold
+        self.reset()
         logger.info(f"Z-score 감지기 초기화 완료 (threshold: {threshold})")
     
+    def reset(self):
+        """스트리밍 감지(update) 누적 통계 초기화"""
+        self._count = 0  # 결측값을 포함한 누적 데이터 수 (스트림 인덱스 기준)
+        # Welford 누적 통계 (유효 데이터 수, 평균, 편차 제곱합)
+        self._valid_count = 0
+        self._mean = 0.0
+        self._m2 = 0.0
+        # 현재까지의 데이터 기준 (하한, 상한, 평균, 표준편차), 데이터가 2개 미만이면 None
+        self._bounds: Optional[Tuple[float, float, float, float]] = None
+    
+    def update(self, new_values: List[float]) -> List[Dict]:
+        """
+        스트리밍 이상치 감지 (새 값만 이전까지의 누적 통계로 판정한 뒤 통계에 반영)
+        
+        전체 배열을 다시 스캔하지 않고 Welford 누적 통계로 평균과 표준편차를 갱신하며,
+        캐시된 신호 범위(mean ± threshold * std)를 벗어난 새 값만 이상치로 반환
+        
+        Args:
+            new_values: 새로 들어온 값 리스트
+            
+        Returns:
+            이상치 리스트 (start/end는 update로 누적된 전체 스트림 기준 인덱스)
+            [{'start': idx, 'end': idx, 'score': z_score, 'value': value}, ...]
+        """
+        arr = np.asarray(new_values, dtype=float)
+        valid_mask = ~np.isnan(arr)
+        offset = self._count
+        
+        results = []
+        if self._bounds is not None:
+            lower, upper, mean, std = self._bounds
+            anomaly_indices = np.flatnonzero(valid_mask & ((arr < lower) | (arr > upper)))
+            for idx in anomaly_indices:
+                results.append({
+                    "start": int(offset + idx),
+                    "end": int(offset + idx),
+                    "score": float(abs(arr[idx] - mean) / std),
+                    "value": float(arr[idx]),
+                })
+        
+        # 누적 통계 갱신 (결측값 제외, 인덱스는 결측값 위치도 포함하여 증가)
+        valid_values = arr[valid_mask]
+        self._count += len(arr)
+        self._merge_stats(valid_values)
+        self._bounds = self._compute_bounds()
+        
+        return results
+    
+    def _merge_stats(self, values: np.ndarray):
+        """
+        새 값 묶음의 통계를 누적 통계에 병합 (Welford/Chan 병렬 결합 공식)
+        
+        Args:
+            values: 결측값이 제거된 새 값 배열
+        """
+        n_new = values.size
+        if n_new == 0:
+            return
+        
+        mean_new, std_new = mean_std_welford(values)
+        n_total = self._valid_count + n_new
+        delta = mean_new - self._mean
+        
+        self._mean += delta * n_new / n_total
+        self._m2 += std_new * std_new * n_new + delta * delta * self._valid_count * n_new / n_total
+        self._valid_count = n_total
+    
+    def _compute_bounds(self) -> Optional[Tuple[float, float, float, float]]:
+        """
+        누적 통계로 신호 범위 계산
+        
+        Returns:
+            (하한, 상한, 평균, 표준편차) 튜플 (유효 데이터가 2개 미만이거나 표준편차가 0이면 None)
+        """
+        n = self._valid_count
+        if n < 2:
+            return None
+        
+        mean = self._mean
+        std = float(np.sqrt(self._m2 / n))
+        if std == 0:
+            return None
+        
+        margin = self.threshold * std
+        return mean - margin, mean + margin, mean, std
+    
     def detect(
         self,
-        df: pd.DataFrame,
-        column: str,
+        data: Union[pd.DataFrame, np.ndarray],
+        column: Optional[str] = None,
         return_details: bool = False,
     ) -> List[Dict]:
         """
         Z-score 기반 이상치 감지
         
         Args:
-            df: 시계열 데이터프레임
-            column: 분석할 컬럼명
+            data: 시계열 데이터프레임 또는 1차원 값 배열
+            column: 분석할 컬럼명 (data가 배열이면 생략)
             return_details: 상세 정보 반환 여부
             
         Returns:
             스파이크 구간 리스트
             [{'start': idx, 'end': idx, 'score': z_score, 'value': value}, ...]
         """
-        if column not in df.columns:
+        values = column_values(data, column)
+        if values is None:
             logger.error(f"컬럼 '{column}'이 데이터프레임에 없습니다")
             return []
         
-        if len(df) < 2:
+        if len(values) < 2:
             logger.warning("데이터가 너무 적어 이상치 감지 불가")
             return []
         
-        values = df[column].values
-        
         # 결측값 제거
         valid_mask = ~np.isnan(values)
         if valid_mask.sum() < 2:
@@ -60,9 +148,13 @@ class ZScoreDetector:
         valid_values = values[valid_mask]
         valid_indices = np.where(valid_mask)[0]
         
-        # 평균과 표준편차 계산
-        mean = np.mean(valid_values)
-        std = np.std(valid_values)
+        # 값이 모두 같으면 표준편차 계산 없이 종료 (검색량이 적은 키워드의 0/1 고정 시계열)
+        if is_constant(valid_values):
+            logger.warning("표준편차가 0이어서 이상치 감지 불가")
+            return []
+        
+        # 평균과 표준편차를 단일 패스로 계산
+        mean, std = mean_std_welford(valid_values)
         
         if std == 0:
             logger.warning("표준편차가 0이어서 이상치 감지 불가")
@@ -99,6 +191,34 @@ class ZScoreDetector:
         logger.info(f"Z-score 감지: {len(results)}개 이상치 발견")
         return results
     
+    def detect_batch(self, matrix: np.ndarray) -> np.ndarray:
+        """
+        여러 키워드 시계열을 한 번의 2차원 연산으로 이상치 감지
+        
+        열마다 detect_anomalies를 호출한 것과 같은 결과를 키워드별 파이썬 루프 없이 계산
+        (결측값 제외, 유효 데이터 2개 미만이거나 표준편차 0인 열은 모두 False)
+        
+        Args:
+            matrix: (시간 T, 키워드 K) 값 행렬
+                (예: df.pivot(index="timestamp", columns="keyword", values="count").to_numpy())
+            
+        Returns:
+            (T, K) 이상치 여부 bool 배열
+        """
+        arr = np.asarray(matrix, dtype=float)
+        valid_mask = ~np.isnan(arr)
+        counts = valid_mask.sum(axis=0)
+        
+        # 열별 평균/모집단 표준편차 (결측값은 0으로 채워 합계에서 제외, 편차 기반 2패스로 상쇄 오차 방지)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            mean = np.where(valid_mask, arr, 0.0).sum(axis=0) / counts
+            deviations = np.where(valid_mask, np.abs(arr - mean), 0.0)
+            std = np.sqrt(np.square(deviations).sum(axis=0) / counts)
+        
+        usable = (counts >= 2) & (std > 0)
+        safe_std = np.where(usable, std, np.inf)
+        return valid_mask & usable & (deviations / safe_std > self.threshold)
+    
     def detect_anomalies(
         self,
         values: List[float],
@@ -124,14 +244,11 @@ class ZScoreDetector:
             return []
         
         valid_values = arr[valid_mask]
-        mean = np.mean(valid_values)
-        std = np.std(valid_values)
-        
-        if std == 0:
+        if is_constant(valid_values):
             return []
         
-        z_scores = np.abs((valid_values - mean) / std)
-        anomaly_mask = z_scores > self.threshold
+        # 평균/표준편차 계산과 임계값 비교를 커널 한 번으로 처리 (표준편차 0이면 모두 False)
+        anomaly_mask = zscore_mask(valid_values, self.threshold)
         
         if return_indices:
             return np.where(valid_mask)[0][anomaly_mask].tolist()
@@ -5,6 +5,8 @@ RSS, Google News API 등을 통한 뉴스 데이터 수집
 
 import feedparser
 import requests
+from requests.adapters import HTTPAdapter
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
 from typing import List, Dict, Optional
 from datetime import datetime
 import logging
@@ -12,6 +14,13 @@ from abc import ABC, abstractmethod
 
 logger = logging.getLogger(__name__)
 
+# RSS 피드 동시 요청 최대 스레드 수
+MAX_FEED_WORKERS = 16
+# 피드 하나를 기다리는 최대 시간 (초, 느린 피드가 전체 수집을 막지 않도록)
+FEED_TIMEOUT = 15
+# 피드 본문 요청 타임아웃 (초)
+FEED_REQUEST_TIMEOUT = 10
+
 
 class BaseCollector(ABC):
     """데이터 수집기 기본 클래스"""
@@ -24,7 +33,7 @@ class BaseCollector(ABC):
         Args:
             keyword: 검색 키워드
             max_results: 최대 수집 개수
-            
+        
         Returns:
             수집된 데이터 리스트
         """
@@ -42,6 +51,13 @@ class RSSCollector(BaseCollector):
             rss_urls: RSS 피드 URL 리스트
         """
         self.rss_urls = rss_urls or []
+        
+        # 피드 요청용 공유 세션 (같은 호스트 피드끼리 TCP/TLS 연결을 재사용)
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=MAX_FEED_WORKERS, pool_maxsize=MAX_FEED_WORKERS)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+        
         logger.info(f"RSS 수집기 초기화 완료: {len(self.rss_urls)}개 피드")
     
     def collect(self, keyword: str, max_results: int = 100) -> List[Dict]:
@@ -51,20 +67,32 @@ class RSSCollector(BaseCollector):
         Args:
             keyword: 검색 키워드
             max_results: 최대 수집 개수
-            
+        
         Returns:
             뉴스 데이터 리스트
         """
         results = []
+        if not self.rss_urls:
+            return results
+        
+        # 키워드는 한 번만 소문자로 변환
+        keyword_lower = keyword.lower()
+        # 한 번의 수집 호출에서 나온 아이템은 수집 시각을 공유
+        collected_at = datetime.now().isoformat()
+        
+        # 피드 요청은 네트워크 대기 위주이므로 스레드로 동시에 가져옴 (전체 대기 시간 ≈ 가장 느린 피드)
+        executor = ThreadPoolExecutor(max_workers=min(MAX_FEED_WORKERS, len(self.rss_urls)))
+        futures = [executor.submit(self._fetch_feed, rss_url) for rss_url in self.rss_urls]
         
-        for rss_url in self.rss_urls:
+        for rss_url, future in zip(self.rss_urls, futures):
             try:
-                feed = feedparser.parse(rss_url)
+                feed = future.result(timeout=FEED_TIMEOUT)
+                feed_count = 0
                 
                 for entry in feed.entries[:max_results]:
-                    # 키워드 필터링
-                    if keyword.lower() in entry.get("title", "").lower() or \
-                       keyword.lower() in entry.get("summary", "").lower():
+                    # 키워드 필터링 (제목과 요약을 한 번에 검사, 구분자 \0으로 경계를 넘는 오탐 방지)
+                    haystack = f"{entry.get('title', '')}\0{entry.get('summary', '')}".lower()
+                    if keyword_lower in haystack:
                         
                         news_item = {
                             "title": entry.get("title", ""),
@@ -73,16 +101,37 @@ class RSSCollector(BaseCollector):
                             "published": entry.get("published", ""),
                             "source": rss_url,
                             "keyword": keyword,
-                            "collected_at": datetime.now().isoformat(),
+                            "collected_at": collected_at,
                         }
                         results.append(news_item)
+                        feed_count += 1
                 
-                logger.info(f"RSS 피드에서 {len(results)}개 뉴스 수집: {rss_url}")
+                logger.info(f"RSS 피드에서 {feed_count}개 뉴스 수집: {rss_url}")
+            
+            except FutureTimeoutError:
+                logger.error(f"RSS 피드 수집 타임아웃 ({rss_url})")
             
             except Exception as e:
                 logger.error(f"RSS 피드 수집 오류 ({rss_url}): {e}")
         
+        # 타임아웃된 요청을 기다리지 않고 반환
+        executor.shutdown(wait=False, cancel_futures=True)
+        
         return results[:max_results]
+    
+    def _fetch_feed(self, rss_url: str):
+        """
+        공유 세션으로 피드 본문을 받아 파싱
+        
+        Args:
+            rss_url: RSS 피드 URL
+        
+        Returns:
+            feedparser 파싱 결과
+        """
+        response = self._session.get(rss_url, timeout=FEED_REQUEST_TIMEOUT)
+        response.raise_for_status()
+        return feedparser.parse(response.content)
 
 
 class GoogleNewsCollector(BaseCollector):
@@ -106,7 +155,7 @@ class GoogleNewsCollector(BaseCollector):
         Args:
             keyword: 검색 키워드
             max_results: 최대 수집 개수
-            
+        
         Returns:
             뉴스 데이터 리스트
         """
@@ -129,6 +178,7 @@ class GoogleNewsCollector(BaseCollector):
             response.raise_for_status()
             
             data = response.json()
+            collected_at = datetime.now().isoformat()
             
             for article in data.get("articles", []):
                 news_item = {
@@ -138,7 +188,7 @@ class GoogleNewsCollector(BaseCollector):
                     "published": article.get("publishedAt", ""),
                     "source": article.get("source", {}).get("name", ""),
                     "keyword": keyword,
-                    "collected_at": datetime.now().isoformat(),
+                    "collected_at": collected_at,
                 }
                 results.append(news_item)
             
@@ -152,15 +202,16 @@ class GoogleNewsCollector(BaseCollector):
     
     def _get_mock_data(self, keyword: str, max_results: int) -> List[Dict]:
         """Mock 데이터 생성 (API 키 없을 때)"""
+        now = datetime.now().isoformat()
         return [
             {
                 "title": f"{keyword} 관련 뉴스 {i+1}",
                 "summary": f"{keyword}에 대한 뉴스 요약 내용입니다.",
                 "link": f"https://example.com/news/{i+1}",
-                "published": datetime.now().isoformat(),
+                "published": now,
                 "source": "Mock Source",
                 "keyword": keyword,
-                "collected_at": datetime.now().isoformat(),
+                "collected_at": now,
             }
             for i in range(min(max_results, 10))
         ]
@@ -192,7 +243,7 @@ class NewsCollector:
         Args:
             keyword: 검색 키워드
             max_results: 최대 수집 개수
-            
+        
         Returns:
             통합 뉴스 데이터 리스트
         """
@@ -206,15 +257,16 @@ class NewsCollector:
         google_results = self.google_collector.collect(keyword, max_results)
         all_results.extend(google_results)
         
-        # 중복 제거 (링크 기준)
-        seen_links = set()
-        unique_results = []
+        # 중복 제거 (링크 기준, 삽입 순서를 유지하는 dict 하나로 처음 나온 아이템 유지)
+        unique_by_link = {}
         for item in all_results:
-            link = item.get("link", "")
-            if link and link not in seen_links:
-                seen_links.add(link)
-                unique_results.append(item)
+            unique_by_link.setdefault(item.get("link", ""), item)
+            # 최대 개수만큼 모이면 나머지는 볼 필요 없음 (빈 링크 자리 하나를 감안)
+            if len(unique_by_link) > max_results:
+                break
+        unique_by_link.pop("", None)
+        unique_results = list(unique_by_link.values())[:max_results]
         
         logger.info(f"총 {len(unique_results)}개 고유 뉴스 수집 완료: {keyword}")
-        return unique_results[:max_results]
+        return unique_results
 
@@ -3,15 +3,39 @@ Google News API 수집 모듈
 Google News API로 키워드 기반 기사 수집
 """
 
+import asyncio
+import re
+import httpx
+import orjson
 import requests
 from typing import List, Dict, Optional
 from datetime import datetime
 import logging
 import time
+from pathlib import Path
 from src.utils.config import load_config
 
+try:
+    import requests_cache
+except ImportError:  # 선택적 의존성 (없으면 캐시 없는 requests.Session 사용)
+    requests_cache = None
+
 logger = logging.getLogger(__name__)
 
+# NewsAPI publishedAt 형식 (예: 2024-01-15T10:00:00Z, 2024-01-15T10:00:00.123+09:00)
+ISO_DATETIME_PATTERN = re.compile(
+    r"(\d{4})-(\d{2})-(\d{2})T(\d{2}):(\d{2}):(\d{2})(?:\.\d+)?(?:Z|[+-]\d{2}:?\d{2})?"
+)
+
+# 응답 캐시 만료 기본값 (설정에 cache_path가 있을 때만 사용하며, 같은 키워드/페이지 요청이
+# 이 시간 안에 반복되면 네트워크 대신 SQLite 조회)
+RESPONSE_CACHE_EXPIRE = 60
+
+# 비동기 수집 시 동시에 요청할 최대 페이지 수
+MAX_CONCURRENT_PAGES = 5
+# 429 응답의 Retry-After를 따를 최대 대기 시간 (초, 초과하면 재시도하지 않음)
+MAX_RETRY_AFTER = 30
+
 
 class GoogleNewsCollector:
     """Google News API 기반 뉴스 수집기"""
@@ -20,6 +44,7 @@ class GoogleNewsCollector:
         self,
         api_key: Optional[str] = None,
         config_path: Optional[str] = None,
+        config: Optional[Dict] = None,
     ):
         """
         Google News 수집기 초기화
@@ -27,10 +52,12 @@ class GoogleNewsCollector:
         Args:
             api_key: Google News API 키 (NewsAPI.org)
             config_path: 설정 파일 경로
+            config: 이미 로드한 설정 딕셔너리 (주어지면 config_path를 다시 읽지 않음)
         """
-        if config_path:
+        if config is not None or config_path:
             try:
-                config = load_config(config_path)
+                if config is None:
+                    config = load_config(config_path)
                 collector_config = config.get("collector", {})
                 google_news_config = collector_config.get("google_news", {})
                 self.api_key = google_news_config.get("api_key") or api_key
@@ -38,6 +65,8 @@ class GoogleNewsCollector:
                 self.language = google_news_config.get("language", "ko")
                 self.sort_by = google_news_config.get("sort_by", "publishedAt")
                 self.timeout = collector_config.get("timeout", 10)
+                self.cache_expire = google_news_config.get("cache_expire_seconds", RESPONSE_CACHE_EXPIRE)
+                self.cache_path = google_news_config.get("cache_path")
             except Exception as e:
                 logger.warning(f"설정 파일 로드 실패, 기본값 사용: {e}")
                 self.api_key = api_key
@@ -45,15 +74,50 @@ class GoogleNewsCollector:
                 self.language = "ko"
                 self.sort_by = "publishedAt"
                 self.timeout = 10
+                self.cache_expire = RESPONSE_CACHE_EXPIRE
+                self.cache_path = None
         else:
             self.api_key = api_key
             self.base_url = "https://newsapi.org/v2/everything"
             self.language = "ko"
             self.sort_by = "publishedAt"
             self.timeout = 10
+            self.cache_expire = RESPONSE_CACHE_EXPIRE
+            self.cache_path = None
+        
+        # 페이지 요청 간 TCP/TLS 연결을 재사용하는 세션 (가능하면 응답 캐시 포함)
+        self._session = self._create_session()
         
         logger.info("Google News 수집기 초기화 완료")
     
+    def _create_session(self) -> requests.Session:
+        """
+        HTTP 세션 생성
+        
+        설정에 cache_path가 있고 requests-cache가 설치되어 있으며 캐시 만료 시간이 0보다 크면
+        SQLite 응답 캐시 세션을 사용 (반복 수집 시 네트워크 왕복과 API 쿼터 소모를 줄임)
+        
+        Returns:
+            requests 세션 (CachedSession 또는 Session)
+        """
+        if requests_cache is None or not self.cache_path or not self.cache_expire:
+            return requests.Session()
+        
+        try:
+            Path(self.cache_path).parent.mkdir(parents=True, exist_ok=True)
+            return requests_cache.CachedSession(
+                self.cache_path,
+                backend="sqlite",
+                expire_after=self.cache_expire,
+                allowable_methods=("GET",),
+                allowable_codes=(200,),
+                # API 키는 캐시 키와 저장된 요청에서 제외
+                ignored_parameters=["apiKey"],
+            )
+        except Exception as e:
+            logger.warning(f"응답 캐시 초기화 실패, 캐시 없이 진행: {e}")
+            return requests.Session()
+    
     def collect(
         self,
         keyword: str,
@@ -65,7 +129,7 @@ class GoogleNewsCollector:
         Args:
             keyword: 검색 키워드
             max_results: 최대 수집 개수
-            
+        
         Returns:
             뉴스 데이터 리스트
         """
@@ -91,9 +155,6 @@ class GoogleNewsCollector:
                     break
                 
                 page += 1
-                
-                # API rate limit 방지
-                time.sleep(0.5)
             
             except Exception as e:
                 logger.error(f"Google News API 수집 오류: {e}")
@@ -115,11 +176,159 @@ class GoogleNewsCollector:
             keyword: 검색 키워드
             page: 페이지 번호
             page_size: 페이지 크기
+        
+        Returns:
+            뉴스 데이터 리스트
+        """
+        try:
+            params = self._build_params(keyword, page, page_size)
+            response = self._session.get(self.base_url, params=params, timeout=self.timeout)
+            
+            # 쿼터 초과 시 서버가 알려준 시간만큼 기다린 뒤 한 번 재시도
+            delay = self._retry_after(response)
+            if delay is not None:
+                logger.warning(f"Google News API 쿼터 초과, {delay:.0f}초 후 재시도")
+                time.sleep(delay)
+                response = self._session.get(self.base_url, params=params, timeout=self.timeout)
             
+            return self._parse_response(response, keyword)
+        
+        except requests.exceptions.Timeout:
+            logger.error(f"Google News API 타임아웃 (키워드: {keyword})")
+            raise
+        except requests.exceptions.RequestException as e:
+            logger.error(f"Google News API 요청 오류: {e}")
+            raise
+    
+    async def collect_async(
+        self,
+        client: httpx.AsyncClient,
+        keyword: str,
+        max_results: int = 100,
+    ) -> List[Dict]:
+        """
+        Google News API에서 키워드 관련 뉴스 비동기 수집
+        
+        첫 페이지의 totalResults로 필요한 페이지 수를 계산한 뒤
+        나머지 페이지를 최대 MAX_CONCURRENT_PAGES개씩 동시에 요청
+        
+        Args:
+            client: 공유 비동기 HTTP 클라이언트 (커넥션 풀 재사용)
+            keyword: 검색 키워드
+            max_results: 최대 수집 개수
+        
         Returns:
             뉴스 데이터 리스트
         """
-        params = {
+        if not self.api_key:
+            logger.warning("Google News API 키가 설정되지 않았습니다. 빈 리스트 반환")
+            return []
+        
+        page_size = min(100, max_results)  # API 최대 페이지 크기
+        
+        try:
+            data = await self._fetch_page_async(client, keyword, 1, page_size)
+        except httpx.TimeoutException:
+            logger.error(f"Google News API 타임아웃 (키워드: {keyword})")
+            return []
+        except Exception as e:
+            logger.error(f"Google News API 수집 오류: {e}")
+            return []
+        
+        all_results = self._parse_articles(data, keyword)
+        
+        # 남은 페이지 수 (최대 개수와 전체 결과 수 중 작은 쪽 기준)
+        total = min(max_results, data.get("totalResults", 0))
+        num_pages = -(-total // page_size)  # 올림 나눗셈
+        
+        if len(all_results) == page_size and num_pages > 1:
+            semaphore = asyncio.Semaphore(MAX_CONCURRENT_PAGES)
+            
+            async def fetch(page: int) -> Dict:
+                async with semaphore:
+                    return await self._fetch_page_async(client, keyword, page, page_size)
+            
+            pages = await asyncio.gather(
+                *(fetch(page) for page in range(2, num_pages + 1)),
+                return_exceptions=True,
+            )
+            
+            # 페이지 순서대로 병합 (실패한 페이지는 건너뜀)
+            for page, page_data in enumerate(pages, start=2):
+                if isinstance(page_data, httpx.TimeoutException):
+                    logger.error(f"Google News API 타임아웃 (키워드: {keyword}, 페이지: {page})")
+                elif isinstance(page_data, Exception):
+                    logger.error(f"Google News API 수집 오류 (페이지: {page}): {page_data}")
+                else:
+                    all_results.extend(self._parse_articles(page_data, keyword))
+        
+        # 최대 개수 제한
+        return all_results[:max_results]
+    
+    async def _fetch_page_async(
+        self,
+        client: httpx.AsyncClient,
+        keyword: str,
+        page: int,
+        page_size: int,
+    ) -> Dict:
+        """
+        단일 페이지 비동기 요청 (쿼터 초과 시 Retry-After만큼 기다린 뒤 한 번 재시도)
+        
+        Args:
+            client: 비동기 HTTP 클라이언트
+            keyword: 검색 키워드
+            page: 페이지 번호
+            page_size: 페이지 크기
+        
+        Returns:
+            검증된 API 응답 JSON 딕셔너리
+        """
+        params = self._build_params(keyword, page, page_size)
+        response = await client.get(self.base_url, params=params, timeout=self.timeout)
+        
+        delay = self._retry_after(response)
+        if delay is not None:
+            logger.warning(f"Google News API 쿼터 초과, {delay:.0f}초 후 재시도")
+            await asyncio.sleep(delay)
+            response = await client.get(self.base_url, params=params, timeout=self.timeout)
+        
+        return self._check_response(response)
+    
+    def _retry_after(self, response) -> Optional[float]:
+        """
+        429 응답의 Retry-After 헤더에서 재시도 대기 시간 추출
+        
+        Args:
+            response: HTTP 응답 객체 (requests/httpx 공용)
+        
+        Returns:
+            대기 시간 (초), 재시도하지 않을 경우 None
+            (429가 아니거나, 헤더가 초 단위 숫자가 아니거나, MAX_RETRY_AFTER 초과)
+        """
+        if response.status_code != 429:
+            return None
+        
+        value = response.headers.get("Retry-After")
+        if not isinstance(value, str) or not value.strip().isdigit():
+            return None
+        
+        delay = float(value)
+        return delay if delay <= MAX_RETRY_AFTER else None
+    
+    def _build_params(self, keyword: str, page: int, page_size: int) -> Dict:
+        """
+        API 요청 파라미터 생성
+        
+        Args:
+            keyword: 검색 키워드
+            page: 페이지 번호
+            page_size: 페이지 크기
+        
+        Returns:
+            쿼리 파라미터 딕셔너리
+        """
+        return {
             "q": keyword,
             "apiKey": self.api_key,
             "pageSize": page_size,
@@ -127,56 +336,81 @@ class GoogleNewsCollector:
             "language": self.language,
             "sortBy": self.sort_by,
         }
+    
+    def _parse_response(self, response, keyword: str) -> List[Dict]:
+        """
+        API 응답을 뉴스 아이템 리스트로 변환 (requests/httpx 응답 공용)
         
-        try:
-            response = requests.get(
-                self.base_url,
-                params=params,
-                timeout=self.timeout,
-            )
-            
-            # 응답 상태 확인
-            if response.status_code == 429:
-                logger.error("Google News API 쿼터 초과. 잠시 후 다시 시도하세요.")
-                raise Exception("API 쿼터 초과")
-            
-            response.raise_for_status()
-            
-            data = response.json()
-            
-            if data.get("status") != "ok":
-                error_message = data.get("message", "알 수 없는 오류")
-                logger.error(f"Google News API 오류: {error_message}")
-                raise Exception(f"API 오류: {error_message}")
-            
-            articles = data.get("articles", [])
-            results = []
-            
-            for article in articles:
-                # pubDate 정규화
-                pub_date = self._normalize_pubdate(article.get("publishedAt", ""))
-                
-                news_item = {
-                    "title": article.get("title", ""),
-                    "link": article.get("url", ""),
-                    "pubDate": pub_date,
-                    "summary": article.get("description", ""),
-                    "media": article.get("urlToImage", ""),
-                    "category": "",
-                    "source": article.get("source", {}).get("name", ""),
-                    "keyword": keyword,
-                    "collected_at": datetime.now().isoformat(),
-                }
-                results.append(news_item)
+        Args:
+            response: HTTP 응답 객체
+            keyword: 검색 키워드
+        
+        Returns:
+            뉴스 데이터 리스트
+        """
+        return self._parse_articles(self._check_response(response), keyword)
+    
+    def _check_response(self, response) -> Dict:
+        """
+        API 응답 상태 확인 후 JSON 반환 (requests/httpx 응답 공용)
+        
+        Args:
+            response: HTTP 응답 객체
+        
+        Returns:
+            API 응답 JSON 딕셔너리
+        """
+        # 응답 상태 확인
+        if response.status_code == 429:
+            logger.error("Google News API 쿼터 초과. 잠시 후 다시 시도하세요.")
+            raise Exception("API 쿼터 초과")
+        
+        response.raise_for_status()
+        
+        # 표준 json 대신 orjson으로 응답 본문을 바로 파싱 (requests/httpx 모두 bytes 본문 제공)
+        data = orjson.loads(response.content)
+        
+        if data.get("status") != "ok":
+            error_message = data.get("message", "알 수 없는 오류")
+            logger.error(f"Google News API 오류: {error_message}")
+            raise Exception(f"API 오류: {error_message}")
+        
+        return data
+    
+    def _parse_articles(self, data: Dict, keyword: str) -> List[Dict]:
+        """
+        API 응답 JSON의 기사 목록을 뉴스 아이템 리스트로 변환
+        
+        Args:
+            data: API 응답 JSON 딕셔너리
+            keyword: 검색 키워드
+        
+        Returns:
+            뉴스 데이터 리스트
+        """
+        articles = data.get("articles", [])
+        results = []
+        # 같은 응답의 기사는 수집 시각을 공유 (기사마다 datetime.now() 호출하지 않음)
+        collected_at = datetime.now().isoformat()
+        
+        for article in articles:
+            # pubDate 정규화
+            pub_date = self._normalize_pubdate(article.get("publishedAt", ""))
             
-            return results
+            news_item = {
+                "title": article.get("title", ""),
+                "link": article.get("url", ""),
+                "pubDate": pub_date,
+                "summary": article.get("description", ""),
+                "media": article.get("urlToImage", ""),
+                "category": "",
+                "source": article.get("source", {}).get("name", ""),
+                "keyword": keyword,
+                "collected_at": collected_at,
+            }
+            results.append(news_item)
         
-        except requests.exceptions.Timeout:
-            logger.error(f"Google News API 타임아웃 (키워드: {keyword})")
-            raise
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Google News API 요청 오류: {e}")
-            raise
+        return results
     
     def _normalize_pubdate(self, pub_date_str: str) -> str:
         """
@@ -184,15 +418,22 @@ class GoogleNewsCollector:
         
         Args:
             pub_date_str: 원본 날짜 문자열 (ISO 8601 형식)
-            
+        
         Returns:
             정규화된 날짜 문자열 (Y-m-d H:M:S)
         """
         if not pub_date_str:
             return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         
+        # 일반적인 ISO 8601 형식은 datetime 객체 생성/포맷 없이 문자열 재조합
+        # (fromisoformat + strftime과 같은 결과: 시간대 변환 없이 표기된 시각 그대로 사용)
+        match = ISO_DATETIME_PATTERN.fullmatch(pub_date_str)
+        if match:
+            year, month, day, hour, minute, second = match.groups()
+            return f"{year}-{month}-{day} {hour}:{minute}:{second}"
+        
         try:
-            # ISO 8601 형식 파싱
+            # 그 외 ISO 8601 변형 파싱
             dt = datetime.fromisoformat(pub_date_str.replace("Z", "+00:00"))
             return dt.strftime("%Y-%m-%d %H:%M:%S")
         except Exception as e:
@@ -4,15 +4,40 @@
 """
 
 import re
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Sequence
 import logging
+import pandas as pd
+
+try:
+    import re2
+except ImportError:  # 선택적 의존성 (google-re2, 없으면 표준 re 사용)
+    re2 = None
 
 logger = logging.getLogger(__name__)
 
+# ASCII 패턴용 정규식 엔진 (RE2는 역추적 없이 선형 시간 DFA로 매칭)
+# RE2의 \w, \s는 ASCII만 인식하므로 유니코드 문자 클래스 패턴에는 표준 re 유지
+ASCII_REGEX_ENGINE = re2 if re2 is not None else re
+
 
 class TextPreprocessor:
     """텍스트 전처리 클래스"""
     
+    # 정제 패턴 (호출마다 re 캐시를 조회하지 않도록 클래스 로드 시 1회 컴파일)
+    HTML_PATTERN = ASCII_REGEX_ENGINE.compile(r"<[^>]+>")
+    URL_PATTERN = ASCII_REGEX_ENGINE.compile(
+        r"http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\(\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+"
+    )
+    SPECIAL_CHAR_PATTERN = re.compile(r"[^\w\s가-힣]")
+    
+    # pyarrow 문자열 컬럼용 RE2 패턴: 특수 문자 치환 + 공백 축약을 한 번에 처리
+    # (공백도 특수 문자 클래스에 속하므로 "문자/숫자/_가 아닌 문자의 연속"을 공백 하나로 치환하면 동일,
+    #  RE2의 \w는 ASCII만 인식하므로 유니코드 속성으로 표준 re의 \w 범위를 재현)
+    ARROW_NON_WORD_PATTERN = r"[^\p{L}\p{N}_]+"
+    
+    # 배치 전처리 대상 텍스트 컬럼
+    TEXT_COLUMNS = ("title", "summary")
+    
     def __init__(self):
         """전처리기 초기화"""
         logger.info("텍스트 전처리기 초기화 완료")
@@ -31,21 +56,69 @@ class TextPreprocessor:
             return ""
         
         # HTML 태그 제거
-        text = re.sub(r"<[^>]+>", "", text)
+        text = self.HTML_PATTERN.sub("", text)
         
         # URL 제거
-        text = re.sub(r"http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+", "", text)
+        text = self.URL_PATTERN.sub("", text)
         
         # 특수 문자 정리
-        text = re.sub(r"[^\w\s가-힣]", " ", text)
+        text = self.SPECIAL_CHAR_PATTERN.sub(" ", text)
+        
+        # 연속된 공백 축약 및 앞뒤 공백 제거 (정규식 치환 + strip 대신 C 레벨 split/join 한 번)
+        return " ".join(text.split())
+    
+    def preprocess_batch(
+        self,
+        df: pd.DataFrame,
+        cols: Sequence[str] = TEXT_COLUMNS,
+    ) -> pd.DataFrame:
+        """
+        컬럼 단위 배치 전처리 (모든 행의 텍스트를 한 번에 정제)
+        
+        pyarrow 문자열 컬럼이면 pandas .str 연산이 Arrow C++ 커널로 전체 행을 한 번에 처리하고,
+        그 외 dtype이면 행별 clean_text로 처리
+        
+        Args:
+            df: 뉴스 데이터프레임
+            cols: 정제할 텍스트 컬럼 (데이터프레임에 없는 컬럼은 무시)
+            
+        Returns:
+            텍스트 컬럼이 정제되고 모든 텍스트 컬럼이 빈 행은 제거된 데이터프레임 (원본 인덱스 유지)
+        """
+        df = df.copy()
+        cols = [col for col in cols if col in df.columns]
+        
+        for col in cols:
+            df[col] = self._clean_series(df[col])
+        
+        # 빈 텍스트 필터링
+        if cols:
+            df = df[(df[cols] != "").any(axis=1)]
+        
+        return df
+    
+    def _clean_series(self, series: pd.Series) -> pd.Series:
+        """
+        텍스트 시리즈 정제 (clean_text와 동일한 결과)
         
-        # 연속된 공백 제거
-        text = re.sub(r"\s+", " ", text)
+        Args:
+            series: 원본 텍스트 시리즈
+            
+        Returns:
+            정제된 텍스트 시리즈 (결측값은 빈 문자열)
+        """
+        series = series.fillna("").astype(str)
         
-        # 앞뒤 공백 제거
-        text = text.strip()
+        if getattr(series.dtype, "storage", None) != "pyarrow":
+            return series.map(self.clean_text)
         
-        return text
+        return (
+            series
+            .str.replace(self.HTML_PATTERN.pattern, "", regex=True)
+            .str.replace(self.URL_PATTERN.pattern, "", regex=True)
+            .str.replace(self.ARROW_NON_WORD_PATTERN, " ", regex=True)
+            .str.strip()
+        )
     
     def preprocess_news(self, news_items: List[Dict]) -> List[Dict]:
         """
@@ -88,14 +161,12 @@ class TextPreprocessor:
         Returns:
             중복 제거된 리스트
         """
-        seen = set()
-        unique_items = []
-        
+        # 삽입 순서를 유지하는 dict 하나로 처음 나온 아이템 유지 (빈 값은 제외)
+        unique_by_key = {}
         for item in news_items:
-            value = item.get(key, "")
-            if value and value not in seen:
-                seen.add(value)
-                unique_items.append(item)
+            unique_by_key.setdefault(item.get(key, ""), item)
+        unique_by_key.pop("", None)
+        unique_items = list(unique_by_key.values())
         
         logger.info(f"중복 제거 완료: {len(unique_items)}/{len(news_items)}개 아이템")
         return unique_items
@@ -3,29 +3,35 @@
 뉴스 텍스트 정제 및 키워드 추출
 """
 
+import os
 import re
-from typing import List, Dict
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import List, Dict, Optional
 import logging
 
 logger = logging.getLogger(__name__)
 
+# 이 개수 미만의 배치는 프로세스 간 전송 비용이 더 크므로 순차 처리
+PARALLEL_MIN_BATCH = 64
+# 기본 옵션 정제 결과 캐시 크기 (수집 주기마다 반복되는 기사/공통 문구 재사용)
+CLEAN_CACHE_SIZE = 8192
+
 
 class TextCleaner:
     """텍스트 정제 클래스"""
     
-    # 이모지 패턴 (유니코드 범위)
+    # 이모지 유니코드 범위 (겹치지 않는 최소 블록, 시작 코드포인트 순)
+    # 한글/한자 등 일반 문자 블록을 포함하지 않도록 이모지 전용 블록만 지정
+    EMOJI_RANGES = (
+        (0x2600, 0x27BF),    # misc symbols & dingbats
+        (0x1F1E0, 0x1F1FF),  # flags
+        (0x1F300, 0x1F6FF),  # symbols & pictographs, emoticons, transport & map symbols
+        (0x1F900, 0x1FA6F),  # supplemental symbols, chess symbols
+    )
     EMOJI_PATTERN = re.compile(
-        "["
-        "\U0001F600-\U0001F64F"  # emoticons
-        "\U0001F300-\U0001F5FF"  # symbols & pictographs
-        "\U0001F680-\U0001F6FF"  # transport & map symbols
-        "\U0001F1E0-\U0001F1FF"  # flags
-        "\U00002702-\U000027B0"
-        "\U000024C2-\U0001F251"
-        "\U0001F900-\U0001F9FF"  # supplemental symbols
-        "\U0001FA00-\U0001FA6F"  # chess symbols
-        "]+",
-        flags=re.UNICODE
+        "[" + "".join(f"{chr(start)}-{chr(end)}" for start, end in EMOJI_RANGES) + "]+"
     )
     
     # URL 패턴
@@ -36,6 +42,21 @@ class TextCleaner:
     # 반복 문자 패턴 (예: "와아아아" -> "와아")
     REPEAT_PATTERN = re.compile(r'(.)\1{2,}')
     
+    # HTML 태그 / 이메일 / 특수 문자 / 공백 패턴 (호출마다 컴파일하지 않도록 클래스 로드 시 1회 컴파일)
+    HTML_PATTERN = re.compile(r'<[^>]+>')
+    EMAIL_PATTERN = re.compile(r'\S+@\S+')
+    # 한글, 영문, 숫자, 기본 구두점, 공백 외 문자 (한글 자음/모음 포함)
+    SPECIAL_CHAR_PATTERN = re.compile(r'[^\w\s가-힣\u3131-\u3163.,!?]')
+    # ASCII 텍스트용 특수 문자 -> 공백 변환 테이블 (SPECIAL_CHAR_PATTERN이 매칭하는 ASCII 문자로 생성)
+    ASCII_SPECIAL_CHAR_TABLE = str.maketrans(
+        dict.fromkeys(SPECIAL_CHAR_PATTERN.findall(''.join(map(chr, range(128)))), ' ')
+    )
+    WHITESPACE_PATTERN = re.compile(r'\s+')
+    
+    # 한국어 비율 계산용 패턴
+    KOREAN_CHAR_PATTERN = re.compile(r'[가-힣]')
+    WORD_CHAR_PATTERN = re.compile(r'[가-힣a-zA-Z0-9]')
+    
     # 한국어 stopwords (기본)
     KOREAN_STOPWORDS = {
         "이", "가", "을", "를", "에", "의", "와", "과", "도", "로", "으로",
@@ -43,6 +64,14 @@ class TextCleaner:
         "이것", "저것", "그런", "이런", "저런", "그렇게", "이렇게", "저렇게",
     }
     
+    def __init__(self, n_jobs: Optional[int] = 1):
+        """
+        Args:
+            n_jobs: clean_batch 병렬 처리 프로세스 수 (기본 1은 순차 처리, None이면 CPU 코어 수)
+        """
+        self.n_jobs = n_jobs or os.cpu_count() or 1
+        self._executor: Optional[ProcessPoolExecutor] = None
+    
     def clean_text(
         self,
         text: str,
@@ -69,19 +98,54 @@ class TextCleaner:
         if not text:
             return ""
         
+        # 기본 옵션이면 같은 텍스트(반복 기사, 공통 문구)의 정제 결과를 LRU 캐시에서 재사용
+        if remove_html and remove_urls and remove_emoji and normalize_whitespace and not remove_stopwords:
+            return _clean_default(text)
+        
+        return self._clean_text_uncached(
+            text, remove_html, remove_urls, remove_emoji, normalize_whitespace, remove_stopwords
+        )
+    
+    def _clean_text_uncached(
+        self,
+        text: str,
+        remove_html: bool,
+        remove_urls: bool,
+        remove_emoji: bool,
+        normalize_whitespace: bool,
+        remove_stopwords: bool,
+    ) -> str:
+        """
+        clean_text의 실제 정제 단계 (캐시 없이 항상 정규식 처리)
+        
+        Args:
+            text: 원본 텍스트 (빈 문자열 아님)
+            remove_html: HTML 태그 제거 여부
+            remove_urls: URL 제거 여부
+            remove_emoji: 이모지 제거 여부
+            normalize_whitespace: 공백 정규화 여부
+            remove_stopwords: stopwords 제거 여부
+            
+        Returns:
+            정제된 텍스트
+        """
+        # 1~3단계는 필수 문자('<', '://', '@')가 없으면 정규식 스캔 자체를 건너뜀
+        # (str의 in 검사는 C 레벨 memchr 수준이라 정규식 한 패스보다 훨씬 저렴)
+        
         # 1. HTML 태그 제거
-        if remove_html:
-            text = re.sub(r'<[^>]+>', '', text)
+        if remove_html and "<" in text:
+            text = self.HTML_PATTERN.sub('', text)
         
         # 2. URL 제거
-        if remove_urls:
+        if remove_urls and "://" in text:
             text = self.URL_PATTERN.sub('', text)
         
         # 3. 이메일 제거
-        text = re.sub(r'\S+@\S+', '', text)
+        if "@" in text:
+            text = self.EMAIL_PATTERN.sub('', text)
         
-        # 4. 이모지 제거
-        if remove_emoji:
+        # 4. 이모지 제거 (이모지 범위에 ASCII 문자는 없으므로 ASCII 텍스트는 건너뜀)
+        if remove_emoji and not text.isascii():
             text = self.EMOJI_PATTERN.sub('', text)
         
         # 5. 반복 문자 축약 (예: "와아아아" -> "와아")
@@ -89,7 +153,11 @@ class TextCleaner:
         
         # 6. 특수 문자 정리 (한글, 영문, 숫자, 기본 구두점, 공백만 유지)
         # 한글 자음/모음도 유지 (ㅋ, ㅎ 등 웃음 표현 보존)
-        text = re.sub(r'[^\w\s가-힣\u3131-\u3163.,!?]', ' ', text)
+        # ASCII 텍스트는 C 레벨 str.translate 테이블 치환이 정규식보다 빠름 (isascii()는 O(1))
+        if text.isascii():
+            text = text.translate(self.ASCII_SPECIAL_CHAR_TABLE)
+        else:
+            text = self.SPECIAL_CHAR_PATTERN.sub(' ', text)
         
         # 7. Stopwords 제거
         if remove_stopwords:
@@ -97,10 +165,9 @@ class TextCleaner:
             words = [w for w in words if w not in self.KOREAN_STOPWORDS]
             text = ' '.join(words)
         
-        # 8. 공백 정규화
+        # 8. 공백 정규화 (정규식 치환 + strip 대신 C 레벨 split/join 한 번)
         if normalize_whitespace:
-            text = re.sub(r'\s+', ' ', text)
-            text = text.strip()
+            text = ' '.join(text.split())
         
         return text
     
@@ -134,40 +201,52 @@ class TextCleaner:
             remove_stopwords=True,
         )
         
-        # 단어 분리 및 빈도 계산
-        words = cleaned_text.split()
-        word_freq = {}
-        
-        for word in words:
-            # 최소 길이 필터링
-            if len(word) < min_length:
-                continue
-            
-            # Stopwords 제외
-            if word in self.KOREAN_STOPWORDS:
-                continue
-            
-            word_freq[word] = word_freq.get(word, 0) + 1
-        
-        # 빈도순 정렬
-        sorted_words = sorted(word_freq.items(), key=lambda x: x[1], reverse=True)
-        
-        # 상위 k개 추출
-        keywords = [word for word, _ in sorted_words[:top_k]]
+        # 최소 길이/Stopwords 필터 후 빈도 계산 (Counter가 C 레벨에서 집계)
+        word_freq = Counter(
+            word for word in cleaned_text.split()
+            if len(word) >= min_length and word not in self.KOREAN_STOPWORDS
+        )
         
-        return keywords
+        # 상위 k개 추출 (전체 정렬 대신 힙 기반 most_common, 동률은 먼저 나온 단어 우선)
+        return [word for word, _ in word_freq.most_common(top_k)]
     
     def clean_batch(self, texts: List[str]) -> List[str]:
         """
         배치 텍스트 정제
         
+        정규식 처리는 GIL에 묶인 CPU 작업이므로 큰 배치는 프로세스 풀로 나눠 처리
+        (작은 배치나 n_jobs=1이면 순차 처리)
+        
         Args:
             texts: 텍스트 리스트
             
         Returns:
-            정제된 텍스트 리스트
+            정제된 텍스트 리스트 (입력 순서 유지)
         """
-        return [self.clean_text(text) for text in texts]
+        if self.n_jobs <= 1 or len(texts) < PARALLEL_MIN_BATCH:
+            return [self.clean_text(text) for text in texts]
+        
+        # 워커 풀은 처음 필요할 때 한 번만 생성하여 재사용
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.n_jobs)
+        
+        # 워커 프로세스마다 캐시가 따로 있으므로 같은 문자열(여러 키워드에 재등장한 기사, 빈 요약 등)은
+        # 한 번만 보내고 결과를 다시 펼침
+        unique_texts = list(dict.fromkeys(texts))
+        
+        # 워커당 몇 개의 청크로 나눠 전송 횟수를 줄이면서 부하도 고르게 분산
+        chunksize = max(1, len(unique_texts) // (self.n_jobs * 4))
+        cleaned = dict(zip(
+            unique_texts,
+            self._executor.map(_clean_default, unique_texts, chunksize=chunksize),
+        ))
+        return [cleaned[text] for text in texts]
+    
+    def close(self):
+        """clean_batch 워커 프로세스 풀 종료"""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
     
     def is_korean_dominant(self, text: str, threshold: float = 0.5) -> bool:
         """
@@ -183,14 +262,34 @@ class TextCleaner:
         if not text:
             return False
         
-        korean_pattern = re.compile(r'[가-힣]')
-        total_chars = len(re.findall(r'[가-힣a-zA-Z0-9]', text))
+        total_chars = len(self.WORD_CHAR_PATTERN.findall(text))
         
         if total_chars == 0:
             return False
         
-        korean_chars = len(korean_pattern.findall(text))
+        korean_chars = len(self.KOREAN_CHAR_PATTERN.findall(text))
         korean_ratio = korean_chars / total_chars
         
         return korean_ratio >= threshold
 
+
+# 기본 옵션 정제기 (워커 프로세스에서도 인스턴스를 pickle하지 않도록 모듈 수준에 둠)
+_default_cleaner = TextCleaner(n_jobs=1)
+
+
+@lru_cache(maxsize=CLEAN_CACHE_SIZE)
+def _clean_default(text: str) -> str:
+    """
+    기본 옵션으로 텍스트 정제 (clean_text 기본 경로 및 clean_batch 프로세스 풀 작업 함수)
+    
+    입력 문자열별 결과를 캐시 (같은 문자열 객체의 해시는 재계산되지 않으므로 조회 비용이 작음)
+    
+    Args:
+        text: 원본 텍스트
+        
+    Returns:
+        정제된 텍스트
+    """
+    if not text:
+        return ""
+    return _default_cleaner._clean_text_uncached(text, True, True, True, True, False)
@@ -3,6 +3,7 @@
 TorchScript, ONNX export, 모델 warm-up 기능
 """
 
+import time
 import torch
 import logging
 from typing import Optional, List, Dict
@@ -10,6 +11,11 @@ from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
+# 지원하는 양자화/정밀도 변환 방식
+QUANTIZATION_MODES = ("int8_dynamic", "fp16", "bf16")
+# GPU 메모리 사용량 캐시 유지 시간 (초, 메트릭 수집마다 CUDA 런타임을 조회하지 않도록)
+GPU_MEMORY_CACHE_TTL = 1.0
+
 
 class ModelOptimizer:
     """모델 최적화 클래스"""
@@ -28,6 +34,8 @@ class ModelOptimizer:
         self.model_name = model_name
         self.torchscript_model = None
         self.onnx_model_path = None
+        # (조회 시각(time.monotonic()), GPU 메모리 사용량) 캐시
+        self._gpu_memory_cache: tuple = (0.0, None)
         
         logger.info(f"모델 최적화기 초기화: {model_name}")
     
@@ -47,17 +55,69 @@ class ModelOptimizer:
         
         logger.info(f"모델 warm-up 시작: {num_iterations}회 반복")
         
+        # 샘플 텍스트는 반복마다 같으므로 한 배치로 한 번만 토큰화하고 디바이스로 이동
+        # (실제 부하에서 쓰이는 배치 행렬 연산 경로를 미리 데움)
+        device = getattr(self.model, "device", None)
+        try:
+            inputs = self.tokenizer(
+                sample_texts, return_tensors="pt", truncation=True, padding=True, max_length=512
+            )
+            if device is not None:
+                inputs = {k: v.to(device) for k, v in inputs.items()}
+        except Exception as e:
+            logger.warning(f"Warm-up 토큰화 오류: {e}")
+            return
+        
+        use_cuda = device is not None and device.type == "cuda"
+        if use_cuda:
+            # 배치 입력 크기에 맞는 가장 빠른 cuDNN 알고리즘을 선택하도록 함
+            torch.backends.cudnn.benchmark = True
+        
         for i in range(num_iterations):
-            for text in sample_texts:
-                try:
-                    inputs = self.tokenizer(text, return_tensors="pt", truncation=True, max_length=512)
-                    with torch.no_grad():
-                        _ = self.model(**inputs)
-                except Exception as e:
-                    logger.warning(f"Warm-up 오류 (반복 {i+1}): {e}")
+            try:
+                with torch.inference_mode():
+                    _ = self.model(**inputs)
+            except Exception as e:
+                logger.warning(f"Warm-up 오류 (반복 {i+1}): {e}")
+        
+        if use_cuda:
+            # 비동기로 실행된 GPU 커널이 끝난 뒤에 warm-up 완료로 처리
+            torch.cuda.synchronize(device)
         
         logger.info("모델 warm-up 완료")
     
+    def quantize(self, mode: str = "int8_dynamic"):
+        """
+        export 전 모델 가중치 정밀도 축소
+        
+        - int8_dynamic: Linear 레이어 INT8 동적 양자화 (CPU 추론용, Linear 비중이 큰
+          트랜스포머에서 보통 2~4배 빨라지고 정확도 손실은 작음)
+        - fp16 / bf16: 전체 가중치를 반정밀도로 변환 (GPU 추론용, 메모리 대역폭 절반)
+        
+        토크나이저 출력(input_ids, attention_mask)은 정수 텐서이므로 입력 변환은 필요 없음
+        
+        Args:
+            mode: 변환 방식 (QUANTIZATION_MODES 중 하나)
+        """
+        if mode not in QUANTIZATION_MODES:
+            raise ValueError(f"지원하지 않는 양자화 방식: {mode} (지원: {', '.join(QUANTIZATION_MODES)})")
+        
+        logger.info(f"모델 양자화 시작: {mode}")
+        self.model.eval()
+        
+        if mode == "int8_dynamic":
+            self.model = torch.ao.quantization.quantize_dynamic(
+                self.model, {torch.nn.Linear}, dtype=torch.qint8
+            )
+        elif mode == "fp16":
+            self.model = self.model.half()
+        else:
+            self.model = self.model.to(torch.bfloat16)
+        
+        # 이전 정밀도로 export한 결과는 더 이상 현재 모델과 맞지 않음
+        self.torchscript_model = None
+        logger.info(f"모델 양자화 완료: {mode}")
+    
     def export_torchscript(self, output_path: str, sample_text: str = "Sample text"):
         """
         TorchScript 형식으로 모델 export
@@ -73,9 +133,18 @@ class ModelOptimizer:
             self.model.eval()
             sample_inputs = self.tokenizer(sample_text, return_tensors="pt", truncation=True, max_length=512)
             
-            with torch.no_grad():
+            with torch.no_grad(), torch.jit.optimized_execution(True):
                 traced_model = torch.jit.trace(self.model, (sample_inputs["input_ids"], sample_inputs["attention_mask"]))
             
+            # 상수 폴딩/속성 인라인(freeze) 후 추론용 그래프 최적화 (연산자 fusion 등)
+            traced_model.eval()
+            traced_model = torch.jit.freeze(traced_model)
+            try:
+                traced_model = torch.jit.optimize_for_inference(traced_model)
+            except Exception as e:
+                # 일부 연산자는 추론 최적화 패스를 지원하지 않으므로 freeze 결과만 사용
+                logger.warning(f"TorchScript 추론 최적화 건너뜀: {e}")
+            
             # 저장
             output_file = Path(output_path)
             output_file.parent.mkdir(parents=True, exist_ok=True)
@@ -136,17 +205,22 @@ class ModelOptimizer:
         if not torch.cuda.is_available():
             return {"gpu_available": False}
         
+        cached_at, cached = self._gpu_memory_cache
+        now = time.monotonic()
+        if cached is not None and now - cached_at < GPU_MEMORY_CACHE_TTL:
+            return dict(cached)
+        
         try:
-            memory_allocated = torch.cuda.memory_allocated() / 1024**3  # GB
-            memory_reserved = torch.cuda.memory_reserved() / 1024**3  # GB
-            memory_max_allocated = torch.cuda.max_memory_allocated() / 1024**3  # GB
-            
-            return {
+            # memory_stats() 한 번으로 현재/최대 할당량과 예약량을 함께 조회
+            stats = torch.cuda.memory_stats()
+            result = {
                 "gpu_available": True,
-                "memory_allocated_gb": memory_allocated,
-                "memory_reserved_gb": memory_reserved,
-                "memory_max_allocated_gb": memory_max_allocated,
+                "memory_allocated_gb": stats.get("allocated_bytes.all.current", 0) / 1024**3,
+                "memory_reserved_gb": stats.get("reserved_bytes.all.current", 0) / 1024**3,
+                "memory_max_allocated_gb": stats.get("allocated_bytes.all.peak", 0) / 1024**3,
             }
+            self._gpu_memory_cache = (now, result)
+            return dict(result)
         
         except Exception as e:
             logger.error(f"GPU 메모리 사용량 조회 오류: {e}")
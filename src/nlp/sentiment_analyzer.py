@@ -5,8 +5,7 @@ KcELECTRA와 bert-base-multilingual 지원
 """
 
 import torch
-from transformers import pipeline, AutoTokenizer, AutoModelForSequenceClassification
-from typing import Dict, List, Union, Optional
+from typing import Callable, Dict, List, Union, Optional
 import logging
 import time
 
@@ -14,6 +13,34 @@ from src.nlp.model_optimizer import ModelOptimizer
 
 logger = logging.getLogger(__name__)
 
+# transformers.pipeline (import 비용이 커서 처음 모델을 만들 때 불러옴)
+_pipeline: Optional[Callable] = None
+
+# 배치 추론 기본 배치 크기
+DEFAULT_BATCH_SIZE = 32
+
+# 빈 텍스트나 분석 실패 시 반환하는 중립 결과
+DEFAULT_SENTIMENT = {
+    "positive": 0.5,
+    "negative": 0.5,
+    "neutral": 0.0,
+    "confidence": 0.0,
+}
+
+
+def _get_pipeline() -> Callable:
+    """
+    transformers.pipeline 함수 반환 (첫 호출 시에만 transformers import)
+    
+    Returns:
+        transformers.pipeline
+    """
+    global _pipeline
+    if _pipeline is None:
+        from transformers import pipeline
+        _pipeline = pipeline
+    return _pipeline
+
 
 class SentimentAnalyzer:
     """감정 분석기 클래스"""
@@ -53,7 +80,7 @@ class SentimentAnalyzer:
         
         try:
             # 감정 분석 파이프라인 초기화
-            self.analyzer = pipeline(
+            self.analyzer = _get_pipeline()(
                 "sentiment-analysis",
                 model=model_name,
                 device=device_index,
@@ -61,11 +88,9 @@ class SentimentAnalyzer:
             )
             logger.info(f"감정 분석기 초기화 완료: {model_name} (device: {device})")
             
-            # 모델 최적화기 초기화 (선택적)
+            # 모델 최적화기 초기화 (선택적, 같은 모델을 다시 로드하지 않고 파이프라인의 모델/토크나이저 공유)
             try:
-                tokenizer = AutoTokenizer.from_pretrained(model_name)
-                model = AutoModelForSequenceClassification.from_pretrained(model_name)
-                self.optimizer = ModelOptimizer(model, tokenizer, model_name)
+                self.optimizer = ModelOptimizer(self.analyzer.model, self.analyzer.tokenizer, model_name)
             except Exception as e:
                 logger.warning(f"모델 최적화기 초기화 실패 (선택적 기능): {e}")
         
@@ -73,7 +98,7 @@ class SentimentAnalyzer:
             logger.warning(f"모델 로드 실패, 기본 모델 사용: {e}")
             # 기본 모델로 폴백
             try:
-                self.analyzer = pipeline(
+                self.analyzer = _get_pipeline()(
                     "sentiment-analysis",
                     device=device_index,
                     return_all_scores=True,
@@ -114,26 +139,52 @@ class SentimentAnalyzer:
         self.is_warmed_up = True
         logger.info(f"모델 warm-up 완료 ({elapsed:.2f}초)")
     
-    def analyze_batch_optimized(self, texts: List[str], batch_size: int = 32) -> List[Dict[str, float]]:
+    def analyze_batch(self, texts: List[str], batch_size: int = DEFAULT_BATCH_SIZE) -> List[Dict[str, float]]:
         """
-        배치 최적화된 감정 분석
+        배치 감정 분석
+        
+        텍스트를 batch_size개씩 파이프라인에 한 번에 넘겨 패딩된 배치로 추론
+        (텍스트마다 모델을 호출하는 것보다 행렬 연산 효율이 높음).
+        배치 추론이 실패하면 해당 배치만 텍스트별 분석으로 대체
         
         Args:
             texts: 분석할 텍스트 리스트
             batch_size: 배치 크기
             
         Returns:
-            감정 점수 리스트
+            입력 순서와 같은 감정 점수 리스트 (빈 텍스트는 중립 결과)
         """
-        results = []
+        results = [dict(DEFAULT_SENTIMENT) for _ in texts]
+        indices = [i for i, text in enumerate(texts) if text and text.strip()]
         
-        for i in range(0, len(texts), batch_size):
-            batch = texts[i:i + batch_size]
-            batch_results = self._analyze_batch(batch)
-            results.extend(batch_results)
+        for start in range(0, len(indices), batch_size):
+            batch_indices = indices[start:start + batch_size]
+            batch_texts = [texts[i] for i in batch_indices]
+            
+            try:
+                outputs = self.analyzer(batch_texts, batch_size=batch_size, truncation=True)
+                for i, output in zip(batch_indices, outputs):
+                    results[i] = self._parse_output(output)
+            except Exception as e:
+                logger.warning("배치 감정 분석 오류, 개별 분석으로 대체: %s", e)
+                for i, text in zip(batch_indices, batch_texts):
+                    results[i] = self._analyze_single(text)
         
         return results
     
+    def analyze_batch_optimized(self, texts: List[str], batch_size: int = DEFAULT_BATCH_SIZE) -> List[Dict[str, float]]:
+        """
+        배치 최적화된 감정 분석 (analyze_batch와 동일)
+        
+        Args:
+            texts: 분석할 텍스트 리스트
+            batch_size: 배치 크기
+            
+        Returns:
+            감정 점수 리스트
+        """
+        return self.analyze_batch(texts, batch_size)
+    
     def get_top_k_probabilities(self, text: str, top_k: int = 3) -> List[Dict[str, float]]:
         """
         Top-K 확률 반환
@@ -196,106 +247,109 @@ class SentimentAnalyzer:
             감정 점수 딕셔너리
         """
         if not text or len(text.strip()) == 0:
-            return {
-                "positive": 0.5,
-                "negative": 0.5,
-                "neutral": 0.0,
-                "confidence": 0.0,
-            }
+            return dict(DEFAULT_SENTIMENT)
         
         try:
             # 파이프라인 실행
-            results = self.analyzer(text)
-            
-            # 결과 파싱
-            if isinstance(results, list) and len(results) > 0:
-                # return_all_scores=True인 경우
-                scores = results[0] if isinstance(results[0], list) else results
-                
-                # 라벨과 점수 추출
-                sentiment_dict = {}
-                max_score = 0.0
-                
-                for item in scores:
-                    if isinstance(item, dict):
-                        label = item.get("label", "").lower()
-                        score = item.get("score", 0.0)
-                        sentiment_dict[label] = score
-                        max_score = max(max_score, score)
-                
-                # 라벨 정규화 (다양한 모델 대응)
-                positive_score = 0.5
-                negative_score = 0.5
-                neutral_score = 0.0
-                
-                # 긍정 라벨 찾기
-                for key in ["positive", "pos", "긍정", "positive_1"]:
-                    if key in sentiment_dict:
-                        positive_score = sentiment_dict[key]
-                        break
-                
-                # 부정 라벨 찾기
-                for key in ["negative", "neg", "부정", "negative_1"]:
-                    if key in sentiment_dict:
-                        negative_score = sentiment_dict[key]
-                        break
-                
-                # 중립 라벨 찾기
-                for key in ["neutral", "neu", "중립"]:
-                    if key in sentiment_dict:
-                        neutral_score = sentiment_dict[key]
-                        break
-                
-                # 정규화 (합이 1이 되도록)
-                total = positive_score + negative_score + neutral_score
-                if total > 0:
-                    positive_score /= total
-                    negative_score /= total
-                    neutral_score /= total
-                
-                return {
-                    "positive": float(positive_score),
-                    "negative": float(negative_score),
-                    "neutral": float(neutral_score),
-                    "confidence": float(max_score),
-                }
-            
-            else:
-                # 단일 결과인 경우
-                if isinstance(results, dict):
-                    label = results.get("label", "").lower()
-                    score = results.get("score", 0.5)
-                    
-                    if "positive" in label or "pos" in label:
-                        return {
-                            "positive": float(score),
-                            "negative": float(1 - score),
-                            "neutral": 0.0,
-                            "confidence": float(score),
-                        }
-                    elif "negative" in label or "neg" in label:
-                        return {
-                            "positive": float(1 - score),
-                            "negative": float(score),
-                            "neutral": 0.0,
-                            "confidence": float(score),
-                        }
-                    else:
-                        return {
-                            "positive": 0.5,
-                            "negative": 0.5,
-                            "neutral": float(score),
-                            "confidence": float(score),
-                        }
+            return self._parse_output(self.analyzer(text))
         
         except Exception as e:
-            logger.error(f"감정 분석 오류: {e}")
+            logger.error("감정 분석 오류: %s", e)
+            return dict(DEFAULT_SENTIMENT)
+    
+    def _parse_output(self, results) -> Dict[str, float]:
+        """
+        파이프라인 출력 한 건을 감정 점수 딕셔너리로 변환
+        
+        Args:
+            results: 텍스트 하나에 대한 파이프라인 출력
+                (return_all_scores=True이면 라벨별 점수 리스트, 아니면 최고 라벨 딕셔너리)
+            
+        Returns:
+            감정 점수 딕셔너리
+        """
+        # 결과 파싱
+        if isinstance(results, list) and len(results) > 0:
+            # return_all_scores=True인 경우
+            scores = results[0] if isinstance(results[0], list) else results
+            
+            # 라벨과 점수 추출
+            sentiment_dict = {}
+            max_score = 0.0
+            
+            for item in scores:
+                if isinstance(item, dict):
+                    label = item.get("label", "").lower()
+                    score = item.get("score", 0.0)
+                    sentiment_dict[label] = score
+                    max_score = max(max_score, score)
+            
+            # 라벨 정규화 (다양한 모델 대응)
+            positive_score = 0.5
+            negative_score = 0.5
+            neutral_score = 0.0
+            
+            # 긍정 라벨 찾기
+            for key in ["positive", "pos", "긍정", "positive_1"]:
+                if key in sentiment_dict:
+                    positive_score = sentiment_dict[key]
+                    break
+            
+            # 부정 라벨 찾기
+            for key in ["negative", "neg", "부정", "negative_1"]:
+                if key in sentiment_dict:
+                    negative_score = sentiment_dict[key]
+                    break
+            
+            # 중립 라벨 찾기
+            for key in ["neutral", "neu", "중립"]:
+                if key in sentiment_dict:
+                    neutral_score = sentiment_dict[key]
+                    break
+            
+            # 정규화 (합이 1이 되도록)
+            total = positive_score + negative_score + neutral_score
+            if total > 0:
+                positive_score /= total
+                negative_score /= total
+                neutral_score /= total
+            
             return {
-                "positive": 0.5,
-                "negative": 0.5,
-                "neutral": 0.0,
-                "confidence": 0.0,
+                "positive": float(positive_score),
+                "negative": float(negative_score),
+                "neutral": float(neutral_score),
+                "confidence": float(max_score),
             }
+        
+        else:
+            # 단일 결과인 경우
+            if isinstance(results, dict):
+                label = results.get("label", "").lower()
+                score = results.get("score", 0.5)
+                
+                if "positive" in label or "pos" in label:
+                    return {
+                        "positive": float(score),
+                        "negative": float(1 - score),
+                        "neutral": 0.0,
+                        "confidence": float(score),
+                    }
+                elif "negative" in label or "neg" in label:
+                    return {
+                        "positive": float(1 - score),
+                        "negative": float(score),
+                        "neutral": 0.0,
+                        "confidence": float(score),
+                    }
+                else:
+                    return {
+                        "positive": 0.5,
+                        "negative": 0.5,
+                        "neutral": float(score),
+                        "confidence": float(score),
+                    }
+        
+        return dict(DEFAULT_SENTIMENT)
     
     def _analyze_batch(self, texts: List[str]) -> List[Dict[str, float]]:
         """
@@ -307,13 +361,7 @@ class SentimentAnalyzer:
         Returns:
             감정 점수 리스트
         """
-        results = []
-        
-        for text in texts:
-            result = self._analyze_single(text)
-            results.append(result)
-        
-        return results
+        return self.analyze_batch(texts)
     
     def get_sentiment_score(self, text: str) -> float:
         """
@@ -2,7 +2,7 @@
 비즈니스 로직 서비스 모듈
 """
 
-from .trend_service import TrendService
+from .trend_service import TrendService, get_trend_service
 
-__all__ = ["TrendService"]
+__all__ = ["TrendService", "get_trend_service"]
 
@@ -4,26 +4,46 @@ API 응답 시간, 모델 추론 latency, 스파이크 탐지 시간 측정
 """
 
 import time
-from typing import Dict, Optional
+import threading
+from time import perf_counter
+from typing import Deque, Dict, Optional, Tuple
 from datetime import datetime
-from collections import defaultdict
+from collections import Counter, deque
+from itertools import islice
 import logging
 from functools import wraps
 
+import numpy as np
+
 logger = logging.getLogger(__name__)
 
+# 메트릭 종류별로 유지할 최근 기록 수
+METRICS_HISTORY_SIZE = 1000
+# 요약 통계에 사용할 최근 기록 수
+SUMMARY_WINDOW = 100
+
+# 기록 형식: (엔드포인트/모델/방법 이름, 소요 시간(초), 기록 시각(time.monotonic()))
+MetricRecord = Tuple[str, float, float]
+
 
 class MetricsCollector:
     """메트릭 수집기 클래스"""
     
     def __init__(self):
         """메트릭 수집기 초기화"""
-        self.api_response_times: list = []
-        self.nlp_latencies: list = []
-        self.spike_detection_times: list = []
-        self.request_counts: Dict[str, int] = defaultdict(int)
-        self.error_counts: Dict[str, int] = defaultdict(int)
+        # maxlen deque는 가득 차면 가장 오래된 기록을 O(1)로 밀어냄
+        self.api_response_times: Deque[MetricRecord] = deque(maxlen=METRICS_HISTORY_SIZE)
+        self.nlp_latencies: Deque[MetricRecord] = deque(maxlen=METRICS_HISTORY_SIZE)
+        self.spike_detection_times: Deque[MetricRecord] = deque(maxlen=METRICS_HISTORY_SIZE)
+        self.request_counts: Counter = Counter()
+        # (엔드포인트, 에러 타입) 튜플 키 (Prometheus 출력 시 문자열 분리 불필요)
+        self.error_counts: Counter = Counter()
+        # 스레드풀에서 실행되는 동기 엔드포인트/모델 호출이 동시에 기록할 수 있으므로
+        # 카운트 증가(읽기-수정-쓰기)와 요약 중 순회를 잠금으로 보호 (free-threaded 빌드 포함)
+        self._lock = threading.Lock()
         self.service_start_time = datetime.now()
+        # 가동 시간은 시스템 시계 변경의 영향을 받지 않는 monotonic 기준으로 계산
+        self._start_monotonic = time.monotonic()
         
         logger.info("메트릭 수집기 초기화 완료")
     
@@ -35,15 +55,9 @@ class MetricsCollector:
             endpoint: 엔드포인트 이름
             duration: 응답 시간 (초)
         """
-        self.api_response_times.append({
-            "endpoint": endpoint,
-            "duration": duration,
-            "timestamp": datetime.now(),
-        })
-        
-        # 최근 1000개만 유지
-        if len(self.api_response_times) > 1000:
-            self.api_response_times = self.api_response_times[-1000:]
+        record = (endpoint, duration, time.monotonic())
+        with self._lock:
+            self.api_response_times.append(record)
     
     def record_nlp_latency(self, model_name: str, duration: float):
         """
@@ -53,15 +67,9 @@ class MetricsCollector:
             model_name: 모델 이름
             duration: 추론 시간 (초)
         """
-        self.nlp_latencies.append({
-            "model": model_name,
-            "duration": duration,
-            "timestamp": datetime.now(),
-        })
-        
-        # 최근 1000개만 유지
-        if len(self.nlp_latencies) > 1000:
-            self.nlp_latencies = self.nlp_latencies[-1000:]
+        record = (model_name, duration, time.monotonic())
+        with self._lock:
+            self.nlp_latencies.append(record)
     
     def record_spike_detection_time(self, method: str, duration: float):
         """
@@ -71,24 +79,19 @@ class MetricsCollector:
             method: 탐지 방법
             duration: 탐지 시간 (초)
         """
-        self.spike_detection_times.append({
-            "method": method,
-            "duration": duration,
-            "timestamp": datetime.now(),
-        })
-        
-        # 최근 1000개만 유지
-        if len(self.spike_detection_times) > 1000:
-            self.spike_detection_times = self.spike_detection_times[-1000:]
+        record = (method, duration, time.monotonic())
+        with self._lock:
+            self.spike_detection_times.append(record)
     
     def increment_request_count(self, endpoint: str):
         """요청 카운트 증가"""
-        self.request_counts[endpoint] += 1
+        with self._lock:
+            self.request_counts[endpoint] += 1
     
     def increment_error_count(self, endpoint: str, error_type: str = "unknown"):
         """에러 카운트 증가"""
-        key = f"{endpoint}:{error_type}"
-        self.error_counts[key] += 1
+        with self._lock:
+            self.error_counts[(endpoint, error_type)] += 1
     
     def get_metrics_summary(self) -> Dict:
         """
@@ -97,42 +100,26 @@ class MetricsCollector:
         Returns:
             메트릭 요약 딕셔너리
         """
-        # API 응답 시간 통계
-        api_durations = [m["duration"] for m in self.api_response_times[-100:]]
-        api_avg = sum(api_durations) / len(api_durations) if api_durations else 0.0
-        api_max = max(api_durations) if api_durations else 0.0
-        
-        # NLP latency 통계
-        nlp_durations = [m["duration"] for m in self.nlp_latencies[-100:]]
-        nlp_avg = sum(nlp_durations) / len(nlp_durations) if nlp_durations else 0.0
-        nlp_max = max(nlp_durations) if nlp_durations else 0.0
-        
-        # 스파이크 탐지 시간 통계
-        spike_durations = [m["duration"] for m in self.spike_detection_times[-100:]]
-        spike_avg = sum(spike_durations) / len(spike_durations) if spike_durations else 0.0
-        spike_max = max(spike_durations) if spike_durations else 0.0
+        with self._lock:
+            # 최근 기록 기준 소요 시간 통계 (평균/최대/실제 p50·p95 분위수)
+            api_stats = _duration_stats(self.api_response_times)
+            nlp_stats = _duration_stats(self.nlp_latencies)
+            spike_stats = _duration_stats(self.spike_detection_times)
+            request_counts = dict(self.request_counts)
+            error_counts = dict(self.error_counts)
         
         # 서비스 가동 시간
-        uptime = (datetime.now() - self.service_start_time).total_seconds()
+        uptime = time.monotonic() - self._start_monotonic
         
         return {
-            "api_response_time": {
-                "avg": api_avg,
-                "max": api_max,
-                "count": len(api_durations),
-            },
-            "nlp_latency": {
-                "avg": nlp_avg,
-                "max": nlp_max,
-                "count": len(nlp_durations),
+            "api_response_time": api_stats,
+            "nlp_latency": nlp_stats,
+            "spike_detection_time": spike_stats,
+            "request_counts": request_counts,
+            "error_counts": {
+                f"{endpoint}:{error_type}": count
+                for (endpoint, error_type), count in error_counts.items()
             },
-            "spike_detection_time": {
-                "avg": spike_avg,
-                "max": spike_max,
-                "count": len(spike_durations),
-            },
-            "request_counts": dict(self.request_counts),
-            "error_counts": dict(self.error_counts),
             "uptime_seconds": uptime,
             "timestamp": datetime.now().isoformat(),
         }
@@ -145,49 +132,84 @@ class MetricsCollector:
             Prometheus 포맷 문자열
         """
         summary = self.get_metrics_summary()
+        with self._lock:
+            error_counts = dict(self.error_counts)
         
-        metrics = []
-        
-        # API 응답 시간
-        metrics.append(f"# HELP api_response_time_seconds API 응답 시간")
-        metrics.append(f"# TYPE api_response_time_seconds summary")
-        metrics.append(f'api_response_time_seconds{{quantile="0.5"}} {summary["api_response_time"]["avg"]}')
-        metrics.append(f'api_response_time_seconds{{quantile="0.95"}} {summary["api_response_time"]["max"]}')
-        metrics.append(f'api_response_time_seconds_count {summary["api_response_time"]["count"]}')
-        
-        # NLP latency
-        metrics.append(f"# HELP nlp_latency_seconds NLP 모델 추론 시간")
-        metrics.append(f"# TYPE nlp_latency_seconds summary")
-        metrics.append(f'nlp_latency_seconds{{quantile="0.5"}} {summary["nlp_latency"]["avg"]}')
-        metrics.append(f'nlp_latency_seconds{{quantile="0.95"}} {summary["nlp_latency"]["max"]}')
-        metrics.append(f'nlp_latency_seconds_count {summary["nlp_latency"]["count"]}')
-        
-        # 스파이크 탐지 시간
-        metrics.append(f"# HELP spike_detection_time_seconds 스파이크 탐지 시간")
-        metrics.append(f"# TYPE spike_detection_time_seconds summary")
-        metrics.append(f'spike_detection_time_seconds{{quantile="0.5"}} {summary["spike_detection_time"]["avg"]}')
-        metrics.append(f'spike_detection_time_seconds{{quantile="0.95"}} {summary["spike_detection_time"]["max"]}')
-        metrics.append(f'spike_detection_time_seconds_count {summary["spike_detection_time"]["count"]}')
+        request_lines = "".join(
+            f'request_count_total{{endpoint="{endpoint}"}} {count}\n'
+            for endpoint, count in summary["request_counts"].items()
+        )
+        error_lines = "".join(
+            f'error_count_total{{endpoint="{endpoint}",error_type="{error_type}"}} {count}\n'
+            for (endpoint, error_type), count in error_counts.items()
+        )
         
-        # 요청 카운트
-        metrics.append(f"# HELP request_count_total 총 요청 수")
-        metrics.append(f"# TYPE request_count_total counter")
-        for endpoint, count in summary["request_counts"].items():
-            metrics.append(f'request_count_total{{endpoint="{endpoint}"}} {count}')
-        
-        # 에러 카운트
-        metrics.append(f"# HELP error_count_total 총 에러 수")
-        metrics.append(f"# TYPE error_count_total counter")
-        for error_key, count in summary["error_counts"].items():
-            endpoint, error_type = error_key.split(":", 1)
-            metrics.append(f'error_count_total{{endpoint="{endpoint}",error_type="{error_type}"}} {count}')
+        # 줄 단위 append 대신 고정 템플릿과 가변 구간 문자열을 한 번에 이어 붙임
+        return (
+            _format_summary_block("api_response_time_seconds", "API 응답 시간", summary["api_response_time"])
+            + _format_summary_block("nlp_latency_seconds", "NLP 모델 추론 시간", summary["nlp_latency"])
+            + _format_summary_block("spike_detection_time_seconds", "스파이크 탐지 시간", summary["spike_detection_time"])
+            + "# HELP request_count_total 총 요청 수\n"
+            + "# TYPE request_count_total counter\n"
+            + request_lines
+            + "# HELP error_count_total 총 에러 수\n"
+            + "# TYPE error_count_total counter\n"
+            + error_lines
+            + "# HELP service_uptime_seconds 서비스 가동 시간\n"
+            + "# TYPE service_uptime_seconds gauge\n"
+            + f'service_uptime_seconds {summary["uptime_seconds"]}'
+        )
+
+
+def _format_summary_block(name: str, help_text: str, stats: Dict) -> str:
+    """
+    소요 시간 통계를 Prometheus summary 형식 문자열로 변환
+    
+    Args:
+        name: 메트릭 이름
+        help_text: HELP 설명
+        stats: _duration_stats() 결과
         
-        # 서비스 가동 시간
-        metrics.append(f"# HELP service_uptime_seconds 서비스 가동 시간")
-        metrics.append(f"# TYPE service_uptime_seconds gauge")
-        metrics.append(f'service_uptime_seconds {summary["uptime_seconds"]}')
+    Returns:
+        HELP/TYPE/분위수/count 줄 (각 줄 끝 개행 포함)
+    """
+    return (
+        f"# HELP {name} {help_text}\n"
+        f"# TYPE {name} summary\n"
+        f'{name}{{quantile="0.5"}} {stats["p50"]}\n'
+        f'{name}{{quantile="0.95"}} {stats["p95"]}\n'
+        f'{name}_count {stats["count"]}\n'
+    )
+
+
+def _duration_stats(records: Deque[MetricRecord]) -> Dict:
+    """
+    최근 SUMMARY_WINDOW개 기록의 소요 시간 통계 계산
+    
+    deque 전체를 복사하지 않고 뒤에서부터 필요한 개수만 NumPy 배열로 읽은 뒤
+    평균/최대/분위수를 C 레벨에서 한 번에 계산
+    
+    Args:
+        records: 메트릭 기록 deque
         
-        return "\n".join(metrics)
+    Returns:
+        avg, max, p50, p95, count 키를 가진 통계 딕셔너리 (기록이 없으면 모두 0)
+    """
+    durations = np.fromiter(
+        (duration for _, duration, _ in islice(reversed(records), SUMMARY_WINDOW)),
+        dtype=np.float64,
+    )
+    if durations.size == 0:
+        return {"avg": 0.0, "max": 0.0, "p50": 0.0, "p95": 0.0, "count": 0}
+    
+    p50, p95 = np.quantile(durations, [0.5, 0.95])
+    return {
+        "avg": float(durations.mean()),
+        "max": float(durations.max()),
+        "p50": float(p50),
+        "p95": float(p95),
+        "count": int(durations.size),
+    }
 
 
 # 전역 메트릭 수집기 인스턴스
@@ -205,18 +227,22 @@ def monitor_api_response(endpoint: str):
         데코레이터 함수
     """
     def decorator(func):
+        # 호출마다 반복되는 속성 조회를 피하도록 데코레이터 적용 시 한 번만 바인딩
+        increment_request = metrics_collector.increment_request_count
+        increment_error = metrics_collector.increment_error_count
+        record = metrics_collector.record_api_response_time
+        
         @wraps(func)
         async def wrapper(*args, **kwargs):
-            start_time = time.time()
-            metrics_collector.increment_request_count(endpoint)
+            start_time = perf_counter()
+            increment_request(endpoint)
             
             try:
                 result = await func(*args, **kwargs)
-                duration = time.time() - start_time
-                metrics_collector.record_api_response_time(endpoint, duration)
+                record(endpoint, perf_counter() - start_time)
                 return result
             except Exception as e:
-                metrics_collector.increment_error_count(endpoint, type(e).__name__)
+                increment_error(endpoint, type(e).__name__)
                 raise
         
         return wrapper
@@ -234,12 +260,13 @@ def monitor_nlp_latency(model_name: str):
         데코레이터 함수
     """
     def decorator(func):
+        record = metrics_collector.record_nlp_latency
+        
         @wraps(func)
         def wrapper(*args, **kwargs):
-            start_time = time.time()
+            start_time = perf_counter()
             result = func(*args, **kwargs)
-            duration = time.time() - start_time
-            metrics_collector.record_nlp_latency(model_name, duration)
+            record(model_name, perf_counter() - start_time)
             return result
         
         return wrapper
@@ -257,12 +284,13 @@ def monitor_spike_detection(method: str):
         데코레이터 함수
     """
     def decorator(func):
+        record = metrics_collector.record_spike_detection_time
+        
         @wraps(func)
         def wrapper(*args, **kwargs):
-            start_time = time.time()
+            start_time = perf_counter()
             result = func(*args, **kwargs)
-            duration = time.time() - start_time
-            metrics_collector.record_spike_detection_time(method, duration)
+            record(method, perf_counter() - start_time)
             return result
         
         return wrapper
@@ -3,6 +3,9 @@
 데이터 수집부터 감정 분석, 스파이크 감지까지 통합 서비스
 """
 
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from dataclasses import dataclass
+from functools import lru_cache
 from typing import List, Dict, Optional
 from datetime import datetime, timedelta
 import pandas as pd
@@ -12,13 +15,51 @@ import logging
 from src.data.rss_collector import RSSCollector
 from src.data.google_news_collector import GoogleNewsCollector
 from src.data.text_cleaner import TextCleaner
-from src.nlp.sentiment_analyzer import SentimentAnalyzer
+from src.nlp.sentiment_analyzer import SentimentAnalyzer, DEFAULT_BATCH_SIZE
 from src.anomaly.zscore_detector import ZScoreDetector
 from src.anomaly.moving_average_detector import MovingAverageDetector
 from src.anomaly.spike_detector import SpikeDetector
 
 logger = logging.getLogger(__name__)
 
+# 수집기 하나를 기다리는 최대 시간 (초)
+COLLECT_TIMEOUT = 30
+
+
+@dataclass
+class TimeSeries:
+    """시간 윈도우별 감정 집계 (열마다 같은 길이의 NumPy 배열, 시간순 정렬)"""
+    timestamp: np.ndarray  # datetime64[s]
+    avg_sentiment: np.ndarray  # float64
+    count: np.ndarray  # int64
+    avg_confidence: np.ndarray  # float64
+    
+    def __len__(self) -> int:
+        """시간 윈도우 개수"""
+        return len(self.timestamp)
+    
+    def to_records(self) -> List[Dict]:
+        """
+        API 응답용 레코드 리스트로 변환
+        
+        Returns:
+            [{'timestamp': 'YYYY-MM-DDTHH:MM:SS', 'avg_sentiment': float, 'count': int, 'avg_confidence': float}, ...]
+        """
+        return [
+            {
+                "timestamp": timestamp,
+                "avg_sentiment": avg_sentiment,
+                "count": count,
+                "avg_confidence": avg_confidence,
+            }
+            for timestamp, avg_sentiment, count, avg_confidence in zip(
+                np.datetime_as_string(self.timestamp, unit="s").tolist(),
+                self.avg_sentiment.tolist(),
+                self.count.tolist(),
+                self.avg_confidence.tolist(),
+            )
+        ]
+
 
 class TrendService:
     """트렌드 분석 서비스 클래스"""
@@ -58,8 +99,8 @@ class TrendService:
         self.rss_collector = RSSCollector(rss_urls=rss_urls, config_path=config_path)
         self.google_collector = GoogleNewsCollector(api_key=google_news_api_key, config_path=config_path)
         
-        # 전처리기 초기화
-        self.text_cleaner = TextCleaner()
+        # 전처리기 초기화 (API 서버 스레드 안에서 프로세스 풀을 fork하지 않도록 순차 정제)
+        self.text_cleaner = TextCleaner(n_jobs=1)
         
         # 감정 분석기 초기화
         self.sentiment_analyzer = SentimentAnalyzer(model_name=sentiment_model)
@@ -93,94 +134,117 @@ class TrendService:
         # 1. 데이터 수집
         news_items = []
         
-        # RSS 수집
-        try:
-            rss_items = self.rss_collector.collect(keyword=keyword, max_results=max_results)
-            news_items.extend(rss_items)
-            logger.info(f"RSS에서 {len(rss_items)}개 뉴스 수집")
-        except Exception as e:
-            logger.error(f"RSS 수집 오류: {e}")
+        # RSS와 Google News는 서로 독립적인 네트워크 대기이므로 동시에 요청
+        # (전체 대기 시간 ≈ 둘 중 느린 쪽)
+        executor = ThreadPoolExecutor(max_workers=2)
+        futures = [
+            ("RSS", executor.submit(self.rss_collector.collect, keyword=keyword, max_results=max_results)),
+            ("Google News", executor.submit(self.google_collector.collect, keyword=keyword, max_results=max_results)),
+        ]
         
-        # Google News 수집
-        try:
-            google_items = self.google_collector.collect(keyword=keyword, max_results=max_results)
-            news_items.extend(google_items)
-            logger.info(f"Google News에서 {len(google_items)}개 뉴스 수집")
-        except Exception as e:
-            logger.error(f"Google News 수집 오류: {e}")
+        # RSS → Google News 순서로 결과 병합
+        for source, future in futures:
+            try:
+                items = future.result(timeout=COLLECT_TIMEOUT)
+                news_items.extend(items)
+                logger.info("%s에서 %d개 뉴스 수집", source, len(items))
+            except FutureTimeoutError:
+                logger.error("%s 수집 타임아웃", source)
+            except Exception as e:
+                logger.error("%s 수집 오류: %s", source, e)
+        
+        # 타임아웃된 요청을 기다리지 않고 진행
+        executor.shutdown(wait=False)
         
         if not news_items:
             logger.warning(f"수집된 뉴스가 없습니다: {keyword}")
             return self._empty_result(keyword)
         
-        # 2. 전처리
-        processed_items = []
-        for item in news_items:
-            # 텍스트 정제
-            title = self.text_cleaner.clean_text(item.get("title", ""))
-            summary = self.text_cleaner.clean_text(item.get("summary", ""))
+        # 2. 전처리 (링크가 있는 아이템의 제목/요약을 한 배치로 정제)
+        candidates = [item for item in news_items if item.get("link")]
+        texts = []
+        for item in candidates:
+            texts.append(item.get("title", ""))
+            texts.append(item.get("summary", ""))
+        cleaned = self.text_cleaner.clean_batch(texts)
+        
+        # 중복 제거 (링크 기준, 처음 나온 아이템 유지, 정제 결과가 비어 있는 아이템은 채택하지 않음)
+        # (정제 결과를 보고 채택 여부를 정하므로 np.unique 첫 인덱스 방식은 쓸 수 없고, dict 방식이 더 빠름)
+        unique_by_link = {}
+        for i, item in enumerate(candidates):
+            link = item["link"]
+            if link in unique_by_link:
+                continue
             
+            title = cleaned[2 * i]
+            summary = cleaned[2 * i + 1]
             if not title and not summary:
                 continue
             
             item["title_cleaned"] = title
             item["summary_cleaned"] = summary
-            processed_items.append(item)
+            unique_by_link[link] = item
         
-        # 중복 제거 (링크 기준)
-        seen_links = set()
-        unique_items = []
-        for item in processed_items:
-            link = item.get("link", "")
-            if link and link not in seen_links:
-                seen_links.add(link)
-                unique_items.append(item)
+        unique_items = list(unique_by_link.values())
         
         logger.info(f"전처리 완료: {len(unique_items)}개 고유 뉴스")
         
-        # 3. 감정 분석
-        sentiment_results = []
+        # 3. 감정 분석 (텍스트를 모아 배치 추론)
+        sentiment_items = []
+        texts = []
         for item in unique_items:
             text = f"{item.get('title_cleaned', '')} {item.get('summary_cleaned', '')}"
             
             if not text.strip():
                 continue
             
-            try:
-                sentiment = self.sentiment_analyzer.analyze(text)
-                sentiment_score = sentiment.get("positive", 0.5)
-                confidence = sentiment.get("confidence", 0.0)
-                
-                item["sentiment"] = sentiment
-                item["sentiment_score"] = sentiment_score
-                item["confidence"] = confidence
-                sentiment_results.append(sentiment_score)
-            except Exception as e:
-                logger.error(f"감정 분석 오류: {e}")
+            sentiment_items.append(item)
+            texts.append(text)
+        
+        try:
+            sentiments = self.sentiment_analyzer.analyze_batch(texts, batch_size=DEFAULT_BATCH_SIZE)
+        except Exception as e:
+            logger.error("감정 분석 오류: %s", e)
+            sentiments = [None] * len(sentiment_items)
+        
+        # 성공한 감정 점수를 미리 할당한 배열에 순서대로 채움 (리스트 → 배열 변환 없이 평균 계산)
+        sentiment_results = np.empty(len(sentiment_items), dtype=np.float64)
+        analyzed_count = 0
+        for item, sentiment in zip(sentiment_items, sentiments):
+            if sentiment is None:
                 item["sentiment_score"] = 0.5
                 item["confidence"] = 0.0
+                continue
+            
+            sentiment_score = sentiment.get("positive", 0.5)
+            item["sentiment"] = sentiment
+            item["sentiment_score"] = sentiment_score
+            item["confidence"] = sentiment.get("confidence", 0.0)
+            sentiment_results[analyzed_count] = sentiment_score
+            analyzed_count += 1
         
         # 4. 시계열 데이터 생성
         time_series = self._create_time_series(unique_items, time_window_hours)
         
-        if not time_series:
+        if time_series is None:
             logger.warning("시계열 데이터 생성 실패")
             return self._empty_result(keyword)
         
         # 5. 스파이크 감지
-        df_time_series = pd.DataFrame(time_series)
-        spikes = self.spike_detector.detect(df_time_series, column="avg_sentiment", return_details=True)
+        # 감성 값 배열을 세 감지기가 그대로 공유 (감지기마다 데이터프레임을 만들지 않음)
+        sentiments = time_series.avg_sentiment
+        spikes = self.spike_detector.detect(sentiments, return_details=True)
         
         # 6. 이상치 감지
-        zscore_anomalies = self.zscore_detector.detect(df_time_series, column="avg_sentiment")
-        moving_avg_anomalies = self.moving_avg_detector.detect(df_time_series, column="avg_sentiment")
+        zscore_anomalies = self.zscore_detector.detect(sentiments)
+        moving_avg_anomalies = self.moving_avg_detector.detect(sentiments)
         
         # 7. 결과 집계
         result = {
             "keyword": keyword,
             "total_news": len(unique_items),
-            "avg_sentiment": float(np.mean(sentiment_results)) if sentiment_results else 0.5,
-            "time_series": time_series,
+            "avg_sentiment": float(sentiment_results[:analyzed_count].mean()) if analyzed_count else 0.5,
+            "time_series": time_series.to_records(),
             "spikes": spikes,
             "anomalies": {
                 "zscore": zscore_anomalies,
@@ -200,7 +264,7 @@ class TrendService:
         self,
         news_items: List[Dict],
         time_window_hours: int,
-    ) -> List[Dict]:
+    ) -> Optional[TimeSeries]:
         """
         시계열 데이터 생성 (시간별 기사 감정 평균)
         
@@ -209,41 +273,51 @@ class TrendService:
             time_window_hours: 시간 윈도우
             
         Returns:
-            시계열 데이터 리스트
+            시계열 데이터 (유효한 아이템이 없으면 None)
         """
         if not news_items:
-            return []
-        
-        # 데이터프레임 생성
-        df = pd.DataFrame(news_items)
-        
-        # pubDate 파싱
-        df["published_dt"] = pd.to_datetime(df["pubDate"], errors="coerce", format="%Y-%m-%d %H:%M:%S")
+            return None
+        
+        # 집계에 쓰는 세 열만 뽑아 데이터프레임 생성 (제목/요약/감정 dict 등 나머지 열은 복사하지 않음,
+        # 숫자 열은 float64 배열로 바로 만들어 dtype 추론 생략, None은 NaN으로 변환)
+        df = pd.DataFrame({
+            "pubDate": [item.get("pubDate") for item in news_items],
+            "sentiment_score": np.array(
+                [item.get("sentiment_score") for item in news_items], dtype=np.float64
+            ),
+            "confidence": np.array(
+                [item.get("confidence") for item in news_items], dtype=np.float64
+            ),
+        }, copy=False)
+        
+        # pubDate 파싱 (고정 형식이라 C 레벨 ISO 파서로 바로 변환되므로, 수백~수천 건 규모에서는
+        # 고유값 추출 후 매핑하는 cache 단계가 오히려 느림)
+        df["published_dt"] = pd.to_datetime(
+            df["pubDate"], errors="coerce", format="%Y-%m-%d %H:%M:%S", cache=False
+        )
         df = df.dropna(subset=["published_dt", "sentiment_score"])
         
         if df.empty:
-            return []
+            return None
         
         # 시간 윈도우별 집계
-        df["time_bin"] = df["published_dt"].dt.floor(f"{time_window_hours}H")
-        
-        grouped = df.groupby("time_bin").agg({
-            "sentiment_score": ["mean", "count"],
-            "confidence": "mean",
-        }).reset_index()
-        
-        grouped.columns = ["timestamp", "avg_sentiment", "count", "avg_confidence"]
-        
-        time_series = []
-        for _, row in grouped.iterrows():
-            time_series.append({
-                "timestamp": row["timestamp"].isoformat(),
-                "avg_sentiment": float(row["avg_sentiment"]),
-                "count": int(row["count"]),
-                "avg_confidence": float(row["avg_confidence"]) if not pd.isna(row["avg_confidence"]) else 0.0,
-            })
+        # (빈도 문자열 "H"는 pandas 3에서 제거되었으므로 Timedelta로 지정)
+        df["time_bin"] = df["published_dt"].dt.floor(pd.Timedelta(hours=time_window_hours))
+        
+        # named aggregation으로 MultiIndex 열 생성/평탄화 없이 바로 결과 열 이름 지정
+        grouped = df.groupby("time_bin").agg(
+            avg_sentiment=("sentiment_score", "mean"),
+            count=("sentiment_score", "count"),
+            avg_confidence=("confidence", "mean"),
+        )
         
-        return sorted(time_series, key=lambda x: x["timestamp"])
+        # 열별 배열로 보관하고 레코드 변환은 응답을 만들 때 한 번만 수행 (groupby 결과는 이미 시간순 정렬)
+        return TimeSeries(
+            timestamp=grouped.index.to_numpy(dtype="datetime64[s]"),
+            avg_sentiment=grouped["avg_sentiment"].to_numpy(dtype=np.float64),
+            count=grouped["count"].to_numpy(dtype=np.int64),
+            avg_confidence=grouped["avg_confidence"].to_numpy(dtype=np.float64, na_value=0.0),
+        )
     
     def _empty_result(self, keyword: str) -> Dict:
         """빈 결과 반환"""
@@ -290,3 +364,17 @@ class TrendService:
         # 현재는 빈 리스트 반환 (확장 가능)
         logger.info(f"최근 스파이크 {limit}개 조회")
         return []
+
+
+@lru_cache(maxsize=1)
+def get_trend_service(config_path: Optional[str] = None) -> TrendService:
+    """
+    프로세스 전역 TrendService 반환 (감정 분석 모델 로드는 프로세스당 한 번)
+    
+    Args:
+        config_path: 설정 파일 경로
+        
+    Returns:
+        TrendService 인스턴스 (같은 config_path면 같은 인스턴스)
+    """
+    return TrendService(config_path=config_path)
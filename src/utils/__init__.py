@@ -3,6 +3,7 @@
 """
 
 from .config import load_config
+from .hashing import hash_bytes
 from .logger import setup_logger
 from .logging import setup_logger as setup_logger_v2, get_logger, log_function_call, log_execution_time
 from .errors import (
@@ -19,6 +20,7 @@ from .errors import (
 
 __all__ = [
     "load_config",
+    "hash_bytes",
     "setup_logger",
     "setup_logger_v2",
     "get_logger",
@@ -3,14 +3,40 @@
 YAML 설정 파일을 로드하고 검증하는 유틸리티
 """
 
+import copy
 import yaml
 import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Any
 import logging
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # 선택적 의존성 (libyaml 없이 빌드된 PyYAML이면 순수 파이썬 로더 사용)
+    from yaml import SafeLoader
+
 logger = logging.getLogger(__name__)
 
+# 파싱 결과를 보관할 설정 파일 수
+CONFIG_CACHE_SIZE = 8
+
+
+@lru_cache(maxsize=CONFIG_CACHE_SIZE)
+def _load_config_cached(resolved_path: str, mtime_ns: int) -> Any:
+    """
+    설정 파일 파싱 결과 캐시 (수정 시각이 키에 포함되므로 파일이 바뀌면 다시 파싱)
+    
+    Args:
+        resolved_path: 절대 경로
+        mtime_ns: 파일 수정 시각 (나노초)
+        
+    Returns:
+        파싱된 설정 객체
+    """
+    with open(resolved_path, "r", encoding="utf-8") as f:
+        return yaml.load(f, Loader=SafeLoader)
+
 
 def load_config(config_path: str) -> Dict[str, Any]:
     """
@@ -32,11 +58,12 @@ def load_config(config_path: str) -> Dict[str, Any]:
         raise FileNotFoundError(f"설정 파일을 찾을 수 없습니다: {config_path}")
     
     try:
-        with open(config_file, "r", encoding="utf-8") as f:
-            config = yaml.safe_load(f)
+        resolved = config_file.resolve()
+        config = _load_config_cached(str(resolved), resolved.stat().st_mtime_ns)
         
         logger.info(f"설정 파일 로드 완료: {config_path}")
-        return config
+        # 호출자가 수정해도 캐시된 설정이 바뀌지 않도록 복사본 반환
+        return copy.deepcopy(config)
     
     except yaml.YAMLError as e:
         logger.error(f"YAML 파싱 오류: {e}")
@@ -0,0 +1,27 @@
+"""
+해싱 유틸리티
+캐시 키, ETag, 중복 링크 판정에 쓰는 비암호화 64비트 해시
+"""
+
+import hashlib
+
+try:
+    import xxhash
+except ImportError:  # 선택적 의존성
+    xxhash = None
+
+
+def hash_bytes(data: bytes) -> int:
+    """
+    바이트열을 64비트 정수로 해싱 (비암호화 용도)
+    
+    Args:
+        data: 해싱할 바이트열
+    
+    Returns:
+        64비트 해시 값
+    """
+    if xxhash is not None:
+        return xxhash.xxh3_64_intdigest(data)
+    # xxhash가 없으면 표준 라이브러리 BLAKE2b로 64비트 다이제스트를 직접 생성
+    return int.from_bytes(hashlib.blake2b(data, digest_size=8).digest(), "big")
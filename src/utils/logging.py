@@ -119,13 +119,17 @@ def log_function_call(logger: logging.Logger):
     """
     def decorator(func):
         def wrapper(*args, **kwargs):
-            logger.debug(f"Calling {func.__name__} with args={args}, kwargs={kwargs}")
+            # 인자 repr은 큰 리스트에서 비싸므로 DEBUG가 꺼져 있으면 만들지 않음
+            debug = logger.isEnabledFor(logging.DEBUG)
+            if debug:
+                logger.debug("Calling %s with args=%r, kwargs=%r", func.__name__, args, kwargs)
             try:
                 result = func(*args, **kwargs)
-                logger.debug(f"{func.__name__} completed successfully")
+                if debug:
+                    logger.debug("%s completed successfully", func.__name__)
                 return result
             except Exception as e:
-                logger.error(f"{func.__name__} failed with error: {e}", exc_info=True)
+                logger.error("%s failed with error: %s", func.__name__, e, exc_info=True)
                 raise
         return wrapper
     return decorator
@@ -144,15 +148,15 @@ def log_execution_time(logger: logging.Logger):
     def decorator(func):
         def wrapper(*args, **kwargs):
             start_time = datetime.now()
-            logger.info(f"Starting {func.__name__}")
+            logger.info("Starting %s", func.__name__)
             try:
                 result = func(*args, **kwargs)
                 elapsed = (datetime.now() - start_time).total_seconds()
-                logger.info(f"{func.__name__} completed in {elapsed:.2f}s")
+                logger.info("%s completed in %.2fs", func.__name__, elapsed)
                 return result
             except Exception as e:
                 elapsed = (datetime.now() - start_time).total_seconds()
-                logger.error(f"{func.__name__} failed after {elapsed:.2f}s: {e}", exc_info=True)
+                logger.error("%s failed after %.2fs: %s", func.__name__, elapsed, e, exc_info=True)
                 raise
         return wrapper
     return decorator
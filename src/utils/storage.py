@@ -3,15 +3,36 @@
 Parquet, DeltaLake, S3 업로드 기능
 """
 
-import json
+import time
+import orjson
+import uuid
 import pandas as pd
 from pathlib import Path
 from typing import List, Dict, Optional
-from datetime import datetime
+from datetime import datetime, timedelta
 import logging
 
+try:
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+except ImportError:  # 선택적 의존성 (Parquet 저장/로드에 필요)
+    pa = None
+    ds = None
+
 logger = logging.getLogger(__name__)
 
+# 데이터셋 중복 제거 기준 열 (같은 키는 나중에 저장한 행 유지)
+DEDUP_COLUMNS = ["timestamp", "keyword"]
+
+# Parquet 파일 쓰기 옵션 (ZSTD 압축, 행 그룹별 min/max 통계로 로드 시 행 그룹 건너뛰기)
+PARQUET_COMPRESSION = "zstd"
+PARQUET_COMPRESSION_LEVEL = 3
+PARQUET_ROW_GROUP_SIZE = 64_000
+
+# S3 멀티파트 업로드 설정 (이 크기 이상이면 파트로 나눠 동시에 전송)
+S3_MULTIPART_CHUNKSIZE = 8 * 1024 * 1024
+S3_MAX_CONCURRENCY = 10
+
 
 class DataStorage:
     """데이터 저장 클래스"""
@@ -26,8 +47,9 @@ class DataStorage:
         self.base_path = Path(base_path)
         self.raw_path = self.base_path / "database" / "news_raw.jsonl"
         self.clean_path = self.base_path / "database" / "news_clean.jsonl"
-        self.sentiment_path = self.base_path / "database" / "sentiment.parquet"
-        self.spikes_path = self.base_path / "database" / "spikes.parquet"
+        # 키워드별 파티션 Parquet 데이터셋 디렉토리 (저장마다 새 파일을 추가)
+        self.sentiment_path = self.base_path / "database" / "sentiment"
+        self.spikes_path = self.base_path / "database" / "spikes"
         
         # 디렉토리 생성
         self.base_path.mkdir(parents=True, exist_ok=True)
@@ -43,10 +65,7 @@ class DataStorage:
             news_items: 뉴스 아이템 리스트
         """
         try:
-            with open(self.raw_path, "a", encoding="utf-8") as f:
-                for item in news_items:
-                    json.dump(item, f, ensure_ascii=False)
-                    f.write("\n")
+            self._append_jsonl(news_items, self.raw_path)
             
             logger.info(f"원본 뉴스 {len(news_items)}개 저장 완료: {self.raw_path}")
         
@@ -62,10 +81,7 @@ class DataStorage:
             news_items: 전처리된 뉴스 아이템 리스트
         """
         try:
-            with open(self.clean_path, "a", encoding="utf-8") as f:
-                for item in news_items:
-                    json.dump(item, f, ensure_ascii=False)
-                    f.write("\n")
+            self._append_jsonl(news_items, self.clean_path)
             
             logger.info(f"전처리 뉴스 {len(news_items)}개 저장 완료: {self.clean_path}")
         
@@ -73,6 +89,24 @@ class DataStorage:
             logger.error(f"전처리 뉴스 저장 오류: {e}")
             raise
     
+    def _append_jsonl(self, items: List[Dict], path: Path):
+        """
+        아이템을 JSONL 파일 끝에 추가 (한 번에 인코딩해 한 번의 write로 저장)
+        
+        Args:
+            items: 저장할 아이템 리스트
+            path: JSONL 파일 경로
+        """
+        if not items:
+            return
+        
+        # orjson은 UTF-8로 바로 인코딩하므로 한글도 이스케이프되지 않음
+        payload = b"\n".join(
+            orjson.dumps(item, option=orjson.OPT_SERIALIZE_NUMPY) for item in items
+        ) + b"\n"
+        with open(path, "ab") as f:
+            f.write(payload)
+    
     def save_sentiment_data(self, sentiment_data: List[Dict]):
         """
         감정 분석 데이터를 Parquet 형식으로 저장
@@ -84,17 +118,7 @@ class DataStorage:
             if not sentiment_data:
                 return
             
-            df = pd.DataFrame(sentiment_data)
-            
-            # 기존 파일이 있으면 병합
-            if self.sentiment_path.exists():
-                existing_df = pd.read_parquet(self.sentiment_path)
-                df = pd.concat([existing_df, df], ignore_index=True)
-                # 중복 제거 (타임스탬프 기준)
-                df = df.drop_duplicates(subset=["timestamp", "keyword"], keep="last")
-            
-            # Parquet로 저장
-            df.to_parquet(self.sentiment_path, index=False, engine="pyarrow")
+            self._append_dataset(sentiment_data, self.sentiment_path)
             
             logger.info(f"감정 분석 데이터 {len(sentiment_data)}개 저장 완료: {self.sentiment_path}")
         
@@ -113,17 +137,7 @@ class DataStorage:
             if not spikes_data:
                 return
             
-            df = pd.DataFrame(spikes_data)
-            
-            # 기존 파일이 있으면 병합
-            if self.spikes_path.exists():
-                existing_df = pd.read_parquet(self.spikes_path)
-                df = pd.concat([existing_df, df], ignore_index=True)
-                # 중복 제거
-                df = df.drop_duplicates(subset=["timestamp", "keyword"], keep="last")
-            
-            # Parquet로 저장
-            df.to_parquet(self.spikes_path, index=False, engine="pyarrow")
+            self._append_dataset(spikes_data, self.spikes_path)
             
             logger.info(f"스파이크 데이터 {len(spikes_data)}개 저장 완료: {self.spikes_path}")
         
@@ -149,22 +163,7 @@ class DataStorage:
             감정 분석 데이터프레임
         """
         try:
-            if not self.sentiment_path.exists():
-                return pd.DataFrame()
-            
-            df = pd.read_parquet(self.sentiment_path)
-            
-            # 필터링
-            if keyword:
-                df = df[df["keyword"] == keyword]
-            
-            if start_date:
-                df = df[pd.to_datetime(df["timestamp"]) >= start_date]
-            
-            if end_date:
-                df = df[pd.to_datetime(df["timestamp"]) <= end_date]
-            
-            return df
+            return self._load_dataset(self.sentiment_path, keyword, start_date, end_date)
         
         except Exception as e:
             logger.error(f"감정 분석 데이터 로드 오류: {e}")
@@ -188,26 +187,155 @@ class DataStorage:
             스파이크 데이터프레임
         """
         try:
-            if not self.spikes_path.exists():
-                return pd.DataFrame()
-            
-            df = pd.read_parquet(self.spikes_path)
+            return self._load_dataset(self.spikes_path, keyword, start_date, end_date)
+        
+        except Exception as e:
+            logger.error(f"스파이크 데이터 로드 오류: {e}")
+            return pd.DataFrame()
+    
+    def _append_dataset(self, records: List[Dict], dataset_path: Path):
+        """
+        레코드를 키워드 파티션 Parquet 데이터셋에 새 파일로 추가
+        
+        기존 파일을 읽고 다시 쓰지 않으므로 저장 비용은 새 행 수에만 비례
+        (중복 제거는 로드 시 수행)
+        
+        Args:
+            records: 저장할 레코드 리스트 ("keyword" 열 필요)
+            dataset_path: 데이터셋 디렉토리
+        """
+        if ds is None:
+            raise ImportError("Parquet 저장에는 pyarrow가 필요합니다.")
+        
+        table = pa.Table.from_pandas(pd.DataFrame(records), preserve_index=False)
+        # 파일 이름 앞부분을 저장 시각(ns)으로 두어 경로 순서 = 저장 순서가 되도록 함
+        basename = f"part-{time.time_ns():020d}-{uuid.uuid4().hex[:8]}-{{i}}.parquet"
+        file_options = ds.ParquetFileFormat().make_write_options(
+            compression=PARQUET_COMPRESSION,
+            compression_level=PARQUET_COMPRESSION_LEVEL,
+            use_dictionary=True,
+            write_statistics=True,
+        )
+        ds.write_dataset(
+            table,
+            dataset_path,
+            format="parquet",
+            file_options=file_options,
+            partitioning=self._keyword_partitioning(),
+            existing_data_behavior="overwrite_or_ignore",
+            basename_template=basename,
+            max_rows_per_group=PARQUET_ROW_GROUP_SIZE,
+            min_rows_per_group=0,
+        )
+    
+    @staticmethod
+    def _keyword_partitioning():
+        """
+        키워드 hive 파티션 정의 (쓰기/읽기 공통)
+        
+        스키마를 명시하지 않으면 "2024" 같은 숫자 키워드 디렉토리가 정수로 추론되어
+        문자열 키워드 필터와 비교할 수 없으므로 항상 문자열로 고정
+        
+        Returns:
+            pyarrow 파티셔닝 객체
+        """
+        return ds.partitioning(pa.schema([("keyword", pa.string())]), flavor="hive")
+    
+    def _load_dataset(
+        self,
+        dataset_path: Path,
+        keyword: Optional[str],
+        start_date: Optional[datetime],
+        end_date: Optional[datetime],
+    ) -> pd.DataFrame:
+        """
+        키워드 파티션 Parquet 데이터셋 로드 (키워드 필터는 파티션 단위로 적용)
+        
+        Args:
+            dataset_path: 데이터셋 디렉토리
+            keyword: 키워드 필터
+            start_date: 시작 날짜
+            end_date: 종료 날짜
             
-            # 필터링
+        Returns:
+            중복 제거된 데이터프레임 (같은 타임스탬프/키워드는 나중에 저장한 행 유지)
+        """
+        frames = []
+        
+        # 이전 버전의 단일 Parquet 파일 (예: sentiment.parquet)도 가장 오래된 데이터로 포함
+        legacy_path = dataset_path.with_suffix(".parquet")
+        if legacy_path.is_file():
+            legacy_df = pd.read_parquet(legacy_path)
             if keyword:
-                df = df[df["keyword"] == keyword]
+                legacy_df = legacy_df[legacy_df["keyword"] == keyword]
+            frames.append(legacy_df)
+        
+        if dataset_path.is_dir():
+            if ds is None:
+                raise ImportError("Parquet 로드에는 pyarrow가 필요합니다.")
+            dataset = ds.dataset(dataset_path, format="parquet", partitioning=self._keyword_partitioning())
+            # 파일은 경로(저장 시각) 순으로 읽히므로 keep="last"가 최신 행을 유지
+            table = dataset.to_table(
+                filter=self._dataset_filter(dataset, keyword, start_date, end_date)
+            )
+            frames.append(table.to_pandas())
+        
+        if not frames:
+            return pd.DataFrame()
+        
+        df = pd.concat(frames, ignore_index=True) if len(frames) > 1 else frames[0]
+        df = df.drop_duplicates(subset=DEDUP_COLUMNS, keep="last")
+        
+        # 날짜 필터링
+        if start_date:
+            df = df[pd.to_datetime(df["timestamp"]) >= start_date]
+        
+        if end_date:
+            df = df[pd.to_datetime(df["timestamp"]) <= end_date]
+        
+        return df
+    
+    def _dataset_filter(
+        self,
+        dataset,
+        keyword: Optional[str],
+        start_date: Optional[datetime],
+        end_date: Optional[datetime],
+    ):
+        """
+        데이터셋 스캔 필터 생성 (키워드는 파티션, 날짜는 행 그룹 통계로 건너뛰기)
+        
+        타임스탬프가 ISO 문자열이면 날짜 구분자(" "/"T")나 소수점 자릿수가 섞여 있어도 틀리지 않도록
+        날짜 단위("YYYY-MM-DD") 경계로만 거르고, 정확한 시각 비교는 로드 후 pandas에서 수행
+        
+        Args:
+            dataset: pyarrow 데이터셋
+            keyword: 키워드 필터
+            start_date: 시작 날짜
+            end_date: 종료 날짜
             
+        Returns:
+            pyarrow 필터 식 (조건이 없으면 None)
+        """
+        conditions = []
+        if keyword:
+            conditions.append(ds.field("keyword") == keyword)
+        
+        timestamp_field = dataset.schema.field("timestamp") if "timestamp" in dataset.schema.names else None
+        if timestamp_field is not None and pa.types.is_string(timestamp_field.type):
             if start_date:
-                df = df[pd.to_datetime(df["timestamp"]) >= start_date]
-            
+                conditions.append(ds.field("timestamp") >= start_date.date().isoformat())
             if end_date:
-                df = df[pd.to_datetime(df["timestamp"]) <= end_date]
-            
-            return df
+                next_day = end_date.date() + timedelta(days=1)
+                conditions.append(ds.field("timestamp") < next_day.isoformat())
         
-        except Exception as e:
-            logger.error(f"스파이크 데이터 로드 오류: {e}")
-            return pd.DataFrame()
+        if not conditions:
+            return None
+        
+        expression = conditions[0]
+        for condition in conditions[1:]:
+            expression = expression & condition
+        return expression
 
 
 class S3Storage:
@@ -232,10 +360,20 @@ class S3Storage:
         self.bucket_name = bucket_name
         self.region = region
         self.s3_client = None
+        self.transfer_config = None
         
         # boto3는 선택적 의존성
         try:
             import boto3
+            from boto3.s3.transfer import TransferConfig
+            
+            # 큰 파일은 멀티파트로 나눠 여러 스레드에서 동시에 업로드
+            self.transfer_config = TransferConfig(
+                multipart_threshold=S3_MULTIPART_CHUNKSIZE,
+                multipart_chunksize=S3_MULTIPART_CHUNKSIZE,
+                max_concurrency=S3_MAX_CONCURRENCY,
+                use_threads=True,
+            )
             if aws_access_key_id and aws_secret_access_key:
                 self.s3_client = boto3.client(
                     "s3",
@@ -267,7 +405,9 @@ class S3Storage:
             return
         
         try:
-            self.s3_client.upload_file(local_path, self.bucket_name, s3_key)
+            self.s3_client.upload_file(
+                local_path, self.bucket_name, s3_key, Config=self.transfer_config
+            )
             logger.info(f"파일 업로드 완료: {local_path} -> s3://{self.bucket_name}/{s3_key}")
         
         except Exception as e:
@@ -292,7 +432,10 @@ class S3Storage:
             df.to_parquet(buffer, index=False, engine="pyarrow")
             buffer.seek(0)
             
-            self.s3_client.upload_fileobj(buffer, self.bucket_name, s3_key)
+            # 메모리 버퍼도 같은 전송 설정으로 멀티파트 업로드 (임시 파일에 다시 쓰지 않음)
+            self.s3_client.upload_fileobj(
+                buffer, self.bucket_name, s3_key, Config=self.transfer_config
+            )
             logger.info(f"Parquet 업로드 완료: s3://{self.bucket_name}/{s3_key}")
         
         except Exception as e:
@@ -5,10 +5,54 @@ pytest 설정 파일
 import pytest
 import sys
 from pathlib import Path
+from unittest.mock import patch, MagicMock
 
-# 프로젝트 루트를 경로에 추가
-project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
+import orjson
+
+# 프로젝트 루트를 경로에 추가 (수집 시 한 번만 실행되므로 테스트 파일마다 추가하지 않음)
+project_root = Path(__file__).resolve().parent.parent
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+
+@pytest.fixture(scope="session")
+def sentiment_pipeline_mock():
+    """
+    transformers pipeline 생성 함수 mock (세션 동안 한 번만 패치)
+    
+    지연 import 함수(_get_pipeline)를 패치하므로 테스트 중에는 transformers를 불러오지 않음
+    """
+    patcher = patch("src.nlp.sentiment_analyzer._get_pipeline")
+    mock_get_pipeline = patcher.start()
+    yield mock_get_pipeline.return_value
+    patcher.stop()
+
+
+@pytest.fixture(scope="session")
+def newsapi_ok_response():
+    """
+    NewsAPI 정상 응답 mock (세션 동안 한 번만 생성)
+    
+    본문은 불변 bytes이므로 여러 테스트가 공유해도 안전
+    """
+    response = MagicMock()
+    response.status_code = 200
+    response.headers = {}
+    response.content = orjson.dumps({
+        "status": "ok",
+        "articles": [
+            {
+                "title": "Test News 1",
+                "url": "https://example.com/1",
+                "description": "Test description 1",
+                "publishedAt": "2024-01-15T10:00:00Z",
+                "source": {"name": "Test Source"},
+                "urlToImage": ""
+            }
+        ]
+    })
+    response.raise_for_status = MagicMock()
+    return response
 
 
 @pytest.fixture
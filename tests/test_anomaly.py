@@ -16,7 +16,7 @@ def test_zscore_detection():
     assert sum(anomalies) == 0
     
     # 이상치 포함 데이터
-    values = [1.0, 1.1, 1.0, 10.0, 1.1]  # 10.0이 이상치
+    values = [1.0, 1.1] * 10 + [10.0] + [1.1, 1.0] * 10  # 10.0이 이상치 (표본 5개로는 |z|가 2를 넘을 수 없음)
     anomalies = detector.detect(values, threshold=2.0)
     assert sum(anomalies) > 0
 
@@ -40,3 +40,14 @@ def test_moving_avg_detection():
     assert isinstance(anomalies, list)
     assert len(anomalies) == len(values)
 
+
+
+def test_detect_as_array_and_indices():
+    """NumPy 배열 반환 및 이상치 인덱스 테스트"""
+    detector = AnomalyDetector(method="zscore")
+    
+    values = [1.0, 1.1, 1.0, 10.0, 1.1, 1.0]
+    anomalies = detector.detect(values, threshold=2.0, as_list=False)
+    assert anomalies.dtype == bool
+    assert anomalies.tolist() == detector.detect(values, threshold=2.0)
+    assert detector.get_anomaly_indices(values, threshold=2.0) == [3]
@@ -0,0 +1,115 @@
+"""
+API 응답 캐시 테스트
+"""
+
+from unittest.mock import patch
+
+from app.api.cache import InMemoryCache, _Entry
+
+
+class TestInMemoryCache:
+    """인메모리 캐시 테스트 클래스"""
+    
+    def test_set_and_get(self):
+        """저장 및 조회 테스트"""
+        cache = InMemoryCache(default_ttl=60)
+        cache.set("analyze", {"total_news": 3}, keyword="AI", max_results=10)
+        
+        assert cache.get("analyze", max_results=10, keyword="AI") == {"total_news": 3}
+        assert cache.get("analyze", keyword="AI", max_results=20) is None
+    
+    @patch('app.api.cache.time.monotonic')
+    def test_ttl_expiry(self, mock_monotonic):
+        """TTL 만료 테스트 (monotonic 시계 기준)"""
+        mock_monotonic.return_value = 1000.0
+        cache = InMemoryCache(default_ttl=10)
+        cache.set("latest", [1, 2], hours=1)
+        
+        mock_monotonic.return_value = 1009.0
+        assert cache.get("latest", hours=1) == [1, 2]
+        
+        mock_monotonic.return_value = 1011.0
+        assert cache.get("latest", hours=1) is None
+        assert len(cache.cache) == 0
+    
+    def test_unhashable_kwargs(self):
+        """해시 불가능한 인자 키 생성 테스트"""
+        cache = InMemoryCache()
+        cache.set("batch", "value", keywords=["AI", "반도체"])
+        
+        assert cache.get("batch", keywords=["AI", "반도체"]) == "value"
+        assert cache.get("batch", keywords=["AI"]) is None
+    
+    def test_lru_eviction(self):
+        """최대 크기 초과 시 LRU 제거 테스트"""
+        cache = InMemoryCache(maxsize=2)
+        cache.set("k", 1, id=1)
+        cache.set("k", 2, id=2)
+        
+        # id=1 접근 -> id=2가 가장 오래 사용되지 않은 항목이 됨
+        assert cache.get("k", id=1) == 1
+        cache.set("k", 3, id=3)
+        
+        assert len(cache.cache) == 2
+        assert cache.get("k", id=2) is None
+        assert cache.get("k", id=1) == 1
+        assert cache.get("k", id=3) == 3
+    
+    def test_cleanup_expired(self):
+        """만료 항목 정리 테스트"""
+        cache = InMemoryCache(default_ttl=60)
+        cache.set("k", "expired", id=1)
+        cache.set("k", "alive", id=2)
+        
+        # id=1 항목을 강제로 만료 처리
+        cache.cache[cache._generate_key("k", id=1)] = _Entry("expired", 0.0)
+        cache._expiry_heap.append((0.0, -1, cache._generate_key("k", id=1)))
+        cache._expiry_heap.sort()
+        
+        cache.cleanup_expired()
+        
+        assert cache.get("k", id=1) is None
+        assert cache.get("k", id=2) == "alive"
+    
+    @patch('app.api.cache.time.monotonic')
+    def test_same_expiry_mixed_keys(self, mock_monotonic):
+        """만료 시각이 같아도 타입이 섞인 키끼리 비교하지 않는지 테스트"""
+        mock_monotonic.return_value = 1000.0
+        cache = InMemoryCache(default_ttl=10)
+        
+        cache.set("a", 1, x=None)
+        cache.set("a", 2, x="s")
+        cache.set("a", 3, x=[1, 2])  # 해시 불가능한 인자는 정수 키로 대체
+        
+        mock_monotonic.return_value = 2000.0
+        cache.cleanup_expired()
+        
+        assert len(cache.cache) == 0
+    
+    def test_delete_and_clear(self):
+        """삭제 및 전체 삭제 테스트"""
+        cache = InMemoryCache()
+        cache.set("k", 1, id=1)
+        cache.set("k", 2, id=2)
+        
+        cache.delete("k", id=1)
+        assert cache.get("k", id=1) is None
+        
+        cache.clear()
+        assert len(cache.cache) == 0
+    
+    @patch('app.api.cache.time.monotonic')
+    def test_amortized_eviction_on_set(self, mock_monotonic):
+        """set() 호출 중 만료 항목이 자동으로 정리되는지 테스트"""
+        mock_monotonic.return_value = 1000.0
+        cache = InMemoryCache(default_ttl=10)
+        for i in range(100):
+            cache.set("old", i, id=i)
+        
+        # 기존 항목이 모두 만료된 뒤 새 항목 저장
+        mock_monotonic.return_value = 2000.0
+        for i in range(100):
+            cache.set("new", i, id=i)
+        
+        assert len(cache.cache) == 100
+        assert all(key[0] == "new" for key in cache.cache)
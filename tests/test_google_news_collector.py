@@ -2,17 +2,24 @@
 Google News 수집기 테스트
 """
 
-import pytest
+import asyncio
+import httpx
+from datetime import datetime
+from requests.exceptions import Timeout
 from unittest.mock import patch, MagicMock
-import sys
-from pathlib import Path
-
-project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
 
 from src.data.google_news_collector import GoogleNewsCollector
 
 
+class FrozenDatetime(datetime):
+    """현재 시각을 2024-01-15 00:00:00으로 고정한 datetime (fromisoformat 등 나머지는 그대로)"""
+    
+    @classmethod
+    def now(cls, tz=None):
+        """고정된 현재 시각 반환"""
+        return cls(2024, 1, 15, tzinfo=tz)
+
+
 class TestGoogleNewsCollector:
     """Google News 수집기 테스트 클래스"""
     
@@ -27,57 +34,43 @@ class TestGoogleNewsCollector:
         collector = GoogleNewsCollector()
         assert collector.api_key is None
     
-    @patch('src.data.google_news_collector.requests.get')
-    def test_collect_success(self, mock_get):
+    def test_collect_success(self, newsapi_ok_response):
         """수집 성공 테스트"""
-        # Mock API 응답 설정
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "status": "ok",
-            "articles": [
-                {
-                    "title": "Test News 1",
-                    "url": "https://example.com/1",
-                    "description": "Test description 1",
-                    "publishedAt": "2024-01-15T10:00:00Z",
-                    "source": {"name": "Test Source"},
-                    "urlToImage": ""
-                }
-            ]
-        }
-        mock_response.raise_for_status = MagicMock()
-        mock_get.return_value = mock_response
-        
         collector = GoogleNewsCollector(api_key="test_key")
+        collector._session = MagicMock()
+        collector._session.get.return_value = newsapi_ok_response
+        
         results = collector.collect(keyword="Test", max_results=10)
         
         assert len(results) > 0
-        assert all("title" in item for item in results)
-        assert all("link" in item for item in results)
+        # 모든 아이템의 필수 키를 한 번의 순회에서 집합 포함 관계로 확인
+        assert all(item.keys() >= {"title", "link"} for item in results)
     
-    @patch('src.data.google_news_collector.requests.get')
-    def test_collect_api_error(self, mock_get):
-        """API 오류 테스트"""
+    @patch('src.data.google_news_collector.time.sleep')
+    def test_collect_api_error(self, mock_sleep):
+        """API 오류 테스트 (429는 Retry-After만큼 기다린 뒤 한 번만 재시도하고 빈 리스트 반환)"""
         mock_response = MagicMock()
         mock_response.status_code = 429
-        mock_get.return_value = mock_response
+        mock_response.headers = {"Retry-After": "1"}
         
         collector = GoogleNewsCollector(api_key="test_key")
+        collector._session = MagicMock()
+        collector._session.get.return_value = mock_response
         
-        with pytest.raises(Exception):
-            collector.collect(keyword="Test", max_results=10)
+        assert collector.collect(keyword="Test", max_results=10) == []
+        assert collector._session.get.call_count == 2
+        mock_sleep.assert_called_once_with(1.0)
     
-    @patch('src.data.google_news_collector.requests.get')
-    def test_collect_timeout(self, mock_get):
-        """타임아웃 테스트"""
-        import requests
-        mock_get.side_effect = requests.exceptions.Timeout()
-        
+    @patch('src.data.google_news_collector.time.sleep')
+    def test_collect_timeout(self, mock_sleep):
+        """타임아웃 테스트 (오류는 로그만 남기고 빈 리스트 반환)"""
         collector = GoogleNewsCollector(api_key="test_key")
+        collector._session = MagicMock()
+        collector._session.get.side_effect = Timeout()
         
-        with pytest.raises(requests.exceptions.Timeout):
-            collector.collect(keyword="Test", max_results=10)
+        assert collector.collect(keyword="Test", max_results=10) == []
+        collector._session.get.assert_called_once()
+        mock_sleep.assert_not_called()
     
     def test_collect_without_api_key(self):
         """API 키 없이 수집 테스트"""
@@ -86,15 +79,130 @@ class TestGoogleNewsCollector:
         
         assert len(results) == 0
     
+    @patch('src.data.google_news_collector.requests_cache')
+    def test_response_cache_session(self, mock_requests_cache, tmp_path):
+        """응답 캐시 세션 생성 테스트 (API 키는 캐시 키에서 제외, 만료 0이면 캐시 미사용)"""
+        config = {"collector": {"google_news": {"cache_path": str(tmp_path / "cache" / "google_news")}}}
+        collector = GoogleNewsCollector(api_key="test_key", config=config)
+        
+        assert collector._session is mock_requests_cache.CachedSession.return_value
+        _, kwargs = mock_requests_cache.CachedSession.call_args
+        assert kwargs["backend"] == "sqlite"
+        assert kwargs["expire_after"] == 60
+        assert "apiKey" in kwargs["ignored_parameters"]
+        assert (tmp_path / "cache").is_dir()
+        
+        config["collector"]["google_news"]["cache_expire_seconds"] = 0
+        collector = GoogleNewsCollector(api_key="test_key", config=config)
+        assert collector._session is not mock_requests_cache.CachedSession.return_value
+    
+    @patch('src.data.google_news_collector.requests_cache')
+    def test_response_cache_opt_in(self, mock_requests_cache):
+        """cache_path를 지정하지 않으면 requests-cache가 있어도 캐시 세션을 만들지 않는지 테스트"""
+        collector = GoogleNewsCollector(api_key="test_key", config={"collector": {"google_news": {}}})
+        
+        assert collector.cache_path is None
+        mock_requests_cache.CachedSession.assert_not_called()
+    
+    @patch('src.data.google_news_collector.requests_cache')
+    def test_collect_uses_response_cache(self, mock_requests_cache, tmp_path, newsapi_ok_response):
+        """캐시가 켜져 있으면 수집 요청이 캐시 세션을 거치는지 테스트"""
+        cached_session = mock_requests_cache.CachedSession.return_value
+        cached_session.get.return_value = newsapi_ok_response
+        config = {"collector": {"google_news": {"cache_path": str(tmp_path / "google_news")}}}
+        
+        collector = GoogleNewsCollector(api_key="test_key", config=config)
+        results = collector.collect(keyword="Test", max_results=10)
+        
+        assert len(results) > 0
+        mock_requests_cache.CachedSession.assert_called_once()
+        assert mock_requests_cache.CachedSession.call_args.args[0] == str(tmp_path / "google_news")
+        cached_session.get.assert_called_once()
+    
+    @patch('src.data.google_news_collector.datetime', FrozenDatetime)
     def test_normalize_pubdate(self):
-        """날짜 정규화 테스트"""
+        """날짜 정규화 테스트 (현재 시각 고정)"""
         collector = GoogleNewsCollector()
         
         # ISO 8601 형식
         normalized = collector._normalize_pubdate("2024-01-15T10:00:00Z")
         assert normalized == "2024-01-15 10:00:00"
         
-        # 빈 문자열
-        normalized = collector._normalize_pubdate("")
-        assert "2024" in normalized  # 현재 날짜 포함
-
+        # 소수 초/시간대 오프셋 포함 (표기된 시각 그대로 유지)
+        assert collector._normalize_pubdate("2024-01-15T10:00:00.123+09:00") == "2024-01-15 10:00:00"
+        
+        # 정규식에 맞지 않는 ISO 변형은 fromisoformat으로 처리
+        assert collector._normalize_pubdate("2024-01-15") == "2024-01-15 00:00:00"
+        
+        # 빈 문자열 / 파싱 실패는 현재 시각
+        assert collector._normalize_pubdate("") == "2024-01-15 00:00:00"
+        assert collector._normalize_pubdate("not a date") == "2024-01-15 00:00:00"
+    
+    def test_collect_async(self):
+        """비동기 수집 테스트"""
+        def handler(request):
+            assert request.url.params["q"] == "Test"
+            return httpx.Response(200, json={
+                "status": "ok",
+                "articles": [
+                    {
+                        "title": "Test News 1",
+                        "url": "https://example.com/1",
+                        "description": "Test description 1",
+                        "publishedAt": "2024-01-15T10:00:00Z",
+                        "source": {"name": "Test Source"},
+                        "urlToImage": ""
+                    }
+                ]
+            })
+        
+        collector = GoogleNewsCollector(api_key="test_key")
+        
+        async def run():
+            async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+                return await collector.collect_async(client, keyword="Test", max_results=10)
+        
+        results = asyncio.run(run())
+        
+        assert len(results) == 1
+        assert results[0]["link"] == "https://example.com/1"
+        assert results[0]["source"] == "Test Source"
+    
+    def test_collect_async_paginates_and_retries(self):
+        """비동기 다중 페이지 수집 및 429 Retry-After 재시도 테스트"""
+        throttled = []
+        
+        def handler(request):
+            page = int(request.url.params["page"])
+            page_size = int(request.url.params["pageSize"])
+            if page == 2 and not throttled:
+                throttled.append(page)
+                return httpx.Response(429, headers={"Retry-After": "0"})
+            return httpx.Response(200, json={
+                "status": "ok",
+                "totalResults": 150,
+                "articles": [
+                    {
+                        "title": f"News {page}-{i}",
+                        "url": f"https://example.com/{page}/{i}",
+                        "description": "",
+                        "publishedAt": "2024-01-15T10:00:00Z",
+                        "source": {"name": "Test Source"},
+                        "urlToImage": ""
+                    }
+                    for i in range(page_size)
+                ]
+            })
+        
+        collector = GoogleNewsCollector(api_key="test_key")
+        
+        async def run():
+            async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+                return await collector.collect_async(client, keyword="Test", max_results=150)
+        
+        results = asyncio.run(run())
+        
+        assert throttled == [2]
+        assert len(results) == 150
+        assert results[0]["link"] == "https://example.com/1/0"
+        assert results[100]["link"] == "https://example.com/2/0"
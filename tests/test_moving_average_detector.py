@@ -0,0 +1,77 @@
+"""
+Moving Average 이상치 감지기 테스트
+"""
+
+import pytest
+import pandas as pd
+import numpy as np
+
+from src.anomaly.moving_average_detector import MovingAverageDetector
+
+# 윈도우 표준편차가 0이 되지 않도록 두 값을 번갈아 둔 기준 시계열
+BASELINE = [1.0, 1.2] * 10
+
+
+@pytest.fixture(scope="module")
+def detector():
+    """모듈 전체에서 공유하는 감지기 (detect는 누적 상태를 쓰지 않음)"""
+    return MovingAverageDetector(window_size=5, threshold=2.0)
+
+
+class TestMovingAverageDetector:
+    """Moving Average 감지기 테스트 클래스"""
+    
+    def test_init(self):
+        """초기화 테스트"""
+        detector = MovingAverageDetector(window_size=3, threshold=1.5)
+        assert detector.window_size == 3
+        assert detector.threshold == 1.5
+    
+    def test_known_spike_index(self, detector):
+        """기준 시계열 중간의 스파이크 위치 감지 테스트"""
+        values = BASELINE[:12] + [10.0] + BASELINE[12:]
+        
+        results = detector.detect(np.array(values))
+        assert [r["start"] for r in results] == [12]
+        assert results[0]["value"] == 10.0
+        assert detector.detect_anomalies(values) == [12]
+    
+    @pytest.mark.parametrize("spike_index, expected", [
+        (4, []),  # 직전 윈도우가 아직 채워지지 않은 위치는 판정하지 않음
+        (5, [5]),  # 직전 window_size개가 채워진 첫 위치부터 판정
+    ])
+    def test_first_window_boundary(self, detector, spike_index, expected):
+        """첫 윈도우 경계 테스트"""
+        values = BASELINE[:spike_index] + [10.0] + BASELINE[spike_index:]
+        
+        assert detector.detect_anomalies(values) == expected
+    
+    def test_spike_after_flat_series(self, detector):
+        """직전 윈도우 표준편차가 0이면 스파이크도 판정하지 않는지 테스트"""
+        values = [1.0] * 10 + [10.0] + [1.0] * 5
+        
+        assert detector.detect(np.array(values)) == []
+        assert detector.detect_anomalies(values) == []
+    
+    def test_detect_dataframe_details(self, detector):
+        """데이터프레임 입력과 상세 정보 테스트 (직전 윈도우 통계 기준)"""
+        values = BASELINE[:12] + [10.0] + BASELINE[12:]
+        df = pd.DataFrame({"value": values})
+        
+        results = detector.detect(df, column="value", return_details=True)
+        
+        assert len(results) == 1
+        assert results[0]["moving_avg"] == pytest.approx(np.mean(BASELINE[7:12]))
+        assert results[0]["moving_std"] == pytest.approx(np.std(BASELINE[7:12]))
+        assert results[0]["window_size"] == 5
+    
+    def test_detect_missing_column(self, detector):
+        """존재하지 않는 컬럼 테스트"""
+        df = pd.DataFrame({"value": BASELINE})
+        
+        assert detector.detect(df, column="nonexistent") == []
+    
+    def test_detect_too_short(self, detector):
+        """윈도우보다 짧은 데이터 테스트"""
+        assert detector.detect(np.array([1.0, 10.0, 1.0])) == []
+        assert detector.detect_anomalies([1.0, 10.0, 1.0]) == []
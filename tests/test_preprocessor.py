@@ -0,0 +1,57 @@
+"""
+텍스트 전처리기 테스트
+"""
+
+import pandas as pd
+import pytest
+
+from src.data.preprocessor import TextPreprocessor
+
+
+class TestTextPreprocessor:
+    """텍스트 전처리기 테스트 클래스"""
+    
+    TEXTS = [
+        "<p>삼성전자 주가 급등! https://news.example.com/a?b=1</p>",
+        "Café naïve 東京 (AI)   end  ",
+        "a_b\tc　d e",
+        "!!!",
+        "",
+    ]
+    
+    def test_clean_text(self):
+        """텍스트 정제 테스트"""
+        preprocessor = TextPreprocessor()
+        assert preprocessor.clean_text("<b>AI</b> 뉴스!  https://example.com/1 ") == "AI 뉴스"
+        assert preprocessor.clean_text("") == ""
+    
+    @pytest.mark.parametrize("dtype", ["str", object])
+    def test_preprocess_batch_matches_clean_text(self, dtype):
+        """배치 전처리 결과가 행별 clean_text와 동일한지 테스트 (pyarrow/object dtype 공통)"""
+        preprocessor = TextPreprocessor()
+        df = pd.DataFrame({
+            "title": pd.Series(self.TEXTS, dtype=dtype),
+            "summary": pd.Series(["요약"] * 3 + ["", None], dtype=dtype),
+            "link": [f"https://example.com/{i}" for i in range(len(self.TEXTS))],
+        })
+        
+        result = preprocessor.preprocess_batch(df)
+        
+        # 제목과 요약이 모두 빈 마지막 두 행은 제거
+        assert result.index.tolist() == [0, 1, 2]
+        assert result["title"].tolist() == [preprocessor.clean_text(text) for text in self.TEXTS[:3]]
+        assert result["link"].tolist() == df["link"].tolist()[:3]
+        # 원본 데이터프레임은 변경하지 않음
+        assert df["title"].tolist()[0] == self.TEXTS[0]
+    
+    def test_preprocess_news(self):
+        """뉴스 아이템 리스트 전처리 테스트"""
+        preprocessor = TextPreprocessor()
+        items = [
+            {"title": "<b>AI</b> 뉴스", "link": "https://example.com/1"},
+            {"title": "!!!", "summary": "", "link": "https://example.com/2"},
+        ]
+        
+        result = preprocessor.preprocess_news(items)
+        
+        assert result == [{"title": "AI 뉴스", "link": "https://example.com/1"}]
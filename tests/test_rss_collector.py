@@ -2,15 +2,11 @@
 RSS 수집기 테스트
 """
 
+import asyncio
+import httpx
 import pytest
 from unittest.mock import patch, MagicMock
 from datetime import datetime
-import sys
-from pathlib import Path
-
-# 프로젝트 루트를 경로에 추가
-project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
 
 from src.data.rss_collector import RSSCollector
 
@@ -24,31 +20,39 @@ class TestRSSCollector:
         assert len(collector.rss_urls) == 1
         assert collector.retry_count == 3
     
+    @patch('src.data.rss_collector.load_config')
+    def test_init_with_loaded_config(self, mock_load_config):
+        """이미 로드한 설정 딕셔너리로 초기화 테스트 (설정 파일을 다시 읽지 않음)"""
+        config = {"collector": {"rss_urls": ["https://example.com/rss"], "retry_count": 5, "max_workers": 4}}
+        collector = RSSCollector(config_path="configs/config_api.yaml", config=config)
+        
+        mock_load_config.assert_not_called()
+        assert collector.rss_urls == ["https://example.com/rss"]
+        assert collector.retry_count == 5
+        assert collector.max_workers == 4
+    
+    @patch('src.data.rss_collector.httpx.Client.get')
     @patch('src.data.rss_collector.feedparser')
-    def test_collect_success(self, mock_feedparser):
+    def test_collect_success(self, mock_feedparser, mock_get):
         """수집 성공 테스트"""
         # Mock feedparser 반환값 설정
         mock_feed = MagicMock()
         mock_feed.bozo = False
-        mock_entry1 = MagicMock()
-        mock_entry1.get.side_effect = lambda key, default="": {
-            "title": "Test News 1",
-            "link": "https://example.com/1",
-            "summary": "Test summary 1",
-            "published": "2024-01-15 10:00:00"
-        }.get(key, default)
-        mock_entry1.tags = []
-        
-        mock_entry2 = MagicMock()
-        mock_entry2.get.side_effect = lambda key, default="": {
-            "title": "Test News 2",
-            "link": "https://example.com/2",
-            "summary": "Test summary 2",
-            "published": "2024-01-15 11:00:00"
-        }.get(key, default)
-        mock_entry2.tags = []
-        
-        mock_feed.entries = [mock_entry1, mock_entry2]
+        # feedparser 항목은 dict 하위 클래스이므로 일반 dict로 대체
+        mock_feed.entries = [
+            {
+                "title": "Test News 1",
+                "link": "https://example.com/1",
+                "summary": "Test summary 1",
+                "published": "2024-01-15 10:00:00"
+            },
+            {
+                "title": "Test News 2",
+                "link": "https://example.com/2",
+                "summary": "Test summary 2",
+                "published": "2024-01-15 11:00:00"
+            },
+        ]
         mock_feed.feed.get.return_value = "Test Feed"
         mock_feedparser.parse.return_value = mock_feed
         
@@ -56,23 +60,21 @@ class TestRSSCollector:
         results = collector.collect(keyword="Test", max_results=10)
         
         assert len(results) > 0
-        assert all("title" in item for item in results)
-        assert all("link" in item for item in results)
+        # 모든 아이템의 필수 키를 한 번의 순회에서 집합 포함 관계로 확인
+        assert all(item.keys() >= {"title", "link"} for item in results)
     
+    @patch('src.data.rss_collector.httpx.Client.get')
     @patch('src.data.rss_collector.feedparser')
-    def test_collect_with_keyword_filter(self, mock_feedparser):
+    def test_collect_with_keyword_filter(self, mock_feedparser, mock_get):
         """키워드 필터링 테스트"""
         mock_feed = MagicMock()
         mock_feed.bozo = False
-        mock_entry = MagicMock()
-        mock_entry.get.side_effect = lambda key, default="": {
+        mock_feed.entries = [{
             "title": "AI Technology News",
             "link": "https://example.com/1",
             "summary": "AI related content",
             "published": "2024-01-15 10:00:00"
-        }.get(key, default)
-        mock_entry.tags = []
-        mock_feed.entries = [mock_entry]
+        }]
         mock_feed.feed.get.return_value = "Test Feed"
         mock_feedparser.parse.return_value = mock_feed
         
@@ -81,8 +83,9 @@ class TestRSSCollector:
         
         assert len(results) > 0
     
+    @patch('src.data.rss_collector.httpx.Client.get')
     @patch('src.data.rss_collector.feedparser')
-    def test_collect_empty_feed(self, mock_feedparser):
+    def test_collect_empty_feed(self, mock_feedparser, mock_get):
         """빈 피드 테스트"""
         mock_feed = MagicMock()
         mock_feed.bozo = False
@@ -95,6 +98,94 @@ class TestRSSCollector:
         
         assert len(results) == 0
     
+    @patch('src.data.rss_collector.httpx.Client.get')
+    @patch('src.data.rss_collector.feedparser')
+    def test_collect_multiple_feeds_concurrently(self, mock_feedparser, mock_get):
+        """여러 피드 동시 수집 테스트 (피드 순서 유지, 실패한 피드는 건너뜀)"""
+        def fetch(url, **kwargs):
+            if "broken" in url:
+                raise httpx.ConnectError("feed down")
+            # 응답 본문 대신 URL을 넘겨 어떤 피드인지 구분
+            return MagicMock(content=url, status_code=200, headers={})
+        
+        def make_feed(url):
+            mock_feed = MagicMock()
+            mock_feed.bozo = False
+            mock_feed.entries = [{
+                "title": f"News from {url}",
+                "link": f"{url}/1",
+                "summary": "",
+            }]
+            mock_feed.feed.get.return_value = url
+            return mock_feed
+        
+        mock_get.side_effect = fetch
+        mock_feedparser.parse.side_effect = make_feed
+        
+        urls = ["https://a.example.com/rss", "https://broken.example.com/rss", "https://b.example.com/rss"]
+        collector = RSSCollector(rss_urls=urls)
+        collector.retry_delay = 0
+        results = collector.collect(max_results=10)
+        
+        assert [item["link"] for item in results] == ["https://a.example.com/rss/1", "https://b.example.com/rss/1"]
+    
+    @patch('src.data.rss_collector.httpx.Client.get')
+    @patch('src.data.rss_collector.feedparser')
+    def test_collect_multi(self, mock_feedparser, mock_get):
+        """여러 키워드를 피드당 한 번의 요청으로 수집하는 테스트 (키워드별 collect와 같은 결과)"""
+        mock_feed = MagicMock()
+        mock_feed.bozo = False
+        mock_feed.entries = [
+            {"title": title, "summary": summary, "link": f"https://example.com/{i}"}
+            for i, (title, summary) in enumerate([
+                ("OpenAI releases model", "AI news"),
+                ("삼성전자 반도체 투자", ""),
+                ("Weather", "sunny"),
+            ])
+        ]
+        mock_feed.feed.get.return_value = "Test Feed"
+        mock_feedparser.parse.return_value = mock_feed
+        
+        collector = RSSCollector(rss_urls=["https://example.com/rss"])
+        keywords = ["AI", "openai", "반도체", "없는키워드"]
+        results = collector.collect_multi(keywords, max_results=10)
+        
+        # 피드는 키워드 수와 관계없이 한 번만 요청
+        assert mock_feedparser.parse.call_count == 1
+        assert [item["link"] for item in results["AI"]] == ["https://example.com/0"]
+        assert [item["link"] for item in results["openai"]] == ["https://example.com/0"]
+        assert results["openai"][0]["keyword"] == "openai"
+        assert [item["link"] for item in results["반도체"]] == ["https://example.com/1"]
+        assert results["없는키워드"] == []
+        
+        for keyword in keywords:
+            single = collector.collect(keyword=keyword, max_results=10)
+            assert [item["link"] for item in single] == [item["link"] for item in results[keyword]]
+    
+    def test_fetch_feed_not_modified(self):
+        """조건부 요청 테스트 (ETag를 다시 보내고 304 응답이면 이전 파싱 결과 재사용)"""
+        rss_body = b"""<?xml version="1.0"?>
+<rss version="2.0"><channel><title>Test Feed</title>
+<item><title>AI News</title><link>https://example.com/1</link></item>
+</channel></rss>"""
+        requests_seen = []
+        
+        def handler(request):
+            requests_seen.append(request)
+            if request.headers.get("If-None-Match") == '"v1"':
+                return httpx.Response(304)
+            return httpx.Response(200, content=rss_body, headers={"ETag": '"v1"'})
+        
+        collector = RSSCollector(rss_urls=["https://example.com/rss"])
+        collector._client = httpx.Client(transport=httpx.MockTransport(handler))
+        
+        first = collector.collect(keyword="AI", max_results=10)
+        second = collector.collect(keyword="AI", max_results=10)
+        
+        assert "If-None-Match" not in requests_seen[0].headers
+        assert requests_seen[1].headers["If-None-Match"] == '"v1"'
+        assert [item["link"] for item in second] == [item["link"] for item in first] == ["https://example.com/1"]
+    
     def test_deduplicate_by_link(self):
         """중복 제거 테스트"""
         collector = RSSCollector()
@@ -108,4 +199,42 @@ class TestRSSCollector:
         assert len(unique) == 2
         assert unique[0]["link"] == "https://example.com/1"
         assert unique[1]["link"] == "https://example.com/2"
+    
+    def test_normalize_pubdate(self):
+        """pubDate 정규화 테스트 (RFC 822 / ISO 8601 형식, 파싱 실패 시 현재 시간)"""
+        collector = RSSCollector()
+        
+        assert collector._normalize_pubdate("Mon, 15 Jan 2024 10:00:00 GMT") == "2024-01-15 10:00:00"
+        assert collector._normalize_pubdate("2024-01-15T10:00:00Z") == "2024-01-15 10:00:00"
+        # 같은 문자열은 캐시된 결과 재사용
+        assert collector._normalize_pubdate("Mon, 15 Jan 2024 10:00:00 GMT") == "2024-01-15 10:00:00"
+        
+        fallback = collector._normalize_pubdate("not a date")
+        assert datetime.strptime(fallback, "%Y-%m-%d %H:%M:%S")
+        assert collector._normalize_pubdate("")
+    
+    def test_collect_async(self):
+        """비동기 수집 테스트 (실패한 피드는 건너뜀)"""
+        rss_body = b"""<?xml version="1.0"?>
+<rss version="2.0"><channel><title>Test Feed</title>
+<item><title>AI News</title><link>https://example.com/1</link><description>AI summary</description></item>
+<item><title>Other News</title><link>https://example.com/2</link><description>Other summary</description></item>
+</channel></rss>"""
 
+        def handler(request):
+            if request.url.host == "broken.example.com":
+                return httpx.Response(500)
+            return httpx.Response(200, content=rss_body)
+        
+        collector = RSSCollector(rss_urls=["https://example.com/rss", "https://broken.example.com/rss"])
+        collector.retry_delay = 0
+        
+        async def run():
+            async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+                return await collector.collect_async(client, keyword="AI", max_results=10)
+        
+        results = asyncio.run(run())
+        
+        assert len(results) == 1
+        assert results[0]["link"] == "https://example.com/1"
+        assert results[0]["source"] == "Test Feed"
@@ -0,0 +1,38 @@
+"""
+뉴스 수집 스케줄러 테스트
+"""
+
+import pytest
+
+from scripts.scheduler import NewsScheduler
+
+
+@pytest.fixture
+def scheduler(tmp_path):
+    """임시 디렉토리에 저장하는 JSONL 스케줄러"""
+    return NewsScheduler(
+        keywords=["A", "B"],
+        output_file=str(tmp_path / "news.jsonl"),
+        output_format="jsonl",
+    )
+
+
+class TestNewsScheduler:
+    """스케줄러 후처리 테스트 클래스"""
+    
+    def test_same_link_saved_per_keyword(self, scheduler):
+        """여러 키워드에 걸린 같은 기사는 키워드마다 한 번씩 저장되는지 테스트"""
+        link = "https://example.com/1"
+        
+        first = scheduler._merge_results("A", [{"title": "T", "link": link, "keyword": "A"}], [])
+        second = scheduler._merge_results("B", [{"title": "T", "link": link, "keyword": "B"}], [])
+        
+        assert [item["keyword"] for item in first] == ["A"]
+        assert [item["keyword"] for item in second] == ["B"]
+    
+    def test_same_link_dropped_for_same_keyword(self, scheduler):
+        """같은 키워드의 같은 링크는 다음 수집 주기에서 제외되는지 테스트"""
+        item = {"title": "T", "link": "https://example.com/1", "keyword": "A"}
+        
+        assert len(scheduler._merge_results("A", [dict(item)], [])) == 1
+        assert scheduler._merge_results("A", [dict(item)], [dict(item)]) == []
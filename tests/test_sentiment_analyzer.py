@@ -3,40 +3,40 @@
 """
 
 import pytest
-from unittest.mock import patch, MagicMock
-import sys
-from pathlib import Path
-
-project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
 
 from src.nlp.sentiment_analyzer import SentimentAnalyzer
 
 
+@pytest.fixture(scope="module")
+def analyzer(sentiment_pipeline_mock):
+    """모듈 전체에서 공유하는 감정 분석기 (패치된 파이프라인으로 한 번만 생성)"""
+    return SentimentAnalyzer()
+
+
+@pytest.fixture
+def mock_model(analyzer):
+    """테스트마다 호출 기록과 반환값을 초기화한 파이프라인 인스턴스 mock"""
+    analyzer.analyzer.reset_mock(return_value=True, side_effect=True)
+    return analyzer.analyzer
+
+
 class TestSentimentAnalyzer:
     """감정 분석기 테스트 클래스"""
     
-    @patch('src.nlp.sentiment_analyzer.pipeline')
-    def test_init(self, mock_pipeline):
+    def test_init(self, analyzer, sentiment_pipeline_mock):
         """초기화 테스트"""
-        mock_pipeline.return_value = MagicMock()
-        analyzer = SentimentAnalyzer()
         assert analyzer is not None
+        assert analyzer.analyzer is sentiment_pipeline_mock.return_value
     
-    @patch('src.nlp.sentiment_analyzer.pipeline')
-    def test_analyze_single_text(self, mock_pipeline):
+    def test_analyze_single_text(self, analyzer, mock_model):
         """단일 텍스트 분석 테스트"""
-        # Mock pipeline 설정
-        mock_analyzer = MagicMock()
-        mock_analyzer.return_value = [
+        mock_model.return_value = [
             [
                 {"label": "POSITIVE", "score": 0.9},
                 {"label": "NEGATIVE", "score": 0.1}
             ]
         ]
-        mock_pipeline.return_value = mock_analyzer
         
-        analyzer = SentimentAnalyzer()
         result = analyzer.analyze("This is a positive text")
         
         assert "positive" in result
@@ -44,58 +44,59 @@ class TestSentimentAnalyzer:
         assert "confidence" in result
         assert 0.0 <= result["positive"] <= 1.0
     
-    @patch('src.nlp.sentiment_analyzer.pipeline')
-    def test_analyze_empty_text(self, mock_pipeline):
+    def test_analyze_empty_text(self, analyzer, mock_model):
         """빈 텍스트 분석 테스트"""
-        mock_pipeline.return_value = MagicMock()
-        analyzer = SentimentAnalyzer()
         result = analyzer.analyze("")
         
         assert result["positive"] == 0.5
         assert result["negative"] == 0.5
         assert result["confidence"] == 0.0
+        mock_model.assert_not_called()
     
-    @patch('src.nlp.sentiment_analyzer.pipeline')
-    def test_analyze_batch(self, mock_pipeline):
+    def test_analyze_batch(self, analyzer, mock_model):
         """배치 분석 테스트"""
-        mock_analyzer = MagicMock()
-        mock_analyzer.return_value = [
+        mock_model.return_value = [
             [{"label": "POSITIVE", "score": 0.8}],
             [{"label": "NEGATIVE", "score": 0.7}]
         ]
-        mock_pipeline.return_value = mock_analyzer
         
-        analyzer = SentimentAnalyzer()
         results = analyzer.analyze(["Text 1", "Text 2"])
         
         assert len(results) == 2
         assert all("positive" in r for r in results)
     
-    @patch('src.nlp.sentiment_analyzer.pipeline')
-    def test_get_sentiment_score(self, mock_pipeline):
+    def test_analyze_batch_single_call(self, analyzer, mock_model):
+        """배치 분석이 빈 텍스트를 제외하고 파이프라인을 한 번만 호출하는지 테스트 (입력 순서 유지)"""
+        mock_model.return_value = [
+            [{"label": "POSITIVE", "score": 0.8}, {"label": "NEGATIVE", "score": 0.2}],
+            [{"label": "POSITIVE", "score": 0.1}, {"label": "NEGATIVE", "score": 0.9}],
+        ]
+        
+        results = analyzer.analyze_batch(["Good news", "", "Bad news"], batch_size=32)
+        
+        assert mock_model.call_count == 1
+        assert mock_model.call_args[0][0] == ["Good news", "Bad news"]
+        assert len(results) == 3
+        assert results[0]["positive"] > 0.5
+        assert results[1]["confidence"] == 0.0
+        assert results[2]["negative"] > 0.5
+    
+    def test_get_sentiment_score(self, analyzer, mock_model):
         """감정 점수 반환 테스트"""
-        mock_analyzer = MagicMock()
-        mock_analyzer.return_value = [
+        mock_model.return_value = [
             [{"label": "POSITIVE", "score": 0.8}]
         ]
-        mock_pipeline.return_value = mock_analyzer
         
-        analyzer = SentimentAnalyzer()
         score = analyzer.get_sentiment_score("Positive text")
         
         assert 0.0 <= score <= 1.0
     
-    @patch('src.nlp.sentiment_analyzer.pipeline')
-    def test_get_confidence(self, mock_pipeline):
+    def test_get_confidence(self, analyzer, mock_model):
         """신뢰도 반환 테스트"""
-        mock_analyzer = MagicMock()
-        mock_analyzer.return_value = [
+        mock_model.return_value = [
             [{"label": "POSITIVE", "score": 0.9}]
         ]
-        mock_pipeline.return_value = mock_analyzer
         
-        analyzer = SentimentAnalyzer()
         confidence = analyzer.get_confidence("Text")
         
         assert 0.0 <= confidence <= 1.0
-
@@ -5,15 +5,16 @@
 import pytest
 import pandas as pd
 import numpy as np
-import sys
-from pathlib import Path
-
-project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
 
 from src.anomaly.spike_detector import SpikeDetector
 
 
+@pytest.fixture(scope="module")
+def detector():
+    """모듈 전체에서 공유하는 감지기 (detect는 상태를 바꾸지 않음)"""
+    return SpikeDetector(threshold=2.0)
+
+
 class TestSpikeDetector:
     """스파이크 감지기 테스트 클래스"""
     
@@ -23,44 +24,45 @@ class TestSpikeDetector:
         assert detector.threshold == 2.0
         assert detector.max_anomalies == 10
     
-    def test_detect_normal_data(self):
-        """정상 데이터 테스트"""
-        detector = SpikeDetector(threshold=2.0)
-        df = pd.DataFrame({
-            "value": [1.0, 1.1, 1.0, 1.2, 1.1]
-        })
-        
-        results = detector.detect(df, column="value")
-        assert isinstance(results, list)
-    
-    def test_detect_with_spike(self):
-        """스파이크 포함 데이터 테스트"""
-        detector = SpikeDetector(threshold=2.0)
-        df = pd.DataFrame({
-            "value": [1.0, 1.1, 1.0, 5.0, 1.1]  # 5.0이 스파이크
-        })
+    @pytest.mark.parametrize("values, expected_values", [
+        ([1.0, 1.1, 1.0, 1.2, 1.1], []),  # 정상 데이터
+        ([1.0, 1.1, 1.0, 5.0, 1.1], [5.0]),  # 5.0이 스파이크
+        ([1.0, 1.1], []),  # 데이터 부족 (최소 3개 필요)
+    ])
+    def test_detect(self, detector, values, expected_values):
+        """배열 입력 스파이크 감지 테스트 (정상/스파이크/데이터 부족)"""
+        results = detector.detect(np.array(values))
         
-        results = detector.detect(df, column="value")
         assert isinstance(results, list)
+        assert [r["value"] for r in results] == expected_values
     
-    def test_detect_insufficient_data(self):
-        """데이터 부족 테스트"""
-        detector = SpikeDetector()
-        df = pd.DataFrame({
-            "value": [1.0, 1.1]  # 최소 3개 필요
-        })
+    def test_detect_empty_dataframe(self, detector):
+        """빈 데이터프레임 테스트 (운영 입력과 같은 float64 열)"""
+        df = pd.DataFrame({"value": pd.Series([], dtype="float64")})
         
         results = detector.detect(df, column="value")
-        assert len(results) == 0
+        assert results == []
     
-    def test_detect_missing_column(self):
+    def test_detect_missing_column(self, detector):
         """존재하지 않는 컬럼 테스트"""
-        detector = SpikeDetector()
         df = pd.DataFrame({"value": [1, 2, 3]})
         
         results = detector.detect(df, column="nonexistent")
         assert len(results) == 0
     
+    @pytest.mark.parametrize("values", [
+        [1.0, 1.1, 1.0, 5.0, 1.1, 0.9, 1.0],
+        [1.0, np.nan, 1.1, 8.0, 1.0, 0.9, np.nan],
+    ])
+    def test_detect_dataframe_matches_ndarray(self, values):
+        """데이터프레임 입력이 같은 값의 NumPy 배열 입력과 같은 결과인지 테스트"""
+        detector = SpikeDetector(threshold=2.0)
+        arr = np.array(values)
+        
+        from_df = detector.detect(pd.DataFrame({"value": arr}), column="value", return_details=True)
+        assert from_df == detector.detect(arr, return_details=True)
+        assert [r["start"] for r in from_df] == [3]
+    
     def test_detect_spikes_list(self):
         """리스트 입력 테스트"""
         detector = SpikeDetector(threshold=2.0)
@@ -0,0 +1,88 @@
+"""
+데이터 저장소 테스트
+"""
+
+import pytest
+import pandas as pd
+from datetime import datetime
+
+from src.utils.storage import DataStorage
+
+pytest.importorskip("pyarrow")
+
+
+@pytest.fixture
+def storage(tmp_path):
+    """임시 디렉토리를 쓰는 저장소"""
+    return DataStorage(base_path=str(tmp_path))
+
+
+class TestDataStorage:
+    """키워드 파티션 데이터셋 저장/로드 테스트 클래스"""
+    
+    @pytest.mark.parametrize("save, load", [
+        ("save_sentiment_data", "load_sentiment_data"),
+        ("save_spikes_data", "load_spikes_data"),
+    ])
+    def test_round_trip(self, storage, save, load):
+        """저장한 행이 키워드 필터와 함께 그대로 로드되는지 테스트"""
+        records = [
+            {"timestamp": "2024-01-15 10:00:00", "keyword": "AI", "value": 1.0},
+            {"timestamp": "2024-01-15 11:00:00", "keyword": "AI", "value": 2.0},
+            {"timestamp": "2024-01-15 10:00:00", "keyword": "경제", "value": 3.0},
+        ]
+        getattr(storage, save)(records)
+        
+        df = getattr(storage, load)()
+        assert len(df) == 3
+        
+        df = getattr(storage, load)(keyword="AI")
+        assert sorted(df["value"].tolist()) == [1.0, 2.0]
+        assert set(df["keyword"]) == {"AI"}
+    
+    def test_numeric_keyword(self, storage):
+        """숫자로만 된 키워드도 문자열 파티션으로 읽히는지 테스트"""
+        # 파티션 디렉토리가 keyword=2024 하나뿐이면 스키마 추론 시 정수가 됨
+        storage.save_sentiment_data([{"timestamp": "2024-01-15 10:00:00", "keyword": "2024", "value": 1.0}])
+        
+        df = storage.load_sentiment_data(keyword="2024")
+        assert df["value"].tolist() == [1.0]
+        assert df["keyword"].tolist() == ["2024"]
+    
+    def test_dedup_keeps_latest(self, storage):
+        """같은 타임스탬프/키워드를 다시 저장하면 나중 행만 남는지 테스트"""
+        storage.save_spikes_data([{"timestamp": "2024-01-15 10:00:00", "keyword": "AI", "value": 1.0}])
+        storage.save_spikes_data([{"timestamp": "2024-01-15 10:00:00", "keyword": "AI", "value": 5.0}])
+        
+        df = storage.load_spikes_data(keyword="AI")
+        assert df["value"].tolist() == [5.0]
+    
+    def test_date_filter(self, storage):
+        """시작/종료 날짜 필터 테스트"""
+        storage.save_sentiment_data([
+            {"timestamp": "2024-01-14 23:00:00", "keyword": "AI", "value": 1.0},
+            {"timestamp": "2024-01-15 10:00:00", "keyword": "AI", "value": 2.0},
+            {"timestamp": "2024-01-16 01:00:00", "keyword": "AI", "value": 3.0},
+        ])
+        
+        df = storage.load_sentiment_data(
+            start_date=datetime(2024, 1, 15),
+            end_date=datetime(2024, 1, 15, 23, 59),
+        )
+        assert df["value"].tolist() == [2.0]
+    
+    def test_legacy_file(self, storage):
+        """이전 버전 단일 Parquet 파일과 데이터셋을 합쳐 로드하고 데이터셋 행을 우선하는지 테스트"""
+        pd.DataFrame([
+            {"timestamp": "2024-01-15 09:00:00", "keyword": "AI", "value": 0.5},
+            {"timestamp": "2024-01-15 10:00:00", "keyword": "AI", "value": 1.0},
+        ]).to_parquet(storage.sentiment_path.with_suffix(".parquet"), index=False)
+        storage.save_sentiment_data([{"timestamp": "2024-01-15 10:00:00", "keyword": "AI", "value": 2.0}])
+        
+        df = storage.load_sentiment_data(keyword="AI").sort_values("timestamp")
+        assert df["value"].tolist() == [0.5, 2.0]
+    
+    def test_load_empty(self, storage):
+        """저장된 데이터가 없으면 빈 데이터프레임 반환 테스트"""
+        assert storage.load_sentiment_data().empty
+        assert storage.load_spikes_data(keyword="AI").empty
@@ -3,77 +3,95 @@
 """
 
 import pytest
-import sys
-from pathlib import Path
 
-project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
+from src.data.text_cleaner import TextCleaner, PARALLEL_MIN_BATCH, _clean_default
 
-from src.data.text_cleaner import TextCleaner
+
+@pytest.fixture(scope="module")
+def cleaner():
+    """모듈 전체에서 공유하는 순차 처리 정제기 (테스트마다 생성하지 않음)"""
+    text_cleaner = TextCleaner(n_jobs=1)
+    yield text_cleaner
+    text_cleaner.close()
 
 
 class TestTextCleaner:
     """텍스트 정제기 테스트 클래스"""
     
-    def test_init(self):
+    def test_init(self, cleaner):
         """초기화 테스트"""
-        cleaner = TextCleaner()
         assert cleaner is not None
     
-    def test_clean_text_basic(self):
+    def test_clean_text_basic(self, cleaner):
         """기본 텍스트 정제 테스트"""
-        cleaner = TextCleaner()
         text = "  Hello   World  "
         cleaned = cleaner.clean_text(text)
         assert cleaned == "Hello World"
     
-    def test_clean_text_html_removal(self):
+    def test_clean_text_html_removal(self, cleaner):
         """HTML 태그 제거 테스트"""
-        cleaner = TextCleaner()
         text = "<p>Hello <b>World</b></p>"
         cleaned = cleaner.clean_text(text, remove_html=True)
         assert "<" not in cleaned
         assert ">" not in cleaned
     
-    def test_clean_text_url_removal(self):
+    def test_clean_text_url_removal(self, cleaner):
         """URL 제거 테스트"""
-        cleaner = TextCleaner()
         text = "Visit https://example.com for more info"
         cleaned = cleaner.clean_text(text, remove_urls=True)
         assert "https://example.com" not in cleaned
     
-    def test_clean_text_emoji_removal(self):
+    def test_clean_text_emoji_removal(self, cleaner):
         """이모지 제거 테스트"""
-        cleaner = TextCleaner()
         text = "Hello 😀 World 🎉"
         cleaned = cleaner.clean_text(text, remove_emoji=True)
         assert "😀" not in cleaned
         assert "🎉" not in cleaned
     
-    def test_clean_text_empty(self):
+    def test_clean_text_emoji_removal_keeps_korean(self, cleaner):
+        """이모지 제거 시 한글/한글 자모는 유지되는지 테스트"""
+        text = "삼성전자 반도체 투자 🚀🇰🇷 ✨ ㅋㅋㅋㅋ"
+        cleaned = cleaner.clean_text(text, remove_emoji=True)
+        assert cleaned == "삼성전자 반도체 투자 ㅋㅋ"
+    
+    def test_clean_text_special_chars(self, cleaner):
+        """특수 문자 정리 테스트 (ASCII 텍스트와 비ASCII 텍스트 경로가 같은 규칙 적용)"""
+        
+        assert cleaner.clean_text("AI #1 (report) - stocks_up: 5% [news]") == "AI 1 report stocks_up 5 news"
+        assert cleaner.clean_text("AI #1 (report) ★ stocks_up: 5% [news]") == "AI 1 report stocks_up 5 news"
+    
+    def test_clean_text_cache(self, cleaner):
+        """기본 옵션 정제 결과 캐시 테스트 (옵션을 바꾸면 캐시를 거치지 않음)"""
+        text = "<p>Cached   text 캐시 테스트</p>"
+        _clean_default.cache_clear()
+        
+        assert cleaner.clean_text(text) == "Cached text 캐시 테스트"
+        assert cleaner.clean_text(text) == "Cached text 캐시 테스트"
+        assert _clean_default.cache_info().hits == 1
+        
+        assert cleaner.clean_text(text, normalize_whitespace=False) == "Cached  text 캐시 테스트"
+        assert _clean_default.cache_info().misses == 1
+    
+    def test_clean_text_empty(self, cleaner):
         """빈 텍스트 테스트"""
-        cleaner = TextCleaner()
         assert cleaner.clean_text("") == ""
         assert cleaner.clean_text(None) == ""
     
-    def test_extract_keywords(self):
+    def test_extract_keywords(self, cleaner):
         """키워드 추출 테스트"""
-        cleaner = TextCleaner()
         text = "AI technology is advancing rapidly. AI and machine learning are important."
         keywords = cleaner.extract_keywords(text, top_k=3)
         
         assert len(keywords) <= 3
         assert "AI" in keywords or "ai" in keywords.lower()
     
-    def test_extract_keywords_empty(self):
+    def test_extract_keywords_empty(self, cleaner):
         """빈 텍스트 키워드 추출 테스트"""
-        cleaner = TextCleaner()
         keywords = cleaner.extract_keywords("")
         assert len(keywords) == 0
     
-    def test_is_korean_dominant(self):
+    def test_is_korean_dominant(self, cleaner):
         """한국어 우세 판단 테스트"""
-        cleaner = TextCleaner()
         
         korean_text = "안녕하세요 반갑습니다"
         assert cleaner.is_korean_dominant(korean_text) is True
@@ -81,12 +99,33 @@ class TestTextCleaner:
         english_text = "Hello World"
         assert cleaner.is_korean_dominant(english_text) is False
     
-    def test_clean_batch(self):
+    def test_clean_batch(self, cleaner):
         """배치 정제 테스트"""
-        cleaner = TextCleaner()
         texts = ["  Text 1  ", "  Text 2  ", "  Text 3  "]
         cleaned = cleaner.clean_batch(texts)
         
         assert len(cleaned) == 3
         assert all("  " not in text for text in cleaned)
-
+    
+    def test_default_sequential(self):
+        """기본값은 순차 처리 (프로세스 풀을 만들지 않음)"""
+        cleaner = TextCleaner()
+        texts = [f"  Text {i}  " for i in range(PARALLEL_MIN_BATCH * 2)]
+        
+        assert cleaner.n_jobs == 1
+        assert cleaner.clean_batch(texts)[0] == "Text 0"
+        assert cleaner._executor is None
+    
+    def test_clean_batch_parallel(self):
+        """큰 배치 병렬 정제 테스트 (순차 처리와 같은 결과, 입력 순서 유지, 중복 텍스트 포함)"""
+        cleaner = TextCleaner(n_jobs=2)
+        texts = [f"<b>News {i}</b>  Wooooow 😀 https://example.com/{i}" for i in range(PARALLEL_MIN_BATCH * 2)]
+        texts[1] = None
+        texts[-1] = texts[-3] = texts[5]
+        try:
+            cleaned = cleaner.clean_batch(texts)
+        finally:
+            cleaner.close()
+        
+        assert cleaned == [cleaner.clean_text(text) for text in texts]
+        assert cleaned[5] == "News 5 Woow"
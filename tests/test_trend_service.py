@@ -3,54 +3,49 @@
 """
 
 import pytest
-from unittest.mock import patch, MagicMock
-import sys
-from pathlib import Path
-
-project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
+from types import SimpleNamespace
+from unittest.mock import MagicMock
 
 from src.services.trend_service import TrendService
 
 
+@pytest.fixture(autouse=True)
+def mocks(monkeypatch):
+    """수집기/감정 분석기 생성자를 mock 인스턴스를 돌려주는 함수로 교체 (수집 결과 기본값은 빈 리스트)"""
+    rss = MagicMock()
+    rss.collect.return_value = []
+    google = MagicMock()
+    google.collect.return_value = []
+    sentiment = MagicMock()
+    
+    monkeypatch.setattr("src.services.trend_service.RSSCollector", lambda *args, **kwargs: rss)
+    monkeypatch.setattr("src.services.trend_service.GoogleNewsCollector", lambda *args, **kwargs: google)
+    monkeypatch.setattr("src.services.trend_service.SentimentAnalyzer", lambda *args, **kwargs: sentiment)
+    return SimpleNamespace(rss=rss, google=google, sentiment=sentiment)
+
+
 class TestTrendService:
     """트렌드 분석 서비스 테스트 클래스"""
     
-    @patch('src.services.trend_service.RSSCollector')
-    @patch('src.services.trend_service.GoogleNewsCollector')
-    @patch('src.services.trend_service.SentimentAnalyzer')
-    def test_init(self, mock_sentiment, mock_google, mock_rss):
+    def test_init(self, mocks):
         """초기화 테스트"""
         service = TrendService()
         assert service is not None
+        assert service.rss_collector is mocks.rss
+        assert service.sentiment_analyzer is mocks.sentiment
     
-    @patch('src.services.trend_service.RSSCollector')
-    @patch('src.services.trend_service.GoogleNewsCollector')
-    @patch('src.services.trend_service.SentimentAnalyzer')
-    def test_analyze_trend_empty_keyword(self, mock_sentiment, mock_google, mock_rss):
+    def test_analyze_trend_empty_keyword(self):
         """빈 키워드 분석 테스트"""
-        # Mock 설정
-        mock_rss_instance = MagicMock()
-        mock_rss_instance.collect.return_value = []
-        mock_rss.return_value = mock_rss_instance
-        
-        mock_google_instance = MagicMock()
-        mock_google_instance.collect.return_value = []
-        mock_google.return_value = mock_google_instance
-        
         service = TrendService()
         result = service.analyze_trend(keyword="", max_results=10)
         
         assert result["total_news"] == 0
         assert result["keyword"] == ""
     
-    @patch('src.services.trend_service.RSSCollector')
-    @patch('src.services.trend_service.GoogleNewsCollector')
-    @patch('src.services.trend_service.SentimentAnalyzer')
-    def test_analyze_trend_with_data(self, mock_sentiment, mock_google, mock_rss):
+    def test_analyze_trend_with_data(self, mocks):
         """데이터 포함 분석 테스트"""
         # Mock 뉴스 데이터
-        mock_news = [
+        mocks.rss.collect.return_value = [
             {
                 "title": "Test News",
                 "link": "https://example.com/1",
@@ -59,24 +54,12 @@ class TestTrendService:
                 "source": "Test Source"
             }
         ]
-        
-        # Mock 설정
-        mock_rss_instance = MagicMock()
-        mock_rss_instance.collect.return_value = mock_news
-        mock_rss.return_value = mock_rss_instance
-        
-        mock_google_instance = MagicMock()
-        mock_google_instance.collect.return_value = []
-        mock_google.return_value = mock_google_instance
-        
-        mock_sentiment_instance = MagicMock()
-        mock_sentiment_instance.analyze.return_value = {
+        mocks.sentiment.analyze_batch.return_value = [{
             "positive": 0.7,
             "negative": 0.3,
             "neutral": 0.0,
             "confidence": 0.8
-        }
-        mock_sentiment.return_value = mock_sentiment_instance
+        }]
         
         service = TrendService()
         result = service.analyze_trend(keyword="Test", max_results=10)
@@ -95,4 +78,3 @@ class TestTrendService:
         assert result["total_news"] == 0
         assert result["avg_sentiment"] == 0.5
         assert len(result["time_series"]) == 0
-
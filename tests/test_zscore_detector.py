@@ -5,15 +5,16 @@ Z-score 이상치 감지기 테스트
 import pytest
 import pandas as pd
 import numpy as np
-import sys
-from pathlib import Path
-
-project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
 
 from src.anomaly.zscore_detector import ZScoreDetector
 
 
+@pytest.fixture(scope="module")
+def detector():
+    """모듈 전체에서 공유하는 감지기 (detect는 누적 상태를 쓰지 않음)"""
+    return ZScoreDetector(threshold=2.0)
+
+
 class TestZScoreDetector:
     """Z-score 감지기 테스트 클래스"""
     
@@ -22,38 +23,29 @@ class TestZScoreDetector:
         detector = ZScoreDetector(threshold=2.0)
         assert detector.threshold == 2.0
     
-    def test_detect_normal_data(self):
-        """정상 데이터 테스트"""
-        detector = ZScoreDetector(threshold=2.0)
-        df = pd.DataFrame({
-            "value": [1.0, 1.1, 1.0, 1.2, 1.1]
-        })
+    @pytest.mark.parametrize("values, expected_values", [
+        ([1.0, 1.1, 1.0, 1.2, 1.1], []),  # 정상 데이터
+        ([1.0] * 20 + [10.0] + [1.0] * 20, [10.0]),  # 10.0이 이상치 (표본 5개로는 |z|가 2를 넘을 수 없음)
+        ([], []),  # 빈 배열
+        ([1.0, np.nan, 1.1, 1.2, np.nan], []),  # NaN 포함
+    ])
+    def test_detect(self, detector, values, expected_values):
+        """배열 입력 이상치 감지 테스트 (정상/이상치/빈 배열/NaN 포함)"""
+        results = detector.detect(np.array(values))
         
-        results = detector.detect(df, column="value")
         assert isinstance(results, list)
+        assert bool(results) == bool(expected_values)
+        assert set(expected_values) <= {r["value"] for r in results}
     
-    def test_detect_with_anomaly(self):
-        """이상치 포함 데이터 테스트"""
-        detector = ZScoreDetector(threshold=2.0)
-        df = pd.DataFrame({
-            "value": [1.0, 1.1, 1.0, 10.0, 1.1]  # 10.0이 이상치
-        })
-        
-        results = detector.detect(df, column="value")
-        assert len(results) > 0
-        assert any(r["value"] == 10.0 for r in results)
-    
-    def test_detect_empty_dataframe(self):
-        """빈 데이터프레임 테스트"""
-        detector = ZScoreDetector()
-        df = pd.DataFrame({"value": []})
+    def test_detect_empty_dataframe(self, detector):
+        """빈 데이터프레임 테스트 (운영 입력과 같은 float64 열)"""
+        df = pd.DataFrame({"value": pd.Series([], dtype="float64")})
         
         results = detector.detect(df, column="value")
-        assert len(results) == 0
+        assert results == []
     
-    def test_detect_missing_column(self):
+    def test_detect_missing_column(self, detector):
         """존재하지 않는 컬럼 테스트"""
-        detector = ZScoreDetector()
         df = pd.DataFrame({"value": [1, 2, 3]})
         
         results = detector.detect(df, column="nonexistent")
@@ -62,19 +54,81 @@ class TestZScoreDetector:
     def test_detect_with_nan(self):
         """NaN 값 포함 데이터 테스트"""
         detector = ZScoreDetector()
-        df = pd.DataFrame({
-            "value": [1.0, np.nan, 1.1, 1.2, np.nan]
-        })
+        values = np.array([1.0, np.nan, 1.1, 1.2, np.nan])
         
-        results = detector.detect(df, column="value")
+        results = detector.detect(values)
         assert isinstance(results, list)
     
+    def test_detect_ndarray(self):
+        """NumPy 배열 입력 테스트 (데이터프레임 입력과 같은 결과)"""
+        detector = ZScoreDetector(threshold=1.5)
+        values = np.array([1.0, np.nan, 1.1, 1.0, 10.0, 1.1])
+        
+        from_array = detector.detect(values, return_details=True)
+        from_df = detector.detect(pd.DataFrame({"value": values}), column="value", return_details=True)
+        assert from_array == from_df
+        assert [r["start"] for r in from_array] == [4]
+    
     def test_detect_anomalies_list(self):
         """리스트 입력 테스트"""
         detector = ZScoreDetector(threshold=2.0)
-        values = [1.0, 1.1, 1.0, 10.0, 1.1]
+        values = [1.0, 1.1] * 10 + [10.0] + [1.1, 1.0] * 10
         
         indices = detector.detect_anomalies(values, return_indices=True)
         assert isinstance(indices, list)
         assert len(indices) > 0
 
+    
+    def test_detect_anomalies_outlier_and_constant(self):
+        """리스트 입력 이상치 인덱스 및 상수 배열 테스트"""
+        detector = ZScoreDetector(threshold=2.0)
+        values = [1.0] * 20 + [10.0] + [1.0] * 20
+        
+        assert detector.detect_anomalies(values, return_indices=True) == [20]
+        assert detector.detect_anomalies(values, return_indices=False) == [10.0]
+        assert detector.detect_anomalies([1.0] * 10) == []
+    
+    def test_update_streaming(self):
+        """스트리밍 감지 테스트 (이전까지의 통계로 새 값만 판정)"""
+        detector = ZScoreDetector(threshold=2.0)
+        
+        # 첫 배치는 기준 통계가 없으므로 이상치 없음
+        assert detector.update([1.0, 1.2, 0.8, 1.1, 0.9]) == []
+        
+        results = detector.update([1.0, 5.0])
+        assert len(results) == 1
+        assert results[0]["start"] == 6
+        assert results[0]["value"] == 5.0
+        
+        detector.reset()
+        assert detector.update([5.0]) == []
+    
+    def test_update_large_magnitude_stats(self):
+        """큰 값에서도 누적 통계가 일괄 계산과 일치하는지 테스트 (합계/제곱합 상쇄 오차 방지)"""
+        detector = ZScoreDetector(threshold=2.0)
+        rng = np.random.default_rng(0)
+        values = 1e9 + rng.normal(0, 1, 300)
+        
+        for chunk in np.array_split(values, 7):
+            detector.update(chunk.tolist())
+        
+        _, _, mean, std = detector._bounds
+        assert mean == pytest.approx(np.mean(values))
+        assert std == pytest.approx(np.std(values), rel=1e-6)
+    
+    def test_detect_batch_matches_per_column(self):
+        """2차원 배치 감지 결과가 열별 detect_anomalies와 같은지 테스트"""
+        detector = ZScoreDetector(threshold=2.0)
+        rng = np.random.default_rng(0)
+        matrix = rng.poisson(3, (30, 4)).astype(float)
+        matrix[10, 1] = 40.0
+        matrix[5, 2] = np.nan
+        matrix[:, 3] = 1.0  # 상수 열
+        
+        mask = detector.detect_batch(matrix)
+        
+        assert mask.shape == matrix.shape
+        assert mask[10, 1]
+        assert not mask[:, 3].any()
+        for col in range(matrix.shape[1]):
+            assert np.flatnonzero(mask[:, col]).tolist() == detector.detect_anomalies(matrix[:, col].tolist())